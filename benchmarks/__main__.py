@@ -0,0 +1,103 @@
+"""
+벤치마크 실행 엔트리포인트 (CLI)
+===============================
+사용법:
+    # 전체 측정 후 JSON 저장
+    python -m benchmarks run --output results.json
+
+    # 기준선 저장
+    python -m benchmarks run --output benchmarks/baselines/<machine>.json
+
+    # 기준선 대비 회귀 검사 (threshold 초과 또는 기준선 케이스 누락 시 종료 코드 1)
+    python -m benchmarks compare benchmarks/baselines/<machine>.json results.json --threshold 0.10
+"""
+
+import argparse
+import sys
+
+from myiweb.utils import Colors, log_error, log_success, log_warning
+
+from . import bench_crypto, bench_parse, bench_payload
+from .harness import compare, format_table, load_results, run_case, save_results
+
+# 스위트 이름 -> 케이스 목록 함수
+SUITES = {
+    'crypto': bench_crypto.cases,
+    'payload': bench_payload.cases,
+    'parse': bench_parse.cases,
+}
+
+
+def cmd_run(args) -> int:
+    results = {}
+    for suite_name, suite in SUITES.items():
+        for name, func in suite().items():
+            if args.filter and args.filter not in name:
+                continue
+            results[name] = run_case(func, min_time=args.min_time)
+            print(format_table({name: results[name]}).splitlines()[-1])
+
+    if args.output:
+        save_results(args.output, results)
+        log_success(f"결과 저장: {args.output}")
+    return 0
+
+
+def cmd_compare(args) -> int:
+    baseline = load_results(args.baseline)
+    current = load_results(args.current)
+    rows = compare(baseline, current, threshold=args.threshold, metric=args.metric)
+
+    print(f"  {'case':<40} {'baseline':>12} {'current':>12} {'change':>9}")
+    regressions = 0
+    missing = []
+    added = []
+    for row in rows:
+        if row['missing'] == 'current':
+            missing.append(row['name'])
+            print(f"  {row['name']:<40} {row['baseline']:>12.1f} {'-':>12} {Colors.RED}{'missing':>9}{Colors.END}")
+            continue
+        if row['missing'] == 'baseline':
+            added.append(row['name'])
+            print(f"  {row['name']:<40} {'-':>12} {row['current']:>12.1f} {Colors.YELLOW}{'new':>9}{Colors.END}")
+            continue
+        color = Colors.RED if row['regression'] else Colors.GREEN
+        print(f"  {row['name']:<40} {row['baseline']:>12.1f} {row['current']:>12.1f} "
+              f"{color}{row['change']:>+8.1%}{Colors.END}")
+        regressions += row['regression']
+
+    if added:
+        log_warning(f"기준선에 없는 케이스 {len(added)}건: {', '.join(added)} (기준선을 다시 저장하세요)")
+    if missing:
+        log_error(f"현재 결과에 없는 기준선 케이스 {len(missing)}건: {', '.join(missing)}")
+    if regressions:
+        log_error(f"성능 회귀 {regressions}건 ({args.metric} {args.threshold:.0%} 초과 증가)")
+    if missing or regressions:
+        return 1
+    log_success("성능 회귀 없음")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description="myiweb 마이크로벤치마크")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help="벤치마크 실행")
+    run.add_argument('--output', '-o', help="결과 JSON 저장 경로")
+    run.add_argument('--filter', '-k', help="이름에 이 문자열이 포함된 케이스만 실행")
+    run.add_argument('--min-time', type=float, default=1.0, help="케이스당 최소 측정 시간(초)")
+    run.set_defaults(func=cmd_run)
+
+    cmp = sub.add_parser('compare', help="기준선 대비 회귀 검사")
+    cmp.add_argument('baseline', help="기준선 결과 JSON")
+    cmp.add_argument('current', help="현재 결과 JSON")
+    cmp.add_argument('--threshold', type=float, default=0.10, help="회귀 판단 기준 (기본 0.10 = 10%%)")
+    cmp.add_argument('--metric', default='mean_us', choices=['mean_us', 'p50_us', 'p99_us'])
+    cmp.set_defaults(func=cmd_compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
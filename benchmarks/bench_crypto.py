@@ -0,0 +1,51 @@
+"""
+암호화 마이크로벤치마크 케이스
+============================
+generate_session_key, encrypt_with_rsa(cold/warm), encrypt_with_aes(비밀번호 길이별),
+MJUSSOLogin._prepare_login_body 전체 과정을 측정합니다.
+"""
+
+from typing import Callable, Dict
+
+from myiweb.crypto import (
+    encrypt_with_aes,
+    encrypt_with_rsa,
+    generate_session_key,
+    invalidate_public_key_cache,
+)
+from myiweb.crypto_backends import _CALIBRATION_PUBLIC_KEY as PUBLIC_KEY
+from myiweb.sso import MJUSSOLogin
+
+PASSWORD_LENGTHS = (8, 16, 32, 64)
+
+
+def _rsa_cold() -> None:
+    invalidate_public_key_cache(PUBLIC_KEY)
+    encrypt_with_rsa("keyStr-placeholder,1700000000000", PUBLIC_KEY)
+
+
+def _rsa_warm() -> None:
+    encrypt_with_rsa("keyStr-placeholder,1700000000000", PUBLIC_KEY)
+
+
+def _make_prepare_login_body() -> Callable[[], object]:
+    sso = MJUSSOLogin('60000000', 'benchmark-password', verbose=False)
+    sso.public_key = PUBLIC_KEY
+    sso.csrf_token = 'benchmark-csrf-token'
+    return sso._prepare_login_body
+
+
+def cases() -> Dict[str, Callable[[], object]]:
+    """케이스 이름 -> 인자 없는 측정 함수"""
+    key_info = generate_session_key(32)
+    result: Dict[str, Callable[[], object]] = {
+        'crypto.generate_session_key': lambda: generate_session_key(32),
+        'crypto.encrypt_with_rsa[cold]': _rsa_cold,
+        'crypto.encrypt_with_rsa[warm]': _rsa_warm,
+    }
+    for length in PASSWORD_LENGTHS:
+        password = 'p' * length
+        result[f'crypto.encrypt_with_aes[pw={length}]'] = (
+            lambda password=password: encrypt_with_aes(password, key_info))
+    result['sso.prepare_login_body'] = _make_prepare_login_body()
+    return result
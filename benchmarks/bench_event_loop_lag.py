@@ -0,0 +1,90 @@
+"""
+이벤트 루프 지연(lag) 벤치마크
+=============================
+여러 로그인의 암호화 단계를 동시에 실행하면서, 1ms 주기 타이머가 얼마나 늦게
+깨어나는지(이벤트 루프 지연)를 측정합니다.
+
+- inline: async 핸들러 안에서 crypto 함수를 직접 호출 (현재 README 예제와 같은 방식)
+- thread / process: AsyncCrypto로 executor에 위임
+
+사용법:
+    python -m benchmarks.bench_event_loop_lag [--logins 200] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+from myiweb.aio_crypto import AsyncCrypto, _build_login_body
+from myiweb.crypto_backends import _CALIBRATION_PUBLIC_KEY as PUBLIC_KEY
+from myiweb.utils import Colors
+
+from .harness import percentile
+
+TICK = 0.001
+
+
+async def _monitor(lags: List[float], stop: asyncio.Event) -> None:
+    """TICK 간격으로 잠들었다 깨어나며 예정보다 늦은 시간을 기록합니다."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def _run(mode: str, logins: int, concurrency: int) -> dict:
+    crypto = AsyncCrypto(kind=mode) if mode != 'inline' else None
+    if crypto:
+        await crypto.start()
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_login(i: int) -> None:
+        async with semaphore:
+            if crypto:
+                await crypto.build_login_body(f'6000{i:04d}', 'benchmark-password', PUBLIC_KEY, 'csrf')
+            else:
+                _build_login_body(f'6000{i:04d}', 'benchmark-password', PUBLIC_KEY, 'csrf')
+            # 네트워크 왕복 자리 (다른 코루틴에게 양보)
+            await asyncio.sleep(0)
+
+    lags: List[float] = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_monitor(lags, stop))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_login(i) for i in range(logins)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await monitor
+    if crypto:
+        await crypto.close()
+
+    lags.sort()
+    return {
+        'logins_per_sec': logins / elapsed,
+        'lag_p50_ms': percentile(lags, 50) * 1000,
+        'lag_p99_ms': percentile(lags, 99) * 1000,
+        'lag_max_ms': (lags[-1] if lags else 0.0) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 암호화 중 이벤트 루프 지연 측정")
+    parser.add_argument('--logins', type=int, default=200, help="총 로그인 암호화 횟수")
+    parser.add_argument('--concurrency', type=int, default=50, help="동시 실행 로그인 수")
+    parser.add_argument('--modes', default='inline,thread,process', help="측정할 방식 (쉼표 구분)")
+    args = parser.parse_args()
+
+    print(f"{Colors.BOLD}이벤트 루프 지연 ({args.logins} logins, concurrency={args.concurrency}){Colors.END}")
+    print(f"  {'mode':<8} {'logins/s':>10} {'lag p50(ms)':>12} {'lag p99(ms)':>12} {'lag max(ms)':>12}")
+    for mode in args.modes.split(','):
+        r = asyncio.run(_run(mode, args.logins, args.concurrency))
+        print(f"  {mode:<8} {r['logins_per_sec']:>10.1f} {r['lag_p50_ms']:>12.2f} "
+              f"{r['lag_p99_ms']:>12.2f} {r['lag_max_ms']:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
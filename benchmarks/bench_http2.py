@@ -0,0 +1,288 @@
+"""
+HTTP/2 전송 계층 벤치마크
+========================
+로컬 TLS 서버 두 개(SSO/MSI 대역)에 동시 사용자 여러 명이 로그인과 같은 순서의 요청
+(로그인 페이지 GET → 자격 증명 POST → JS 폼 POST → location.href GET → 조회 POST)을 보낼 때,
+기존 requests 경로(SharedTransport, HTTP/1.1 keep-alive 풀)와 HTTP2Transport를 비교합니다.
+
+서버는 ALPN으로 h2/http/1.1을 모두 제공하고, 요청마다 --server-ms만큼 처리 시간을 둔 뒤
+응답합니다. (HTTP/2 연결에서는 스트림별로 동시에 처리) 루프백에서는 TCP/TLS 핸드셰이크의
+왕복 지연이 없으므로, 새 연결마다 --connect-ms만큼 지연을 두어 실제 네트워크를 흉내 냅니다.
+서버는 클라이언트와 GIL을 나눠 쓰지 않도록 별도 프로세스에서 실행합니다.
+
+측정 항목:
+- conns: 서버가 받은 TLS 연결 수 (= TLS 핸드셰이크 수)
+- p50/p99: 로그인 1회(요청 5개)의 소요 시간
+- wall: 전체 로그인을 마치는 데 걸린 시간
+
+사용법:
+    python -m benchmarks.bench_http2 [--users 32] [--logins 256] [--server-ms 20] [--connect-ms 30]
+
+httpx와 h2가 필요합니다: pip install 'mju-sso-login[http2]'
+"""
+
+import argparse
+import datetime
+import ipaddress
+import multiprocessing
+import os
+import socket
+import ssl
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import h2.config
+import h2.connection
+import h2.events
+import requests
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from myiweb.http2 import HTTP2Transport
+from myiweb.transport import SharedTransport
+from myiweb.utils import Colors
+
+from .bench_parse import build_pages
+
+BODY = build_pages()['sso'].encode('utf-8')
+
+
+def make_certificate(directory: str) -> tuple:
+    """127.0.0.1 / localhost용 자체 서명 인증서를 만들어 (cert 경로, key 경로)를 반환"""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'localhost')])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name).issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([
+            x509.DNSName('localhost'), x509.IPAddress(ipaddress.ip_address('127.0.0.1')),
+        ]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, 'cert.pem')
+    key_path = os.path.join(directory, 'key.pem')
+    with open(cert_path, 'wb') as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, 'wb') as f:
+        f.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                  serialization.NoEncryption()))
+    return cert_path, key_path
+
+
+class StandInTLSServer:
+    """ALPN으로 h2 / http/1.1을 제공하는 최소 TLS 서버 (모든 요청에 같은 본문으로 응답)"""
+
+    def __init__(self, cert_path: str, key_path: str, server_seconds: float, connect_seconds: float = 0.0,
+                 alpn=('h2', 'http/1.1')):
+        self.server_seconds = server_seconds
+        self.connect_seconds = connect_seconds
+        self.connections = {'h2': 0, 'http/1.1': 0}
+        self._lock = threading.Lock()
+        self._context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        self._context.load_cert_chain(cert_path, key_path)
+        self._context.set_alpn_protocols(list(alpn))
+        self._sock = socket.create_server(('127.0.0.1', 0), backlog=256)
+        self.port = self._sock.getsockname()[1]
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def close(self) -> None:
+        self._sock.close()
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                sock, _ = self._sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(sock,), daemon=True).start()
+
+    def _handle(self, sock: socket.socket) -> None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # TCP + TLS 핸드셰이크 왕복 지연
+        time.sleep(self.connect_seconds)
+        try:
+            tls = self._context.wrap_socket(sock, server_side=True)
+        except (ssl.SSLError, OSError):
+            sock.close()
+            return
+        protocol = tls.selected_alpn_protocol() or 'http/1.1'
+        with self._lock:
+            self.connections[protocol] += 1
+        try:
+            if protocol == 'h2':
+                self._serve_h2(tls)
+            else:
+                self._serve_http1(tls)
+        except (OSError, ssl.SSLError):
+            pass
+        finally:
+            tls.close()
+
+    def _serve_http1(self, tls: ssl.SSLSocket) -> None:
+        stream = tls.makefile('rb')
+        while True:
+            request_line = stream.readline()
+            if not request_line:
+                return
+            length = 0
+            while True:
+                line = stream.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                if name.strip().lower() == 'content-length':
+                    length = int(value.strip())
+            if length:
+                stream.read(length)
+            time.sleep(self.server_seconds)
+            tls.sendall(b'HTTP/1.1 200 OK\r\nContent-Type: text/html;charset=UTF-8\r\n'
+                        b'Content-Length: ' + str(len(BODY)).encode() + b'\r\n\r\n' + BODY)
+
+    def _serve_h2(self, tls: ssl.SSLSocket) -> None:
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        send_lock = threading.Lock()
+        pending = {}  # stream_id -> 아직 보내지 못한 본문 (흐름 제어 창 대기)
+        tls.sendall(conn.data_to_send())
+
+        def flush(stream_id: int) -> None:
+            # send_lock을 잡은 상태에서 호출 - 흐름 제어 창과 최대 프레임 크기 안에서 보냄
+            body = pending[stream_id]
+            while body:
+                size = min(len(body), conn.local_flow_control_window(stream_id), conn.max_outbound_frame_size)
+                if size <= 0:
+                    break
+                conn.send_data(stream_id, body[:size], end_stream=size == len(body))
+                body = body[size:]
+            if body:
+                pending[stream_id] = body
+            else:
+                del pending[stream_id]
+
+        def respond(stream_id: int) -> None:
+            time.sleep(self.server_seconds)
+            with send_lock:
+                conn.send_headers(stream_id, [(':status', '200'), ('content-type', 'text/html;charset=UTF-8'),
+                                              ('content-length', str(len(BODY)))])
+                pending[stream_id] = BODY
+                flush(stream_id)
+                tls.sendall(conn.data_to_send())
+
+        while True:
+            data = tls.recv(65536)
+            if not data:
+                return
+            with send_lock:
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.DataReceived):
+                        conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                    elif isinstance(event, h2.events.StreamEnded):
+                        threading.Thread(target=respond, args=(event.stream_id,), daemon=True).start()
+                    elif isinstance(event, h2.events.WindowUpdated):
+                        for stream_id in list(pending):
+                            flush(stream_id)
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+                tls.sendall(conn.data_to_send())
+
+
+def login_like(transport, cert_path: str, sso_url: str, msi_url: str) -> float:
+    """로그인 1회와 같은 순서의 요청 5개를 새 Session으로 보내고 소요 시간(초)을 반환"""
+    session = requests.Session()
+    session.verify = cert_path
+    # REQUESTS_CA_BUNDLE 등 환경 변수가 session.verify를 덮어쓰지 않도록
+    session.trust_env = False
+    transport.mount(session)
+    transport.record_login()
+    started = time.perf_counter()
+    session.get(f'{sso_url}/sso/auth', timeout=10).raise_for_status()
+    session.post(f'{sso_url}/sso/auth', data={'user_id': '60000000', 'pw_enc': 'x' * 64}, timeout=10)
+    session.post(f'{msi_url}/servlet/login_security', data={'code': 'abc'}, timeout=10)
+    session.get(f'{msi_url}/index_Myiweb.jsp', timeout=10)
+    session.post(f'{msi_url}/servlet/su/sum/Sum00Svl01getStdCard', data={'_csrf': 'x'}, timeout=10)
+    return time.perf_counter() - started
+
+
+def _serve(pipe, cert_path: str, key_path: str, server_seconds: float, connect_seconds: float, alpn) -> None:
+    """서버 프로세스: SSO/MSI 대역 서버 2개를 띄워 포트를 보내고, 종료 요청 시 연결 수를 보냄"""
+    servers = [StandInTLSServer(cert_path, key_path, server_seconds, connect_seconds, alpn) for _ in range(2)]
+    pipe.send([server.port for server in servers])
+    pipe.recv()
+    for server in servers:
+        server.close()
+    pipe.send({
+        'conns': sum(sum(server.connections.values()) for server in servers),
+        'h2_conns': sum(server.connections['h2'] for server in servers),
+    })
+
+
+def measure(transport, cert_path: str, key_path: str, alpn, args) -> dict:
+    pipe, child_pipe = multiprocessing.Pipe()
+    server = multiprocessing.Process(
+        target=_serve, daemon=True,
+        args=(child_pipe, cert_path, key_path, args.server_ms / 1000, args.connect_ms / 1000, alpn),
+    )
+    server.start()
+    sso_url, msi_url = (f'https://127.0.0.1:{port}' for port in pipe.recv())
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.users) as executor:
+            samples = list(executor.map(lambda _: login_like(transport, cert_path, sso_url, msi_url),
+                                        range(args.logins)))
+        wall = time.perf_counter() - started
+    finally:
+        transport.close()
+        pipe.send('stop')
+        connections = pipe.recv()
+        server.join()
+
+    samples.sort()
+    return {
+        **connections,
+        'p50_ms': statistics.median(samples) * 1000,
+        'p99_ms': samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000,
+        'wall_s': wall,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP/1.1 연결 풀 vs HTTP/2 다중화 비교")
+    parser.add_argument('--users', type=int, default=32, help="동시 사용자 수")
+    parser.add_argument('--logins', type=int, default=256, help="전체 로그인 횟수")
+    parser.add_argument('--server-ms', type=float, default=20.0, help="요청당 서버 처리 시간 (ms)")
+    parser.add_argument('--connect-ms', type=float, default=30.0, help="새 연결의 핸드셰이크 지연 (ms)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path, key_path = make_certificate(directory)
+        both, http1_only = ('h2', 'http/1.1'), ('http/1.1',)
+        cases = (
+            ('requests (HTTP/1.1 pool)', both, lambda: SharedTransport(pool_maxsize=args.users)),
+            ('HTTP2Transport', both, lambda: HTTP2Transport(verify=cert_path)),
+            # 서버가 HTTP/2를 지원하지 않는 경우의 폴백 (호스트 2개 x 동시 사용자 수만큼 연결 허용)
+            ('HTTP2Transport, h1 server', http1_only,
+             lambda: HTTP2Transport(max_connections=args.users * 2, verify=cert_path)),
+        )
+
+        print(f"{Colors.BOLD}로그인 {args.logins}회, 동시 사용자 {args.users}명, "
+              f"서버 처리 {args.server_ms:.0f}ms/요청, 핸드셰이크 {args.connect_ms:.0f}ms{Colors.END}")
+        print(f"  {'transport':<28} {'conns':>6} {'h2':>5} {'p50(ms)':>9} {'p99(ms)':>9} {'wall(s)':>8}")
+        for name, alpn, factory in cases:
+            result = measure(factory(), cert_path, key_path, alpn, args)
+            print(f"  {name:<28} {result['conns']:>6} {result['h2_conns']:>5} {result['p50_ms']:>9.1f} "
+                  f"{result['p99_ms']:>9.1f} {result['wall_s']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
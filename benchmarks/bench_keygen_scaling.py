@@ -0,0 +1,51 @@
+"""
+세션키 일괄 생성 확장성 벤치마크
+===============================
+generate_session_keys()의 작업자 수(1 ~ 전체 코어)별 keys/sec를 측정합니다.
+
+사용법:
+    python -m benchmarks.bench_keygen_scaling [--keys 2000] [--processes]
+"""
+
+import argparse
+import os
+import time
+
+from myiweb.crypto import generate_session_keys
+from myiweb.utils import Colors
+
+
+def measure(n: int, workers: int, use_processes: bool) -> float:
+    """n개의 키를 생성하는 데 걸린 시간을 기준으로 keys/sec를 반환합니다."""
+    start = time.perf_counter()
+    keys = generate_session_keys(n, workers=workers, use_processes=use_processes)
+    elapsed = time.perf_counter() - start
+    assert len(keys) == n
+    return n / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="generate_session_keys 확장성 측정")
+    parser.add_argument('--keys', type=int, default=2000, help="측정당 생성할 키 개수")
+    parser.add_argument('--processes', action='store_true', help="스레드 대신 프로세스 풀 사용")
+    args = parser.parse_args()
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, 16, 32, cpu_count} & set(range(1, cpu_count + 1)))
+    mode = 'process' if args.processes else 'thread'
+
+    print(f"{Colors.BOLD}generate_session_keys 확장성 ({mode} pool, {args.keys} keys, {cpu_count} cores){Colors.END}")
+    print(f"  {'workers':>8}  {'keys/sec':>12}  {'speedup':>8}")
+
+    # 워밍업 (백엔드 초기화, 프로세스 풀 기동 비용 제외)
+    generate_session_keys(min(args.keys, 64), workers=1)
+
+    baseline = None
+    for workers in worker_counts:
+        rate = measure(args.keys, workers, args.processes)
+        baseline = baseline or rate
+        print(f"  {workers:>8}  {rate:>12.1f}  {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
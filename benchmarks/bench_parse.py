@@ -0,0 +1,193 @@
+"""
+로그인 페이지 파싱 벤치마크
+=========================
+기존 방식(속성 순서별 re.search 최대 6회 + 실패 시 BeautifulSoup 재파싱)과
+parsing.parse_login_page(단일 패스 스캐너)를 비교합니다.
+
+측정용 페이지는 저장된 MSI 페이지(test/debug_page.html)에 문서(doc/mju_sso_login.md)의
+실제 로그인 폼 마크업을 끼워 넣어 만듭니다. 실제 SSO 페이지처럼 public-key 입력은
+value가 id보다 앞에 있습니다.
+
+login_result 케이스는 로그인 최종 응답(저장된 MSI 페이지) 판정을 기존 방식(정규식 3회 +
+부분 문자열 검사 + text.lower() 사본)과 classify_login_result(필요한 검사만 수행)로 비교합니다.
+
+login_hops 케이스는 로그인 POST 이후 응답들에서 다음 이동을 찾는 비용을
+일반 탐지와 HopModel의 확정 경로로 비교합니다.
+
+parsing 모듈의 함수에는 실제 응답 본문(response.content)처럼 UTF-8 바이트를 전달합니다.
+기존 방식에는 이미 디코딩된 문자열을 전달하므로 response.text의 디코딩 비용은 비교에 포함되지 않습니다.
+
+사용법:
+    python -m benchmarks run -k parse_login_page
+    python -m benchmarks.bench_parse [--page saved_login.html ...] [--rounds 2000]
+"""
+
+import argparse
+import os
+import re
+import time
+from typing import Callable, Dict, Tuple
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from myiweb.crypto_backends import _CALIBRATION_PUBLIC_KEY as PUBLIC_KEY
+from myiweb.exceptions import PageParsingError
+from myiweb.hops import HopModel
+from myiweb.parsing import classify_login_result, parse_login_page
+from myiweb.utils import Colors
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAVED_PAGE = os.path.join(ROOT, 'test', 'debug_page.html')
+
+LOGIN_FORM = (
+    '<form id="signin-form" action="https://sso.mju.ac.kr/sso/auth;jsessionid=6AF45DE39AAA42BB85D762A01EEEDD6C'
+    '?response_type=code&client_id=msi&state=1764322070097&tkn_type=normal'
+    '&redirect_uri=https%3A%2F%2Fmsi.mju.ac.kr%2Findex_Myiweb.jsp" method="post">\n'
+    '<input type="text" id="input-userId" name="user_id" placeholder="아이디">\n'
+    '<input type="password" id="input-password" name="pw" placeholder="비밀번호">\n'
+    '<input type="hidden" name="user_id_enc" id="input-userId-enc">\n'
+    '<input type="hidden" name="pw_enc" id="input-password-enc">\n'
+    '<input type="hidden" name="encsymka" id="input-encsymka">\n'
+    f'<input type="hidden" value="{PUBLIC_KEY}" id="public-key">\n'
+    '<input type="hidden" name="c_r_t" value="j7VO77Aehm8aP0Bqh1M8jNvmZn2osVAykPZMkBGXggY" id="c_r_t">\n'
+    '</form>\n'
+)
+
+
+def _legacy_parse_login_page(html: str) -> Tuple[str, str, str]:
+    """변경 전 parse_login_page (비교 기준)"""
+    public_key_match = re.search(r'id=["\"]public-key["\"][^>]*value=["\"]([^"\"]+)["\"]', html)
+    if not public_key_match:
+        public_key_match = re.search(r'value=["\"]([^"\"]+)["\"][^>]*id=["\"]public-key["\"]', html)
+
+    csrf_match = re.search(r'id=["\"]c_r_t["\"][^>]*value=["\"]([^"\"]+)["\"]', html)
+    if not csrf_match:
+        csrf_match = re.search(r'value=["\"]([^"\"]+)["\"][^>]*id=["\"]c_r_t["\"]', html)
+
+    form_action_match = re.search(r'<form[^>]*id=["\"]signin-form["\"][^>]*action=["\"]([^"\"]+)["\"]', html)
+    if not form_action_match:
+        form_action_match = re.search(r'<form[^>]*action=["\"]([^"\"]+)["\"][^>]*id=["\"]signin-form["\"]', html)
+
+    if public_key_match and csrf_match and form_action_match:
+        return public_key_match.group(1), csrf_match.group(1), form_action_match.group(1)
+
+    soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer(['input', 'form']))
+    public_key_input = soup.find('input', {'id': 'public-key'})
+    csrf_input = soup.find('input', {'id': 'c_r_t'})
+    form = soup.find('form', {'id': 'signin-form'})
+    if not (public_key_input and csrf_input and form):
+        raise PageParsingError("로그인 페이지 파싱 실패")
+    return public_key_input.get('value'), csrf_input.get('value'), form.get('action')
+
+
+def build_pages() -> Dict[str, str]:
+    """페이지 이름 -> 측정용 HTML"""
+    with open(SAVED_PAGE, encoding='utf-8') as f:
+        saved = f.read()
+    body_end = saved.index('>', saved.index('<body')) + 1
+    head, body = saved[:body_end], saved[body_end:]
+    return {
+        # 본문 앞쪽에 로그인 폼이 있는 실제 SSO 페이지 형태
+        'sso': head + LOGIN_FORM + body,
+        # 작은따옴표 속성 - 기존 정규식은 실패하고 BeautifulSoup으로 폴백
+        'sso_single_quote': head + LOGIN_FORM.replace('"', "'") + body,
+    }
+
+
+# 로그인 POST 이후 MSI 이동 과정의 응답 (JS 폼 자동 제출 → location.href → 대상 페이지)
+HOP_FORM_PAGE = (
+    '<html><body onLoad="doLogin()"><form action="/servlet/login_security" method="post">'
+    '<input type="hidden" name="code" value="9a8b7c6d5e4f"/><input type="hidden" name="_csrf" value="x"/>'
+    '</form><script>function doLogin(){document.forms[0].submit();}</script></body></html>'
+)
+HOP_REDIRECT_PAGE = "<script>location.href='https://msi.mju.ac.kr/index_Myiweb.jsp';</script>"
+
+
+def _make_hop_walk(learned: bool) -> Callable[[], object]:
+    """세 응답에 대해 다음 이동을 찾는 과정 (학습 전 일반 탐지 / 확정 경로)"""
+    with open(SAVED_PAGE, encoding='utf-8') as f:
+        target_page = f.read()
+    pages = (
+        (HOP_FORM_PAGE.encode('utf-8'), 'https://msi.mju.ac.kr/index_Myiweb.jsp?code=9a8b7c6d5e4f'),
+        (HOP_REDIRECT_PAGE.encode('utf-8'), 'https://msi.mju.ac.kr/servlet/login_security'),
+        (target_page.encode('utf-8'), 'https://msi.mju.ac.kr/index_Myiweb.jsp'),
+    )
+    model = HopModel('msi')
+    hops = [model.next_hop(i, body, url, None)[0] for i, (body, url) in enumerate(pages)]
+    model.observe([hop for hop in hops if hop])
+    model.observe([hop for hop in hops if hop])
+    plan = model.plan if learned else None
+
+    def walk():
+        for i, (body, url) in enumerate(pages):
+            if model.next_hop(i, body, url, plan)[0] is None:
+                break
+    return walk
+
+
+def _legacy_login_markers(text: str):
+    """변경 전 _check_login_result의 본문 검사 부분 (비교 기준)"""
+    error_msg = None
+    var_error_match = re.search(r'var errorMsg = "([^"]+)"', text)
+    if var_error_match:
+        error_msg = var_error_match.group(1)
+    if not error_msg:
+        alert_match = re.search(r"alert\('(.+?)'\)", text)
+        if not alert_match:
+            alert_match = re.search(r'alert\("(.+?)"\)', text)
+        if alert_match:
+            error_msg = alert_match.group(1)
+    has_signin_form = 'signin-form' in text and 'input-password' in text
+    has_logout_button = '로그아웃' in text or 'logout' in text.lower()
+    return error_msg, has_signin_form, has_logout_button
+
+
+def cases() -> Dict[str, Callable[[], object]]:
+    """케이스 이름 -> 인자 없는 측정 함수"""
+    result = {}
+    for page_name, html in build_pages().items():
+        result[f'parse_login_page[{page_name},legacy]'] = lambda html=html: _legacy_parse_login_page(html)
+        result[f'parse_login_page[{page_name},scan]'] = lambda body=html.encode('utf-8'): parse_login_page(body)
+    with open(SAVED_PAGE, encoding='utf-8') as f:
+        target_page = f.read()
+    result['login_result[legacy]'] = lambda: _legacy_login_markers(target_page)
+    target_body = target_page.encode('utf-8')
+    result['login_result[classify]'] = lambda: classify_login_result(
+        target_body, 'https://msi.mju.ac.kr/index_Myiweb.jsp', 'msi.mju.ac.kr')
+    result['login_hops[detect]'] = _make_hop_walk(learned=False)
+    result['login_hops[learned]'] = _make_hop_walk(learned=True)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 페이지 파싱 비교")
+    parser.add_argument('--page', action='append', default=[], help="저장된 로그인 페이지 HTML 파일 (여러 번 지정 가능)")
+    parser.add_argument('--rounds', type=int, default=2000, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    pages = build_pages()
+    for path in args.page:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            pages[os.path.basename(path)] = f.read()
+
+    print(f"{Colors.BOLD}로그인 페이지 파싱 ({args.rounds} rounds){Colors.END}")
+    print(f"  {'page':<24} {'size(KB)':>9} {'legacy(us)':>11} {'scan(us)':>9} {'speedup':>8}")
+    for name, html in pages.items():
+        body = html.encode('utf-8')
+        if _legacy_parse_login_page(html) != parse_login_page(body):
+            print(f"  {Colors.RED}{name}: 결과가 다릅니다{Colors.END}")
+            continue
+
+        timings = []
+        for func, page in ((_legacy_parse_login_page, html), (parse_login_page, body)):
+            start = time.perf_counter()
+            for _ in range(args.rounds):
+                func(page)
+            timings.append((time.perf_counter() - start) / args.rounds * 1e6)
+
+        print(f"  {name:<24} {len(html) / 1024:>9.1f} {timings[0]:>11.1f} {timings[1]:>9.1f} "
+              f"{timings[0] / timings[1]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+로그인 POST 본문 생성 벤치마크
+=============================
+기존 방식(dict 생성 → requests urlencode)과 LoginPayloadEncoder(단일 패스)를 비교합니다.
+
+`python -m benchmarks run -k login_body`로 속도를, 이 모듈을 직접 실행하여
+로그인 1회당 최대 메모리 할당량(tracemalloc 기준)을 측정합니다.
+
+사용법:
+    python -m benchmarks.bench_payload [--rounds 2000]
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Dict
+
+from requests.models import RequestEncodingMixin
+
+from myiweb.crypto import encrypt_with_aes, encrypt_with_rsa, generate_session_key
+from myiweb.crypto_backends import _CALIBRATION_PUBLIC_KEY as PUBLIC_KEY
+from myiweb.sso import MJUSSOLogin
+from myiweb.utils import Colors
+
+
+def _make_sso() -> MJUSSOLogin:
+    sso = MJUSSOLogin('60000000', 'benchmark-password', verbose=False)
+    sso.public_key = PUBLIC_KEY
+    sso.csrf_token = 'benchmark-csrf-token'
+    # 세션키 생성(PBKDF2)은 두 방식에 공통이므로 고정된 키를 사용하여 차이만 측정
+    key_info = generate_session_key(32)
+    sso._next_session_key = lambda: key_info
+    return sso
+
+
+def _legacy_login_fields(sso: MJUSSOLogin) -> dict:
+    """기존 방식: 암호문을 각각 Base64 문자열로 만든 뒤 dict로 반환 (requests가 다시 urlencode)"""
+    key_info = sso._next_session_key()
+    timestamp = str(int(time.time() * 1000))
+    return {
+        'user_id': sso.user_id,
+        'pw': '',
+        'pw_enc': encrypt_with_aes(sso.user_pw, key_info),
+        'encsymka': encrypt_with_rsa(f"{key_info['keyStr']},{timestamp}", sso.public_key),
+        'c_r_t': sso.csrf_token,
+        'user_id_enc': '',
+    }
+
+
+def cases() -> Dict[str, Callable[[], object]]:
+    """케이스 이름 -> 인자 없는 측정 함수"""
+    sso = _make_sso()
+    return {
+        'sso.login_body[dict+urlencode]': lambda: RequestEncodingMixin._encode_params(_legacy_login_fields(sso)),
+        'sso.login_body[encoder]': sso._prepare_login_body,
+    }
+
+
+def measure_peak_bytes(func: Callable[[], object], rounds: int) -> float:
+    """tracemalloc으로 1회 실행 중 추가로 할당된 최대 메모리(바이트)의 평균을 측정합니다."""
+    func()
+    tracemalloc.start()
+    total = 0
+    for _ in range(rounds):
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        total += peak - current
+    tracemalloc.stop()
+    return total / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 본문 생성 할당량 비교")
+    parser.add_argument('--rounds', type=int, default=200, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    print(f"{Colors.BOLD}로그인 1회당 본문 생성 비용 ({args.rounds} rounds){Colors.END}")
+    print(f"  {'case':<34} {'peak(B)':>10} {'time(us)':>10}")
+    for name, func in cases().items():
+        peak_bytes = measure_peak_bytes(func, args.rounds)
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            func()
+        elapsed_us = (time.perf_counter() - start) / args.rounds * 1e6
+        print(f"  {name:<34} {peak_bytes:>10.0f} {elapsed_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
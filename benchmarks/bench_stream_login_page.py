@@ -0,0 +1,112 @@
+"""
+로그인 페이지 스트리밍 수신 벤치마크
+==================================
+로컬 HTTP 서버가 측정용 로그인 페이지(bench_parse.build_pages)를 대역폭을 제한하여
+보내는 상황에서, 전체 본문을 받은 뒤 파싱하는 기존 방식과
+stream_login_page=True(값을 찾는 즉시 수신 중단)를 비교합니다.
+
+측정 항목:
+- bytes: 실제로 소켓에서 읽은 본문 바이트 수
+- time: GET 시작부터 세 값 추출 완료까지의 시간
+
+사용법:
+    python -m benchmarks.bench_stream_login_page [--rounds 20] [--kbps 2000] [--padding 200]
+"""
+
+import argparse
+import gzip
+import http.server
+import statistics
+import threading
+import time
+
+from myiweb.sso import MJUSSOLogin
+from myiweb.transport import SharedTransport
+from myiweb.utils import Colors
+
+from .bench_parse import build_pages
+
+CHUNK = 4096
+
+
+def _make_handler(body: bytes, gzip_body: bytes, kbps: int):
+    delay = CHUNK / (kbps * 1024 / 8)
+
+    class LoginPageHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            compressed = 'gzip' in self.headers.get('Accept-Encoding', '') and self.path.endswith('gz')
+            payload = gzip_body if compressed else body
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html;charset=UTF-8')
+            self.send_header('Content-Length', str(len(payload)))
+            if compressed:
+                self.send_header('Content-Encoding', 'gzip')
+            self.end_headers()
+            try:
+                for i in range(0, len(payload), CHUNK):
+                    self.wfile.write(payload[i:i + CHUNK])
+                    self.wfile.flush()
+                    time.sleep(delay)
+            except (BrokenPipeError, ConnectionResetError):
+                # 스트리밍 모드가 연결을 먼저 닫은 경우
+                pass
+
+        def log_message(self, *args):
+            pass
+
+    return LoginPageHandler
+
+
+def measure(url: str, stream: bool, rounds: int) -> dict:
+    """rounds회 로그인 페이지를 받아 파싱하고 전송량/소요 시간을 집계합니다."""
+    transport = SharedTransport()
+    samples, read = [], []
+    for _ in range(rounds):
+        sso = MJUSSOLogin('60000000', 'benchmark-password', verbose=False,
+                          transport=transport, stream_login_page=stream)
+        sso._fetch_login_page(url)
+        assert sso.public_key and sso.csrf_token and sso.form_action
+        samples.append(sso.login_page_stats['seconds'])
+        read.append(sso.login_page_stats['bytes_read'])
+    transport.close()
+    return {
+        'bytes': statistics.mean(read),
+        'p50_ms': statistics.median(samples) * 1000,
+        'max_ms': max(samples) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 페이지 스트리밍 수신 비교")
+    parser.add_argument('--rounds', type=int, default=20, help="측정 반복 횟수")
+    parser.add_argument('--kbps', type=int, default=2000, help="서버 송신 대역폭 (kbit/s)")
+    parser.add_argument('--padding', type=int, default=0,
+                        help="로그인 폼 뒤에 덧붙일 본문 크기(KB) - 페이지 하단 스크립트/푸터 가정")
+    args = parser.parse_args()
+
+    html = build_pages()['sso'] + ' ' * (args.padding * 1024)
+    body = html.encode('utf-8')
+    gzip_body = gzip.compress(body)
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _make_handler(body, gzip_body, args.kbps))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_port}'
+
+    print(f"{Colors.BOLD}로그인 페이지 수신 ({args.rounds} rounds, {args.kbps} kbit/s){Colors.END}")
+    print(f"  {'case':<20} {'body(B)':>9} {'read(B)':>9} {'p50(ms)':>9} {'max(ms)':>9}")
+    try:
+        for encoding, url, size in (('identity', f'{base_url}/auth', len(body)),
+                                    ('gzip', f'{base_url}/auth.gz', len(gzip_body))):
+            for stream in (False, True):
+                result = measure(url, stream, args.rounds)
+                name = f"{encoding},{'stream' if stream else 'full'}"
+                print(f"  {name:<20} {size:>9} {result['bytes']:>9.0f} {result['p50_ms']:>9.1f} "
+                      f"{result['max_ms']:>9.1f}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
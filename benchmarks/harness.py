@@ -0,0 +1,125 @@
+"""
+벤치마크 공통 실행기
+===================
+측정 함수 실행, 통계 계산(ops/sec, mean, p99), JSON 저장 및 기준선 비교를 담당합니다.
+"""
+
+import json
+import platform
+import time
+from typing import Callable, Dict, List, Optional
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """정렬된 샘플에서 백분위수를 계산합니다 (nearest-rank)."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(0, min(len(sorted_samples) - 1, int(round(pct / 100 * len(sorted_samples))) - 1))
+    return sorted_samples[rank]
+
+
+def run_case(func: Callable[[], object], min_time: float = 1.0, min_rounds: int = 20,
+             warmup: int = 3) -> Dict[str, float]:
+    """
+    func를 min_time초 이상, 최소 min_rounds회 반복 실행하여 통계를 반환합니다.
+
+    Returns:
+        dict: { 'rounds', 'ops_per_sec', 'mean_us', 'p50_us', 'p99_us' }
+    """
+    for _ in range(warmup):
+        func()
+
+    samples: List[float] = []
+    perf_counter = time.perf_counter
+    deadline = perf_counter() + min_time
+    while len(samples) < min_rounds or perf_counter() < deadline:
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+
+    samples.sort()
+    total = sum(samples)
+    mean = total / len(samples)
+    return {
+        'rounds': len(samples),
+        'ops_per_sec': len(samples) / total if total else 0.0,
+        'mean_us': mean * 1e6,
+        'p50_us': percentile(samples, 50) * 1e6,
+        'p99_us': percentile(samples, 99) * 1e6,
+    }
+
+
+def environment() -> Dict[str, str]:
+    """결과 파일에 함께 기록할 실행 환경 정보"""
+    from myiweb.crypto_backends import get_backend
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'crypto_backend': get_backend().name,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def save_results(path: str, results: Dict[str, Dict[str, float]]) -> None:
+    """측정 결과를 JSON 파일로 저장합니다."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment(), 'results': results}, f, ensure_ascii=False, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Dict[str, float]]:
+    """save_results()로 저장된 파일에서 결과 부분만 읽어옵니다."""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['results']
+
+
+def compare(baseline: Dict[str, Dict[str, float]], current: Dict[str, Dict[str, float]],
+            threshold: float = 0.10, metric: str = 'mean_us') -> List[Dict[str, object]]:
+    """
+    기준선 대비 현재 결과를 비교합니다.
+
+    Args:
+        baseline: 기준선 결과
+        current: 현재 결과
+        threshold: 회귀로 판단할 상대 증가율 (0.10 = 10% 느려짐)
+        metric: 비교할 지표 (값이 클수록 느린 지표: mean_us, p99_us 등)
+
+    Returns:
+        list: 케이스별 비교 결과 { 'name', 'baseline', 'current', 'change', 'regression', 'missing' }
+              한쪽에만 있는 케이스는 없는 쪽의 값과 change가 None이고, missing이 'baseline'(기준선 없음,
+              새 케이스) 또는 'current'(현재 결과에 없음, 이름이 바뀌었거나 삭제된 케이스)입니다.
+    """
+    rows = []
+    for name in sorted(set(baseline) | set(current)):
+        if name not in current:
+            rows.append({'name': name, 'baseline': baseline[name][metric], 'current': None,
+                         'change': None, 'regression': False, 'missing': 'current'})
+            continue
+        if name not in baseline:
+            rows.append({'name': name, 'baseline': None, 'current': current[name][metric],
+                         'change': None, 'regression': False, 'missing': 'baseline'})
+            continue
+
+        before = baseline[name][metric]
+        after = current[name][metric]
+        change = (after - before) / before if before else 0.0
+        rows.append({
+            'name': name,
+            'baseline': before,
+            'current': after,
+            'change': change,
+            'regression': change > threshold,
+            'missing': None,
+        })
+    return rows
+
+
+def format_table(results: Dict[str, Dict[str, float]], names: Optional[List[str]] = None) -> str:
+    """측정 결과를 텍스트 표로 변환합니다."""
+    names = names or list(results)
+    lines = [f"  {'case':<40} {'ops/sec':>12} {'mean(us)':>12} {'p99(us)':>12}"]
+    for name in names:
+        r = results[name]
+        lines.append(f"  {name:<40} {r['ops_per_sec']:>12.1f} {r['mean_us']:>12.1f} {r['p99_us']:>12.1f}")
+    return '\n'.join(lines)
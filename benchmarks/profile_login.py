@@ -0,0 +1,113 @@
+"""
+로그인 1회당 CPU 프로파일
+=======================
+로컬 대역 서버(myiweb.standin)를 상대로 로그인 → 학생카드 → 학적변동내역 조회를 반복하며
+클라이언트 스레드의 CPU 시간(time.thread_time)과 cProfile 결과를 로그인 1회 기준으로 보여줍니다.
+서버는 같은 프로세스의 다른 스레드에서 동작하므로 측정에 포함되지 않습니다.
+
+본문 디코딩 비용을 따로 보기 위해 다음 함수군의 누적 시간을 묶어 표시합니다.
+- decode: requests Response.text, charset 감지(charset_normalizer/chardet), bs4 UnicodeDammit/EncodingDetector
+- parse: myiweb.parsing, hops, fetcher의 _parse_info, BeautifulSoup
+
+사용법:
+    python -m benchmarks.profile_login [--logins 50] [--padding-kb 60] [--no-charset-header] [--top 15]
+"""
+
+import argparse
+import cProfile
+import pstats
+import time
+
+from myiweb.crypto import SessionKeyPool
+from myiweb.sso import MJUSSOLogin
+from myiweb.standin import StandInServer, StandInTransport
+from myiweb.student_card import _StudentCardFetcher
+from myiweb.student_changelog import _StudentChangeLogFetcher
+from myiweb.trace import set_tracing
+from myiweb.utils import Colors
+
+USER_ID, USER_PW = '60201234', 'stand-in-password'
+
+# (그룹 이름, 함수 식별 조건) - pstats 키 (파일, 줄, 함수 이름)에 대해 검사
+GROUPS = {
+    'decode': lambda file, name: (
+        ('requests' in file and name in ('text', 'apparent_encoding'))
+        or 'charset_normalizer' in file or 'chardet' in file
+        or ('bs4' in file and 'dammit' in file)
+    ),
+    'parse': lambda file, name: (
+        file.endswith(('parsing.py', 'hops.py')) or name in ('_parse_info', '_extract_csrf_from_html')
+        or ('bs4' in file and 'dammit' not in file)
+    ),
+}
+
+
+def _iteration(transport: StandInTransport, key_pool: SessionKeyPool) -> None:
+    session = MJUSSOLogin(USER_ID, USER_PW, verbose=False, key_pool=key_pool, transport=transport).login('msi')
+    _StudentCardFetcher(session, USER_PW, verbose=False).fetch()
+    _StudentChangeLogFetcher(session, USER_PW, verbose=False).fetch()
+
+
+def _group_times(stats: pstats.Stats) -> dict:
+    """그룹별 누적 시간(초) - 그룹 안의 함수끼리 중복 집계하지 않도록 그룹 밖에서 호출된 부분만 합산"""
+    result = {}
+    for group, match in GROUPS.items():
+        total = 0.0
+        for (file, _, name), (_, _, _, cumulative, callers) in stats.stats.items():
+            if not match(file, name):
+                continue
+            if not callers:
+                total += cumulative
+                continue
+            # 호출자가 같은 그룹이면 그 호출자의 누적 시간에 이미 포함됨
+            total += sum(edge[3] for caller, edge in callers.items() if not match(caller[0], caller[2]))
+        result[group] = total
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 1회당 CPU 프로파일 (로컬 대역 서버)")
+    parser.add_argument('--logins', type=int, default=50, help="측정할 로그인(+조회) 횟수")
+    parser.add_argument('--padding-kb', type=int, default=60, help="대역 서버 HTML 응답 크기 (실제 MSI 페이지 약 60KB)")
+    parser.add_argument('--no-charset-header', action='store_true', help="Content-Type에 charset을 표시하지 않음")
+    parser.add_argument('--top', type=int, default=15, help="tottime 상위 함수 표시 개수")
+    args = parser.parse_args()
+
+    set_tracing(False)
+    with StandInServer(users={USER_ID: USER_PW}, page_padding=args.padding_kb * 1024,
+                       charset_header=not args.no_charset_header) as server, \
+            SessionKeyPool(low_watermark=8, high_watermark=64) as key_pool:
+        transport = StandInTransport(server)
+        for _ in range(3):
+            _iteration(transport, key_pool)
+
+        profiler = cProfile.Profile()
+        cpu = 0.0
+        for _ in range(args.logins):
+            started = time.thread_time()
+            profiler.enable()
+            _iteration(transport, key_pool)
+            profiler.disable()
+            cpu += time.thread_time() - started
+        transport.close()
+
+    stats = pstats.Stats(profiler)
+    groups = _group_times(stats)
+    per_login = 1000 / args.logins
+
+    print(f"{Colors.BOLD}로그인 + 조회 CPU 프로파일 ({args.logins}회, 페이지 {args.padding_kb}KB, "
+          f"charset 헤더 {'없음' if args.no_charset_header else '있음'}){Colors.END}")
+    print(f"  {'CPU/login (thread_time)':<32} {cpu * per_login:>9.2f} ms")
+    for group, seconds in groups.items():
+        print(f"  {group + ' (cProfile)':<32} {seconds * per_login:>9.2f} ms")
+
+    print(f"\n  {'function':<60} {'calls/login':>11} {'tottime(ms)':>12} {'cumtime(ms)':>12}")
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:args.top]
+    for (file, line, name), (_, calls, tottime, cumulative, _) in rows:
+        label = f"{file.rsplit('/', 2)[-2:][-1]}:{line}({name})" if line else name
+        print(f"  {label[:60]:<60} {calls / args.logins:>11.1f} {tottime * per_login:>12.3f} "
+              f"{cumulative * per_login:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
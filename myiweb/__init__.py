@@ -4,17 +4,34 @@
 MSI(My iWeb) 서비스에 접속하여 학생 정보를 조회하는 모듈
 
 모듈 구성:
+- client: 로그인 1회로 여러 정보를 조회하는 MSIClient
 - sso: SSO 로그인 저수준 로직
+- session_store: 로그인 세션 암호화 저장소
+- liveness: 세션 생존 확인 (헤더만 확인 + TTL 캐시, 일괄 확인)
+- csrf: 세션별 MSI CSRF 토큰 캐시 (조회 간 공유)
+- aio_sso: httpx 기반 비동기 SSO 로그인 (선택 의존성)
+- parsing: SSO 페이지 파싱 함수
+- hops: 로그인 후 이동 단계 모델
+- prefetch: 로그인 페이지 사전 요청 풀
+- retry: 멱등 GET 재시도 / 헤지 요청 정책
+- standin: 테스트·부하 측정용 로컬 SSO/MSI 대역 서버
+- bench: 대역 서버 대상 부하 테스트 (python -m myiweb.bench load)
 - student_card: 학생카드 조회 서비스
 - student_changelog: 학적변동내역 조회 서비스
 - abc: 추상 기본 클래스
 - crypto: RSA/AES 암호화 유틸리티
+- crypto_backends: 암호화 백엔드(cryptography/pycryptodome/hashlib) 자동 선택
 - exceptions: 커스텀 예외 클래스
+- trace: 단계별 소요 시간 기록 및 지연 시간 히스토그램
+- transport: HTTP 연결 풀 공유 전송 계층
+- http2: HTTP/2 다중화 전송 계층 (선택 의존성)
 - utils: 로깅 및 공통 유틸리티
 """
 
+from .client import MSIClient
 from .student_card import StudentCard
 from .student_changelog import StudentChangeLog
+from .session_store import SessionStore, MemorySessionStore, SQLiteSessionStore, FileSessionStore
 from .exceptions import (
     MyIWebError,
     NetworkError,
@@ -28,6 +45,15 @@ __all__ = [
     'StudentCard',
     'StudentChangeLog',
 
+    # 조회 클라이언트 (로그인 1회로 여러 정보 조회)
+    'MSIClient',
+
+    # 세션 저장소
+    'SessionStore',
+    'MemorySessionStore',
+    'SQLiteSessionStore',
+    'FileSessionStore',
+
     # 예외 클래스
     'MyIWebError',
     'NetworkError',
@@ -9,8 +9,7 @@ import json
 from dotenv import load_dotenv
 
 # 단순화된 API 임포트
-from .student_card import StudentCard
-from .student_changelog import StudentChangeLog
+from .client import MSIClient
 from .exceptions import MyIWebError
 from .utils import Colors, log_section, log_success, log_error
 
@@ -46,21 +45,18 @@ def main():
         return
     
     try:
-        # 1. 학생카드 정보 조회 (로그인부터 모든 과정 포함)
-        log_section("학생카드 정보 조회")
-        student_card = StudentCard.fetch(user_id, user_pw, verbose=False)
+        # MSI 로그인 (한 번), 2차 비밀번호 인증 후 학생카드와 학적변동내역을 동시에 조회
+        log_section("학생카드 / 학적변동내역 조회")
+        with MSIClient(user_id, user_pw, verbose=False) as client:
+            results = client.fetch_all()
+        student_card = results['student_card']
+        change_log = results['change_log']
         log_success("학생카드 정보 조회 완료!")
+        log_success("학적변동내역 조회 완료!")
         
         # JSON 형태로 출력
         print(f"\n{Colors.BOLD}[학생카드 JSON]{Colors.END}")
         print(json.dumps(student_card.to_dict(), ensure_ascii=False, indent=2))
-
-        # 2. 학적변동내역 정보 조회
-        log_section("학적변동내역 조회")
-        change_log = StudentChangeLog.fetch(user_id, user_pw, verbose=False)
-        log_success("학적변동내역 조회 완료!")
-
-        # JSON 형태로 출력
         print(f"\n{Colors.BOLD}[학적변동내역 JSON]{Colors.END}")
         print(json.dumps(change_log.to_dict(), ensure_ascii=False, indent=2))
         
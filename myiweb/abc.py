@@ -3,14 +3,18 @@ myiweb 모듈의 추상 기본 클래스
 =============================
 """
 
-import re
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional
 
 import requests
 
 from .exceptions import NetworkError, PageParsingError, SessionExpiredError
-from .utils import log_step, log_request, log_response, log_info, log_success
+from .csrf import CSRFTokenCache, default_csrf_cache
+from .parsing import DEFAULT_CHARSET, Body, find_csrf_token, response_charset
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from .session_store import SessionStore
+from .trace import Trace
+from .utils import log_step, log_request, log_response, log_info, log_success, log_warning
 
 
 class BaseFetcher(ABC):
@@ -19,18 +23,66 @@ class BaseFetcher(ABC):
     """
     MSI_HOME_URL = "https://msi.mju.ac.kr/servlet/security/MySecurityStart"
 
-    def __init__(self, session: requests.Session, user_pw: str, verbose: bool = True):
+    # 단계별 기록 이름 ('fetch.<TRACE_NAME>.<단계>'로 히스토그램에 합산)
+    TRACE_NAME = 'fetch'
+
+    def __init__(self, session: requests.Session, user_pw: str, verbose: bool = True,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 csrf_cache: Optional[CSRFTokenCache] = None):
         """
         Args:
             session: 로그인된 requests 세션
             user_pw: 비밀번호 (2차 인증 등에 사용될 수 있음)
             verbose: 상세 로그 출력 여부
+            retry_policy: CSRF 토큰 GET의 재시도/헤지 정책 (조회 POST는 재시도하지 않음)
+            csrf_cache: 세션별 CSRF 토큰 캐시 (None이면 프로세스 전역 캐시 - 같은 세션의 다른 조회와 공유)
         """
         self.session = session
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self.csrf_cache = csrf_cache or default_csrf_cache()
         self.user_pw = user_pw
         self.verbose = verbose
         self.csrf_token: Optional[str] = None
         self._last_url: Optional[str] = None
+        # 마지막 조회 응답의 문자 집합 (본문은 바이트로 다루고 추출한 값만 디코딩)
+        self._last_charset = DEFAULT_CHARSET
+        # 마지막 fetch()의 단계별 기록
+        self.trace = Trace(f'fetch.{self.TRACE_NAME}', aggregate=False)
+
+    @classmethod
+    def run(cls, user_id: str, user_pw: str, verbose: bool = False,
+            session_store: Optional[SessionStore] = None):
+        """
+        MSI 로그인 후 fetch()를 수행합니다.
+
+        session_store가 주어지면 저장된 세션으로 먼저 시도하고, 세션이 만료된 경우
+        (SessionExpiredError)에만 전체 SSO 로그인을 수행한 뒤 새 세션을 저장합니다.
+
+        Args:
+            user_id: 학번
+            user_pw: 비밀번호
+            verbose: 상세 로그 출력 여부
+            session_store: 로그인 세션 저장소 (선택)
+        """
+        # 순환 참조 방지를 위해 메서드 내에서 임포트
+        from .sso import MJUSSOLogin
+
+        if session_store is not None:
+            sso = MJUSSOLogin(user_id, user_pw, verbose=verbose)
+            if sso.restore_session(session_store, service='msi'):
+                try:
+                    return cls(sso.session, user_pw, verbose=verbose).fetch()
+                except SessionExpiredError:
+                    if verbose:
+                        log_warning("저장된 세션이 만료되었습니다. 다시 로그인합니다.")
+                    session_store.delete(user_id, 'msi')
+
+        sso = MJUSSOLogin(user_id, user_pw, verbose=verbose)
+        session = sso.login(service='msi')
+        if session_store is not None:
+            sso.save_session(session_store, service='msi')
+
+        return cls(session, user_pw, verbose=verbose).fetch()
 
     @abstractmethod
     def fetch(self):
@@ -40,25 +92,47 @@ class BaseFetcher(ABC):
         """
         raise NotImplementedError
 
-    def _get_csrf_token(self):
-        """MSI 홈페이지에서 CSRF 토큰을 추출하여 self.csrf_token에 저장합니다."""
+    def _start_trace(self) -> Trace:
+        """fetch() 1회의 단계별 기록을 새로 시작합니다. (with 문으로 사용)"""
+        self.trace = Trace(f'fetch.{self.TRACE_NAME}')
+        return self.trace
+
+    def _get_csrf_token(self, refresh: bool = False):
+        """
+        세션의 CSRF 토큰을 self.csrf_token에 저장합니다.
+
+        캐시(로그인 최종 응답이나 이전 조회에서 얻은 토큰)에 있으면 그대로 사용하고,
+        없거나 refresh이면 MSI 홈페이지에서 추출하여 캐시에 저장합니다.
+        """
+        if not refresh:
+            token = self.csrf_cache.get(self.session)
+            if token is not None:
+                self.csrf_token = token
+                if self.verbose:
+                    log_step("A-1", "CSRF 토큰 (캐시)")
+                    log_info("CSRF Token", self.csrf_token)
+                return
+
         if self.verbose:
             log_step("A-1", "CSRF 토큰 추출")
             log_request('GET', self.MSI_HOME_URL)
 
         try:
-            response = self.session.get(self.MSI_HOME_URL, timeout=10)
+            with self.trace.stage('csrf') as stage:
+                response = self.retry_policy.get(self.session, self.MSI_HOME_URL, 'csrf', timeout=10)
+                stage.record(response)
 
             if self.verbose:
                 log_response(response, show_body=False)
 
-            if 'sso.mju.ac.kr' in response.url:
+            if self._redirected_to_sso(response):
                 raise SessionExpiredError("세션이 만료되었습니다. 다시 로그인해주세요.")
 
-            self.csrf_token = self._extract_csrf_from_html(response.text)
+            self.csrf_token = self._extract_csrf_from_html(response.content, response_charset(response))
 
             if not self.csrf_token:
                 raise PageParsingError("CSRF 토큰을 찾을 수 없습니다.")
+            self.csrf_cache.put(self.session, self.csrf_token)
 
             if self.verbose:
                 log_info("CSRF Token", self.csrf_token)
@@ -67,21 +141,49 @@ class BaseFetcher(ABC):
         except requests.RequestException as e:
             raise NetworkError(f"CSRF 토큰 추출 실패: {e}") from e
 
-    def _extract_csrf_from_html(self, html: str) -> Optional[str]:
-        """HTML에서 CSRF 토큰을 추출합니다."""
-        # meta 태그에서 추출
-        csrf_match = re.search(r'meta[^>]*_csrf[^>]*content="([^"]+)"', html)
-        if csrf_match:
-            return csrf_match.group(1)
+    def _extract_csrf_from_html(self, body: Body, charset: str = DEFAULT_CHARSET) -> Optional[str]:
+        """HTML 본문(디코딩하지 않은 바이트)에서 CSRF 토큰을 추출합니다."""
+        return find_csrf_token(body, charset)
+
+    def _use_csrf_token(self, token: str) -> None:
+        """응답 페이지에 실린 토큰으로 교체합니다. (캐시에도 반영)"""
+        if token != self.csrf_token:
+            self.csrf_token = token
+            self.csrf_cache.put(self.session, token)
 
-        # X-CSRF-TOKEN 헤더 설정에서 추출 (JavaScript 내)
-        csrf_match = re.search(r"X-CSRF-TOKEN[\"']?\s*:\s*[\"']([^\"']+)[\"']", html)
-        if csrf_match:
-            return csrf_match.group(1)
+    @staticmethod
+    def _redirected_to_sso(response: requests.Response) -> bool:
+        """SSO로 리다이렉트되었는지 (SSO 세션이 살아 있어 MSI로 되돌아온 경우 포함)"""
+        return any('sso.mju.ac.kr' in r.url for r in (*response.history, response))
 
-        # input hidden 태그에서 추출
-        csrf_match = re.search(r'name="_csrf"\s+value="([^"]+)"', html)
-        if csrf_match:
-            return csrf_match.group(1)
+    @classmethod
+    def _csrf_rejected(cls, response: requests.Response) -> bool:
+        """CSRF 토큰이 거부된 응답인지 (403 또는 sso.mju.ac.kr로 리다이렉트)"""
+        return response.status_code == 403 or cls._redirected_to_sso(response)
+
+    def _post(self, stage_name: str, url: str, data: Dict[str, str], headers: Dict[str, str],
+              timeout: float = 15) -> requests.Response:
+        """
+        현재 CSRF 토큰(_csrf 필드와 X-CSRF-TOKEN 헤더)을 넣어 조회 POST를 보냅니다.
 
-        return None
+        토큰이 거부되면(_csrf_rejected) 캐시의 토큰을 버리고 MSI 홈페이지에서 새로 받아 한 번 더 보냅니다.
+        거부된 요청은 서버에서 처리되지 않았으므로 다시 보내도 안전합니다.
+        세션 자체가 만료된 경우에는 토큰을 다시 받는 단계에서 SessionExpiredError가 발생합니다.
+
+        Raises:
+            requests.RequestException: 네트워크 오류 (호출자가 NetworkError로 변환)
+        """
+        for attempt in range(2):
+            form_data = dict(data, _csrf=self.csrf_token)
+            request_headers = dict(headers, **{'X-CSRF-TOKEN': self.csrf_token})
+            with self.trace.stage(stage_name) as stage:
+                response = self.session.post(url, data=form_data, headers=request_headers, timeout=timeout)
+                stage.record(response)
+            if attempt or not self._csrf_rejected(response):
+                return response
+
+            if self.verbose:
+                log_warning(f"CSRF 토큰이 거부되었습니다 ({response.status_code}). 토큰을 다시 받습니다.")
+            self.csrf_cache.invalidate(self.session, self.csrf_token)
+            self._get_csrf_token(refresh=True)
+        return response
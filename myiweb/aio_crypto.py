@@ -0,0 +1,109 @@
+"""
+비동기 암호화 파사드
+===================
+asyncio 이벤트 루프에서 로그인 암호화(PBKDF2, RSA, AES)를 실행하면 루프 스레드가
+그동안 멈춥니다. AsyncCrypto는 같은 연산을 스레드/프로세스 executor로 보내고
+await할 수 있는 인터페이스를 제공합니다.
+
+사용 예 (FastAPI 등):
+    crypto = AsyncCrypto(kind='process', max_workers=4)
+
+    @app.on_event("startup")
+    async def startup():
+        await crypto.start()          # 작업자 미리 기동 + 백엔드 측정 완료
+
+    async def handler():
+        key_info = await crypto.generate_session_key()
+        encsymka = await crypto.encrypt_with_rsa(f"{key_info['keyStr']},{ts}", public_key)
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Optional
+
+from .crypto import encrypt_with_aes, encrypt_with_rsa, generate_session_key
+from .crypto_backends import get_backend
+
+
+def _warm_worker() -> str:
+    """작업자에서 암호화 백엔드를 미리 선택(측정)해 둡니다."""
+    return get_backend().name
+
+
+def _build_login_body(user_id: str, user_pw: str, public_key: str, csrf_token: str) -> bytes:
+    """세션키 생성부터 로그인 POST 본문 생성까지 한 번에 수행합니다. (작업자 실행용)"""
+    from .payload import LoginPayloadEncoder
+
+    key_info = generate_session_key(32)
+    timestamp = str(int(time.time() * 1000))
+    return LoginPayloadEncoder(user_id, csrf_token).encode(user_pw, key_info, public_key, timestamp)
+
+
+class AsyncCrypto:
+    """
+    crypto 모듈 함수의 awaitable 버전
+
+    - kind='thread': 스레드 풀 (cryptography/hashlib PBKDF2, RSA는 GIL을 해제함)
+    - kind='process': 프로세스 풀 (GIL과 무관하게 완전히 분리)
+    - executor를 직접 넘기면 kind/max_workers는 무시됩니다.
+    """
+
+    def __init__(self, kind: str = 'thread', max_workers: Optional[int] = None,
+                 executor: Optional[Executor] = None):
+        if kind not in ('thread', 'process'):
+            raise ValueError(f"알 수 없는 executor 종류: {kind} ('thread' 또는 'process')")
+
+        self.kind = kind
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._owns_executor = executor is None
+        if executor is not None:
+            self._executor = executor
+        elif kind == 'process':
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_warm_worker)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='AsyncCrypto')
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def start(self) -> None:
+        """
+        작업자를 미리 기동하고 암호화 백엔드 선택을 끝내 둡니다.
+        첫 요청이 프로세스 생성이나 백엔드 측정 비용을 떠안지 않도록 시작 시 호출하세요.
+        """
+        await asyncio.gather(*(self._run(_warm_worker) for _ in range(self.max_workers)))
+
+    async def close(self) -> None:
+        """직접 생성한 executor를 종료합니다."""
+        if self._owns_executor:
+            await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+
+    async def __aenter__(self) -> "AsyncCrypto":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def generate_session_key(self, length: int = 32) -> dict:
+        """crypto.generate_session_key의 awaitable 버전"""
+        return await self._run(generate_session_key, length)
+
+    async def encrypt_with_rsa(self, data: str, public_key_str: str) -> str:
+        """crypto.encrypt_with_rsa의 awaitable 버전"""
+        return await self._run(encrypt_with_rsa, data, public_key_str)
+
+    async def encrypt_with_aes(self, plain_text: str, key_info: dict) -> str:
+        """crypto.encrypt_with_aes의 awaitable 버전"""
+        return await self._run(encrypt_with_aes, plain_text, key_info)
+
+    async def build_login_body(self, user_id: str, user_pw: str, public_key: str, csrf_token: str) -> bytes:
+        """
+        로그인 POST 본문 전체를 작업자 한 번의 호출로 생성합니다.
+        (프로세스 풀에서는 세 번 나누어 보내는 것보다 직렬화/왕복 비용이 적음)
+        """
+        return await self._run(_build_login_body, user_id, user_pw, public_key, csrf_token)
@@ -0,0 +1,241 @@
+"""
+비동기 SSO 로그인
+================
+MJUSSOLogin과 같은 파싱/암호화/판정 단계(sso._SSOLoginSteps)를 사용하되, httpx.AsyncClient로
+요청을 보내는 asyncio용 로그인 클래스입니다. 한 프로세스에서 로그인마다 스레드를 두지 않고
+수백 명의 로그인을 동시에 진행할 수 있습니다.
+
+MJUSSOLogin의 하위 클래스가 아니므로 세션 저장소, check_alive(), login_many() 같은
+requests 세션 기반 API는 없습니다. 로그인 후 to_requests_session()으로 만든 세션을 사용하세요.
+
+사용 예:
+    async with AsyncMJUSSOLogin(user_id, user_pw, verbose=False) as sso:
+        client = await sso.login('msi')
+        session = sso.to_requests_session()   # 기존 Fetcher에 넘길 때
+
+httpx가 필요합니다: pip install 'mju-sso-login[async]'
+"""
+
+import time
+from typing import Optional
+
+import requests
+
+try:
+    import httpx
+except ImportError as e:
+    raise ImportError("AsyncMJUSSOLogin을 사용하려면 httpx가 필요합니다: pip install 'mju-sso-login[async]'") from e
+
+from .aio_crypto import AsyncCrypto
+from .exceptions import MyIWebError, NetworkError
+from .hops import MAX_HOPS, HopTrace, hop_model
+from .parsing import response_charset
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from .sso import _SSOLoginSteps
+from .trace import Trace
+from .transport import Transport, default_transport
+from .utils import log_info, log_request, log_response, log_section, log_step, log_warning, mask_sensitive
+
+
+class AsyncMJUSSOLogin(_SSOLoginSteps):
+    """명지대학교 SSO 비동기 로그인 클래스"""
+
+    # httpx는 brotli 패키지가 없으면 br 응답을 풀 수 없으므로 gzip/deflate만 요청
+    DEFAULT_HEADERS = {**_SSOLoginSteps.DEFAULT_HEADERS, 'Accept-Encoding': 'gzip, deflate'}
+
+    def __init__(self, user_id: str, user_pw: str, verbose: bool = True,
+                 client: Optional[httpx.AsyncClient] = None,
+                 crypto: Optional[AsyncCrypto] = None,
+                 retry_policy: Optional[RetryPolicy] = None):
+        """
+        Args:
+            user_id: 학번/교번
+            user_pw: 비밀번호
+            verbose: 상세 로그 출력 여부
+            client: 사용할 httpx.AsyncClient (None이면 사용자별로 새로 생성)
+            crypto: 암호화를 executor로 넘길 AsyncCrypto (None이면 이벤트 루프에서 직접 계산)
+            retry_policy: 로그인 페이지/세션 테스트 GET의 재시도 정책 (비동기에서는 헤지하지 않음)
+        """
+        self.user_id = user_id
+        self.user_pw = user_pw
+        self.verbose = verbose
+        self.key_pool = None
+        self.crypto = crypto
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+
+        # 쿠키는 클라이언트 단위로 관리되므로 사용자마다 별도 클라이언트를 사용
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            headers=self.DEFAULT_HEADERS,
+            follow_redirects=True,
+            timeout=15,
+        )
+
+        # 로그인 과정에서 획득한 데이터
+        self.public_key: Optional[str] = None
+        self.csrf_token: Optional[str] = None
+        self.form_action: Optional[str] = None
+        self.hop_trace: Optional[HopTrace] = None
+        self.trace = Trace('login', aggregate=False)
+
+    async def aclose(self) -> None:
+        """직접 생성한 httpx 클라이언트를 닫습니다."""
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncMJUSSOLogin":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def _prepare_login_body_async(self) -> bytes:
+        """로그인 POST 본문 준비 (AsyncCrypto가 있으면 executor에서 같은 인코더로 생성)"""
+        if self.crypto is None:
+            return self._prepare_login_body()
+        if self.verbose:
+            log_step("2", "암호화 데이터 준비 (executor)")
+        with self.trace.stage('encrypt'):
+            return await self.crypto.build_login_body(self.user_id, self.user_pw, self.public_key, self.csrf_token)
+
+    async def login(self, service: str = 'msi') -> httpx.AsyncClient:
+        """
+        SSO 로그인 수행 (MJUSSOLogin.login의 비동기 버전)
+
+        Args:
+            service: 로그인할 서비스 ('lms', 'portal', 'library', 'msi', 'myicap')
+
+        Returns:
+            httpx.AsyncClient: 로그인된 클라이언트
+
+        Raises:
+            InvalidCredentialsError: 로그인 정보가 틀렸을 때
+            PageParsingError: 로그인 페이지 파싱에 실패했을 때
+            NetworkError: 네트워크 요청에 실패했을 때
+            MyIWebError: 그 외 알 수 없는 에러
+        """
+        if service not in self.SERVICES:
+            raise MyIWebError(f'Unknown service: {service}')
+
+        self.trace = Trace(f'aio_login.{service}')
+        with self.trace:
+            await self._login(service)
+        if self.verbose:
+            log_info("Trace", self.trace.breakdown())
+        return self.client
+
+    async def _login(self, service: str) -> None:
+        """login()의 본문 (self.trace가 준비된 상태에서 호출)"""
+        service_info = self.SERVICES[service]
+
+        if self.verbose:
+            log_section(f"MJU SSO 비동기 로그인: {service_info['name']}")
+            print(f"  User ID: {mask_sensitive(self.user_id)}")
+
+        # Step 1: 로그인 페이지 접속
+        login_url = service_info['url']
+        if self.verbose:
+            log_step("1-1", "로그인 페이지 접속 (GET)")
+            log_request('GET', login_url)
+
+        try:
+            with self.trace.stage('login_page') as stage:
+                response = await self.retry_policy.aget(self.client, login_url, 'login_page', timeout=10)
+                stage.record(response)
+            if self.verbose:
+                log_response(response)
+        except httpx.HTTPError as e:
+            raise NetworkError(f"페이지 접속 실패: {e}") from e
+
+        # 페이지 파싱
+        self._parse_login_page(response.content, response_charset(response))
+
+        # Step 2: 암호화 데이터 준비
+        login_body = await self._prepare_login_body_async()
+
+        # Step 3: 로그인 요청
+        action_url, headers = self._build_signin_request(login_url, login_body)
+
+        model = hop_model(service)
+        plan = model.plan
+        self.hop_trace = HopTrace(service, learned=plan is not None)
+        hops = []
+
+        try:
+            started = time.perf_counter()
+            with self.trace.stage('signin_post') as stage:
+                response = await self.client.post(action_url, content=login_body, headers=headers)
+                stage.record(response)
+            self.hop_trace.add_response('post', response, started)
+            if self.verbose:
+                log_response(response)
+
+            # JavaScript 폼 제출 및 리다이렉트 처리 (최대 3회)
+            for i in range(MAX_HOPS):
+                page_url = str(response.url)
+                hop, learned = self._next_hop(model, plan, i, response.content, page_url, response_charset(response))
+                if hop is None:
+                    # 더 이상 처리할 JS 동작이 없음
+                    break
+                hops.append(hop)
+
+                started = time.perf_counter()
+                with self.trace.stage(f'hop{i+1}_{hop.kind}') as stage:
+                    if hop.kind == 'form':
+                        # JavaScript 폼 자동 제출 처리 (onLoad="doLogin()" 등)
+                        response = await self.client.post(hop.url, data=hop.form_data, headers=self._js_form_headers(page_url))
+                    else:
+                        # location.href 리다이렉트 처리
+                        response = await self.client.get(hop.url)
+                    stage.record(response)
+                self.hop_trace.add_response(hop.kind, response, started, learned)
+                if self.verbose:
+                    log_response(response)
+
+        except httpx.HTTPError as e:
+            raise NetworkError(f"로그인 요청 실패: {e}") from e
+
+        # Step 4: 결과 확인
+        with self.trace.stage('check_result'):
+            self._check_login_result(response.content, str(response.url), service_info, response_charset(response),
+                                     response.status_code)
+        self._observe_hops(service, response.status_code, str(response.url), hops)
+        if self.verbose:
+            log_info("Hop Trace", self.hop_trace.summary())
+
+    async def test_session(self, service: str = 'msi') -> bool:
+        """세션 유효성 테스트 (MJUSSOLogin.test_session의 비동기 버전)"""
+        service_info = self.SERVICES.get(service, {})
+        test_url = service_info.get('test_url')
+
+        if not test_url:
+            return False
+
+        if self.verbose:
+            log_step("5", "세션 유효성 테스트")
+            log_info("Test URL", test_url)
+
+        try:
+            response = await self.retry_policy.aget(self.client, test_url, 'test_session', timeout=10)
+        except httpx.HTTPError as e:
+            if self.verbose:
+                log_warning(f"테스트 실패: {e}")
+            return False
+
+        return self._check_session_page(response.content, str(response.url), service_info,
+                                        response_charset(response), response.status_code)
+
+    def to_requests_session(self, transport: Optional[Transport] = None) -> requests.Session:
+        """
+        로그인된 쿠키를 담은 requests.Session을 만듭니다.
+        StudentCard/StudentChangeLog의 Fetcher처럼 동기 세션을 받는 코드에 넘길 때 사용합니다.
+
+        Args:
+            transport: 세션에 장착할 HTTP 전송 계층 (None이면 프로세스 전역 공유 연결 풀 - MJUSSOLogin과 같음)
+        """
+        session = requests.Session()
+        session.headers.update(_SSOLoginSteps.DEFAULT_HEADERS)
+        (transport or default_transport()).mount(session)
+        for cookie in self.client.cookies.jar:
+            session.cookies.set_cookie(cookie)
+        return session
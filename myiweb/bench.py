@@ -0,0 +1,245 @@
+"""
+로그인 + 조회 부하 테스트
+========================
+로컬 대역 서버(standin.StandInServer)를 띄우고 가상 사용자 N명이 동시에
+MJUSSOLogin.login('msi') → 학생카드 조회 → 학적변동내역 조회를 반복합니다.
+실제 서버에 요청을 보내지 않으므로 배포 규모 산정과 처리량 회귀 검사에 사용할 수 있습니다.
+
+- 램프업: 가상 사용자를 ramp초에 걸쳐 고르게 시작
+- 지속 시간: 시작 후 duration초가 지나면 새 반복을 시작하지 않음 (진행 중인 반복은 마침)
+- 생각 시간: 반복 사이에 think_time초(±50% 균등 분포) 대기
+- 결과: 처리량(반복/초, 요청/초), 오류율, 단계별 지연 시간 백분위 (trace 히스토그램)
+
+오류를 주입하면(error_rate) 요청 하나마다 그 확률로 오류가 나므로, 반복 1회(요청 k개)의 예상 오류율은
+1 - (1 - error_rate)^k 입니다. 실제 오류율이 이보다 크게 높으면 주입된 오류 하나가 이후 반복까지
+실패시키고 있다는 뜻입니다. (예: 오류 페이지에서 끝난 로그인을 성공으로 보고 학습하는 경우)
+
+사용법:
+    python -m myiweb.bench load --users 32 --duration 60 --ramp 10 --think-time 1
+    python -m myiweb.bench load --users 8 --duration 20 --latency-ms 30 --error-rate 0.01 --output load.json
+    python -m myiweb.bench load --min-throughput 20 --max-error-rate 0.01   # 기준 미달 시 종료 코드 1
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+from .crypto import SessionKeyPool
+from .exceptions import MyIWebError
+from .standin import StandInServer, StandInTransport
+from .sso import MJUSSOLogin
+from .student_card import _StudentCardFetcher
+from .student_changelog import _StudentChangeLogFetcher
+from .trace import format_latency_table, latency_snapshot, observe_latency, reset_latency
+from .utils import Colors, log_error, log_success
+
+# 반복 1회의 단계 (오류 집계 키의 앞부분)
+STEPS = ('login', 'student_card', 'change_log')
+
+
+class _LoadStats:
+    """가상 사용자 스레드들이 함께 기록하는 반복/오류 집계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.iterations = 0
+        self.failures = 0
+        self.errors: Dict[str, int] = {}
+
+    def record(self, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.iterations += 1
+            if error is not None:
+                self.failures += 1
+                self.errors[error] = self.errors.get(error, 0) + 1
+
+
+def _iteration(user_id: str, user_pw: str, transport: StandInTransport,
+               key_pool: Optional[SessionKeyPool]) -> Optional[str]:
+    """로그인 → 학생카드 → 학적변동내역 1회. 실패하면 '<단계>:<예외 이름>'을 반환"""
+    step = STEPS[0]
+    try:
+        session = MJUSSOLogin(user_id, user_pw, verbose=False, key_pool=key_pool, transport=transport).login('msi')
+        step = STEPS[1]
+        _StudentCardFetcher(session, user_pw, verbose=False).fetch()
+        step = STEPS[2]
+        _StudentChangeLogFetcher(session, user_pw, verbose=False).fetch()
+    except (MyIWebError, requests.RequestException) as e:
+        return f"{step}:{type(e).__name__}"
+    return None
+
+
+def run_load(users: int = 10, duration: float = 30.0, ramp: float = 5.0, think_time: float = 1.0,
+             latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, error_status: int = 503,
+             second_factor: bool = True, key_pool_size: int = 0, seed: Optional[int] = None) -> dict:
+    """
+    대역 서버를 띄우고 부하 테스트를 실행합니다.
+
+    누적 지연 시간 히스토그램(trace)은 시작 시 비웁니다.
+
+    Args:
+        users: 동시 가상 사용자 수
+        duration: 새 반복을 시작하는 기간(초, 램프업 포함)
+        ramp: 가상 사용자를 모두 시작하기까지 걸리는 시간(초)
+        think_time: 반복 사이 평균 대기 시간(초)
+        latency / jitter / error_rate / error_status / second_factor: StandInServer 설정
+        key_pool_size: 0보다 크면 이 크기의 SessionKeyPool을 가상 사용자들이 공유
+        seed: 대역 서버 지연/오류 주입과 생각 시간의 난수 시드
+
+    Returns:
+        dict: config, elapsed_s, iterations, failures, error_rate, expected_error_rate, requests_per_iteration,
+              iterations_per_s, requests_per_s, errors({'<단계>:<예외 이름>': 횟수}), stages(latency_snapshot()),
+              server, transport
+    """
+    if users < 1:
+        raise ValueError("users는 1 이상이어야 합니다.")
+    if ramp > duration:
+        raise ValueError("ramp는 duration보다 길 수 없습니다.")
+
+    config = {
+        'users': users, 'duration_s': duration, 'ramp_s': ramp, 'think_time_s': think_time,
+        'latency_ms': latency * 1000, 'jitter_ms': jitter * 1000, 'error_rate': error_rate,
+        'error_status': error_status, 'second_factor': second_factor, 'key_pool_size': key_pool_size,
+    }
+    credentials = {f"load{i:04d}": f"pw-{i:04d}" for i in range(users)}
+    rng = random.Random(seed)
+    think_times = {user_id: random.Random(rng.random()) for user_id in credentials}
+    stats = _LoadStats()
+
+    reset_latency()
+    with StandInServer(users=credentials, latency=latency, jitter=jitter, error_rate=error_rate,
+                       error_status=error_status, second_factor=second_factor, seed=seed) as server:
+        transport = StandInTransport(server, pool_maxsize=users)
+        key_pool = (SessionKeyPool(low_watermark=key_pool_size // 4, high_watermark=key_pool_size)
+                    if key_pool_size > 0 else None)
+
+        started = time.perf_counter()
+        deadline = started + duration
+
+        def virtual_user(index: int, user_id: str, user_pw: str) -> None:
+            time.sleep(ramp * index / users)
+            think = think_times[user_id]
+            while time.perf_counter() < deadline:
+                iteration_started = time.perf_counter()
+                error = _iteration(user_id, user_pw, transport, key_pool)
+                observe_latency('load.iteration', time.perf_counter() - iteration_started)
+                stats.record(error)
+                if think_time > 0:
+                    time.sleep(think_time * (0.5 + think.random()))
+
+        threads = [threading.Thread(target=virtual_user, args=(i, user_id, user_pw), name=f"vu-{i}", daemon=True)
+                   for i, (user_id, user_pw) in enumerate(credentials.items())]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        if key_pool is not None:
+            key_pool.close()
+        server_stats = server.stats()
+        transport_stats = transport.stats()
+        transport.close()
+
+    requests_per_iteration = server_stats['requests'] / stats.iterations if stats.iterations else 0.0
+    return {
+        'config': config,
+        'elapsed_s': elapsed,
+        'iterations': stats.iterations,
+        'failures': stats.failures,
+        'error_rate': stats.failures / stats.iterations if stats.iterations else 0.0,
+        # 주입된 오류가 각각 반복 하나만 실패시킬 때의 오류율
+        'expected_error_rate': 1 - (1 - error_rate) ** requests_per_iteration,
+        'requests_per_iteration': requests_per_iteration,
+        'iterations_per_s': stats.iterations / elapsed,
+        'requests_per_s': server_stats['requests'] / elapsed,
+        'errors': dict(sorted(stats.errors.items())),
+        'stages': latency_snapshot(),
+        'server': server_stats,
+        'transport': {key: value for key, value in transport_stats.items() if key != 'per_host'},
+    }
+
+
+def format_report(report: dict) -> str:
+    """run_load() 결과를 텍스트 표로 만듭니다."""
+    config = report['config']
+    lines = [
+        f"{Colors.BOLD}부하 테스트: 가상 사용자 {config['users']}명, {config['duration_s']:.0f}s "
+        f"(램프업 {config['ramp_s']:.0f}s, 생각 시간 {config['think_time_s']:.1f}s){Colors.END}",
+        f"  {'elapsed':<20} {report['elapsed_s']:>10.1f} s",
+        f"  {'iterations':<20} {report['iterations']:>10}",
+        f"  {'iterations/s':<20} {report['iterations_per_s']:>10.2f}",
+        f"  {'requests/s':<20} {report['requests_per_s']:>10.1f}",
+        f"  {'error rate':<20} {report['error_rate']:>10.2%}",
+        f"  {'expected error rate':<20} {report['expected_error_rate']:>10.2%}"
+        f"   (요청당 오류 {config['error_rate']:.2%}, 반복당 요청 {report['requests_per_iteration']:.1f}개)",
+        f"  {'connections':<20} {report['transport']['connections']:>10}",
+    ]
+    for error, count in report['errors'].items():
+        lines.append(f"    {error:<38} {count:>7}")
+    lines.append("")
+    lines.append(format_latency_table())
+    return '\n'.join(lines)
+
+
+def cmd_load(args) -> int:
+    report = run_load(
+        users=args.users, duration=args.duration, ramp=args.ramp, think_time=args.think_time,
+        latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000, error_rate=args.error_rate,
+        error_status=args.error_status, second_factor=not args.no_second_factor,
+        key_pool_size=args.key_pool, seed=args.seed,
+    )
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(format_report(report))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        log_success(f"결과 저장: {args.output}")
+
+    failed = False
+    if args.min_throughput is not None and report['iterations_per_s'] < args.min_throughput:
+        log_error(f"처리량 기준 미달: {report['iterations_per_s']:.2f} < {args.min_throughput} 반복/초")
+        failed = True
+    if args.max_error_rate is not None and report['error_rate'] > args.max_error_rate:
+        log_error(f"오류율 기준 초과: {report['error_rate']:.2%} > {args.max_error_rate:.2%}")
+        failed = True
+    return 1 if failed else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m myiweb.bench', description="myiweb 부하 테스트")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    load = sub.add_parser('load', help="로컬 대역 서버 대상 로그인 + 조회 부하 테스트")
+    load.add_argument('--users', '-u', type=int, default=10, help="동시 가상 사용자 수")
+    load.add_argument('--duration', '-d', type=float, default=30.0, help="테스트 시간(초, 램프업 포함)")
+    load.add_argument('--ramp', type=float, default=5.0, help="램프업 시간(초)")
+    load.add_argument('--think-time', type=float, default=1.0, help="반복 사이 평균 대기 시간(초)")
+    load.add_argument('--latency-ms', type=float, default=0.0, help="대역 서버 응답 지연(ms)")
+    load.add_argument('--jitter-ms', type=float, default=0.0, help="대역 서버 응답 지연에 더할 무작위 시간(ms)")
+    load.add_argument('--error-rate', type=float, default=0.0, help="대역 서버 오류 주입 비율 (0~1)")
+    load.add_argument('--error-status', type=int, default=503, help="주입할 HTTP 상태 코드 (0이면 연결 끊기)")
+    load.add_argument('--no-second-factor', action='store_true', help="학생카드 2차 비밀번호 인증 생략")
+    load.add_argument('--key-pool', type=int, default=0, help="공유 SessionKeyPool 크기 (0이면 사용 안 함)")
+    load.add_argument('--seed', type=int, help="난수 시드")
+    load.add_argument('--json', action='store_true', help="표 대신 JSON 출력")
+    load.add_argument('--output', '-o', help="결과 JSON 저장 경로")
+    load.add_argument('--min-throughput', type=float, help="이 값(반복/초) 미만이면 종료 코드 1")
+    load.add_argument('--max-error-rate', type=float, help="이 값을 넘는 오류율이면 종료 코드 1")
+    load.set_defaults(func=cmd_load)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+MSI 조회 클라이언트
+==================
+StudentCard.fetch()와 StudentChangeLog.fetch()는 호출마다 MSI 로그인 전체(SSO 페이지, 세션키 생성,
+RSA/AES 암호화, 리다이렉트)를 수행합니다. MSIClient는 한 번 로그인한 세션으로 여러 정보를 조회합니다.
+
+- 첫 조회 때(또는 with 문 진입 시) 한 번만 로그인 (session_store가 있으면 저장된 세션을 먼저 사용)
+- CSRF 토큰은 로그인 최종 응답에서 얻은 것을 모든 조회가 공유 (csrf.CSRFTokenCache)
+- fetch_all()은 학생카드의 2차 비밀번호 인증(verifyPW)만 먼저 보낸 뒤, 서로 독립적인 조회 요청을 동시에 보냄
+- 저장된 세션이 만료되었으면(SessionExpiredError) 한 번만 다시 로그인하여 재시도
+
+사용 예:
+    with MSIClient(user_id, user_pw) as client:
+        card = client.student_card()
+        change_log = client.change_log()
+
+    with MSIClient(user_id, user_pw, session_store=SQLiteSessionStore('sessions.db', key)) as client:
+        results = client.fetch_all()   # {'student_card': StudentCard, 'change_log': StudentChangeLog}
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple, Type, TypeVar
+
+import requests
+
+from .abc import BaseFetcher
+from .csrf import CSRFTokenCache, default_csrf_cache
+from .exceptions import SessionExpiredError
+from .session_store import SessionStore
+from .sso import MJUSSOLogin
+from .student_card import StudentCard, _StudentCardFetcher
+from .student_changelog import StudentChangeLog, _StudentChangeLogFetcher
+from .utils import log_section, log_warning
+
+T = TypeVar('T')
+
+# fetch_all()이 조회하는 항목 (결과 딕셔너리의 키 -> fetcher)
+FETCHERS: Dict[str, Type[BaseFetcher]] = {
+    'student_card': _StudentCardFetcher,
+    'change_log': _StudentChangeLogFetcher,
+}
+
+
+class MSIClient:
+    """
+    MSI 로그인 1회로 여러 정보를 조회하는 클라이언트 (with 문으로 사용)
+
+    - session_store: 로그인 세션 저장소 (주어지면 저장된 세션을 먼저 사용하고, 새로 로그인하면 저장)
+    - csrf_cache: 세션별 CSRF 토큰 캐시 (None이면 프로세스 전역 캐시)
+    - **login_kwargs: MJUSSOLogin 생성 인자 (transport, key_pool, retry_policy 등)
+    """
+
+    SERVICE = 'msi'
+
+    def __init__(self, user_id: str, user_pw: str, verbose: bool = False,
+                 session_store: Optional[SessionStore] = None,
+                 csrf_cache: Optional[CSRFTokenCache] = None, **login_kwargs):
+        self.user_id = user_id
+        self.user_pw = user_pw
+        self.verbose = verbose
+        self.session_store = session_store
+        self.csrf_cache = csrf_cache or default_csrf_cache()
+        self._login_kwargs = login_kwargs
+        self._sso: Optional[MJUSSOLogin] = None
+        # 현재 세션이 저장소에서 복원한 것인지 (만료 시 다시 로그인할 대상)
+        self._restored = False
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "MSIClient":
+        self.login()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """로그인된 세션 (아직 로그인하지 않았으면 로그인)"""
+        return self.login()
+
+    def login(self) -> requests.Session:
+        """로그인된 세션을 반환합니다. 이미 로그인했으면 요청을 보내지 않습니다."""
+        return self._current()[0]
+
+    def _current(self) -> Tuple[requests.Session, bool]:
+        """(로그인된 세션, 저장소에서 복원한 세션인지)"""
+        with self._lock:
+            if self._sso is None:
+                self._sso = self._new_login(use_store=True)
+            return self._sso.session, self._restored
+
+    def close(self) -> None:
+        """
+        세션을 내려놓습니다. session_store가 있으면 조회 중 바뀐 쿠키까지 저장합니다.
+
+        세션의 연결 풀은 전송 계층(transport)이 다른 사용자와 공유하므로 닫지 않습니다.
+        """
+        with self._lock:
+            sso, self._sso = self._sso, None
+        if sso is not None:
+            if self.session_store is not None:
+                sso.save_session(self.session_store, self.SERVICE)
+            self.csrf_cache.invalidate(sso.session)
+
+    def student_card(self) -> StudentCard:
+        """학생카드 정보를 조회합니다."""
+        return self._fetch(_StudentCardFetcher)
+
+    def change_log(self) -> StudentChangeLog:
+        """학적변동내역을 조회합니다."""
+        return self._fetch(_StudentChangeLogFetcher)
+
+    def fetch_all(self) -> Dict[str, object]:
+        """
+        모든 항목을 동시에 조회합니다.
+
+        CSRF 토큰을 먼저 하나 확보하고(로그인 응답에서 얻었으면 요청 없음), 세션의 인증 상태를 바꾸는
+        학생카드 2차 비밀번호 인증(verifyPW)을 그다음에 혼자 보냅니다. 그 뒤의 항목별 조회 요청은 동시에 보냅니다.
+
+        Returns:
+            dict: {'student_card': StudentCard, 'change_log': StudentChangeLog}
+
+        Raises:
+            MyIWebError: 한 항목이라도 실패하면 그 예외 (문서 순서상 첫 번째)
+        """
+        if self.verbose:
+            log_section("MSI 전체 조회 (동시)")
+        self._with_session(lambda session: self._fetcher(_StudentCardFetcher, session).verify_password())
+
+        with ThreadPoolExecutor(max_workers=len(FETCHERS), thread_name_prefix='msi_client') as executor:
+            futures = {name: executor.submit(self._fetch, fetcher_cls) for name, fetcher_cls in FETCHERS.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+    def _fetcher(self, fetcher_cls: Type[BaseFetcher], session: requests.Session) -> BaseFetcher:
+        return fetcher_cls(session, self.user_pw, verbose=self.verbose,
+                           retry_policy=self._login_kwargs.get('retry_policy'), csrf_cache=self.csrf_cache)
+
+    def _fetch(self, fetcher_cls: Type[BaseFetcher]):
+        return self._with_session(lambda session: self._fetcher(fetcher_cls, session).fetch())
+
+    def _with_session(self, func: Callable[[requests.Session], T]) -> T:
+        """func(세션)을 실행하고, 저장소에서 복원한 세션이 만료되었으면 다시 로그인하여 한 번 더 실행"""
+        session, restored = self._current()
+        try:
+            return func(session)
+        except SessionExpiredError:
+            if not restored:
+                raise
+            if self.verbose:
+                log_warning("저장된 세션이 만료되었습니다. 다시 로그인합니다.")
+            return func(self._relogin(session))
+
+    def _relogin(self, expired: requests.Session) -> requests.Session:
+        """만료된 세션을 새 로그인으로 교체 (동시에 만료를 발견한 다른 조회는 교체된 세션을 사용)"""
+        with self._lock:
+            if self._sso is None or self._sso.session is expired:
+                if self.session_store is not None:
+                    self.session_store.delete(self.user_id, self.SERVICE)
+                self._sso = self._new_login(use_store=False)
+            return self._sso.session
+
+    def _new_login(self, use_store: bool) -> MJUSSOLogin:
+        """저장된 세션을 불러오거나 새로 로그인합니다. (self._lock 안에서 호출)"""
+        sso = MJUSSOLogin(self.user_id, self.user_pw, verbose=self.verbose, csrf_cache=self.csrf_cache,
+                          **self._login_kwargs)
+        if use_store and self.session_store is not None and sso.restore_session(self.session_store, self.SERVICE):
+            self._restored = True
+            return sso
+
+        sso.login(self.SERVICE)
+        self._restored = False
+        if self.session_store is not None:
+            sso.save_session(self.session_store, self.SERVICE)
+        return sso
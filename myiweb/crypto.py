@@ -7,18 +7,152 @@ JavaScript 원본 (bandiJS):
 - genKey(length): 세션키 생성 + PBKDF2로 AES 키 파생
 - encryptJavaPKI(data): RSA로 암호화
 - encryptBase64AES(data, keyInfo): AES로 암호화
+
+RSA 공개키는 로그인마다 거의 바뀌지 않으므로, 파싱된 키 객체를
+PublicKeyCache에 보관하여 재사용합니다.
+세션키는 SessionKeyPool을 사용하면 백그라운드 스레드에서 미리 생성해 둘 수 있습니다.
+실제 KDF/RSA/AES 연산은 crypto_backends.get_backend()가 선택한 백엔드가 수행합니다.
 """
 
 import base64
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional
+
+from .crypto_backends import get_backend
+from .utils import Colors, log_info, log_warning
+
+
+class PublicKeyCache:
+    """
+    파싱된 RSA 공개키 객체 캐시 (스레드 안전 LRU)
+
+    SSO 로그인 페이지에서 추출한 Base64 공개키 문자열의 SHA-256 다이제스트를
+    키로 사용하며, 로드된 키 객체를 보관합니다. 키 객체를 만든 주체(owner, RSA 백엔드 등)를
+    함께 기록하여 다른 주체의 조회는 적중으로 세지 않습니다.
+
+    - maxsize: 보관할 최대 키 개수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+    - ttl: 항목 유효 시간(초). None이면 만료되지 않음
+    """
+
+    def __init__(self, maxsize: int = 8, ttl: Optional[float] = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _digest(public_key_str: str) -> str:
+        return hashlib.sha256(public_key_str.encode('utf-8')).hexdigest()
+
+    def get(self, public_key_str: str, owner=None):
+        """
+        캐시된 키 객체를 반환합니다. 없거나 만료되었으면 None을 반환합니다.
+
+        Args:
+            owner: 주어지면 이 주체가 저장한 항목만 반환 (다르면 실패로 집계)
+        """
+        digest = self._digest(public_key_str)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            key_obj, loaded_at, entry_owner = entry
+            if self.ttl is not None and now - loaded_at > self.ttl:
+                del self._entries[digest]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            if owner is not None and entry_owner is not owner:
+                # 다른 백엔드가 만든 키 객체 - put()으로 교체될 항목
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return key_obj
+
+    def put(self, public_key_str: str, key_obj, owner=None) -> None:
+        """키 객체를 캐시에 저장합니다. (owner: 키 객체를 만든 주체)"""
+        digest = self._digest(public_key_str)
+
+        with self._lock:
+            self._entries[digest] = (key_obj, time.monotonic(), owner)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, public_key_str: Optional[str] = None) -> None:
+        """
+        캐시 항목을 제거합니다.
+
+        Args:
+            public_key_str: 제거할 공개키. None이면 전체 캐시를 비웁니다.
+        """
+        with self._lock:
+            if public_key_str is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self._digest(public_key_str), None)
 
-from cryptography.hazmat.primitives import serialization, hashes
-from cryptography.hazmat.primitives.asymmetric import padding
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.backends import default_backend
+    def stats(self) -> dict:
+        """캐시 적중/실패 통계를 반환합니다."""
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
 
-from .utils import Colors, log_info
+
+# 모듈 전역 공개키 캐시 (encrypt_with_rsa에서 사용)
+public_key_cache = PublicKeyCache()
+
+
+def load_public_key(public_key_str: str):
+    """
+    Base64 공개키 문자열을 RSA 키 객체로 로드합니다 (캐시 사용).
+
+    Args:
+        public_key_str: Base64로 인코딩된 RSA 공개키
+
+    Returns:
+        선택된 RSA 백엔드의 키 객체
+    """
+    rsa_backend = get_backend().rsa
+    # 백엔드가 바뀐 경우(set_backend) 이전 백엔드의 키 객체는 사용할 수 없으므로 실패로 집계
+    rsa_key = public_key_cache.get(public_key_str, owner=rsa_backend)
+    if rsa_key is not None:
+        return rsa_key
+
+    # Base64 -> DER(SubjectPublicKeyInfo) 로드 (PEM 문자열 조립 불필요)
+    rsa_key = rsa_backend.load_rsa_public_key(base64.b64decode(public_key_str))
+    public_key_cache.put(public_key_str, rsa_key, owner=rsa_backend)
+    return rsa_key
+
+
+def invalidate_public_key_cache(public_key_str: Optional[str] = None) -> None:
+    """
+    공개키 캐시를 무효화합니다. (서버 키 교체 시 호출)
+
+    Args:
+        public_key_str: 제거할 공개키. None이면 전체 캐시를 비웁니다.
+    """
+    public_key_cache.invalidate(public_key_str)
 
 
 def generate_session_key(length: int = 32) -> dict:
@@ -48,14 +182,8 @@ def generate_session_key(length: int = 32) -> dict:
     salt = key_str[-16:]
     
     # PBKDF2로 키 파생 (iterations=1024, dkLen=length)
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA1(),  # forge.pkcs5.pbkdf2 기본값은 SHA1
-        length=length,
-        salt=salt.encode('utf-8'),
-        iterations=1024,
-        backend=default_backend()
-    )
-    key_bytes = kdf.derive(key_str.encode('utf-8'))
+    # forge.pkcs5.pbkdf2 기본값은 SHA1
+    key_bytes = get_backend().pbkdf2_sha1(key_str.encode('utf-8'), salt.encode('utf-8'), 1024, length)
     
     # IV = 키의 마지막 16바이트
     iv_bytes = key_bytes[-16:]
@@ -67,6 +195,169 @@ def generate_session_key(length: int = 32) -> dict:
     }
 
 
+def _generate_session_key_batch(count: int, length: int) -> List[dict]:
+    """count개의 세션키를 순차적으로 생성합니다. (작업자 단위 실행용)"""
+    return [generate_session_key(length) for _ in range(count)]
+
+
+def generate_session_keys(n: int, length: int = 32, workers: Optional[int] = None,
+                          use_processes: bool = False) -> List[dict]:
+    """
+    세션키 n개를 여러 코어에서 병렬로 생성합니다.
+
+    cryptography/hashlib의 PBKDF2는 파생 중 GIL을 해제하므로 기본값인 스레드 풀로도
+    코어 수만큼 확장됩니다. pycryptodome 백엔드가 선택된 경우에는 GIL이 해제되지 않으므로
+    use_processes=True로 프로세스 풀을 사용하세요.
+
+    Args:
+        n: 생성할 세션키 개수
+        length: 파생 키 길이 (바이트)
+        workers: 작업자 수 (None이면 os.cpu_count())
+        use_processes: 프로세스 풀 사용 여부
+
+    Returns:
+        list: generate_session_key() 결과 dict의 리스트 (길이 n)
+    """
+    if n <= 0:
+        return []
+
+    workers = min(workers or os.cpu_count() or 1, n)
+    if workers == 1:
+        return _generate_session_key_batch(n, length)
+
+    # 작업자마다 한 덩어리씩 배분하여 작업 제출 오버헤드를 줄임
+    base, extra = divmod(n, workers)
+    counts = [base + (1 if i < extra else 0) for i in range(workers)]
+
+    executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_cls(max_workers=workers) as executor:
+        batches = executor.map(_generate_session_key_batch, counts, [length] * workers)
+        return [key_info for batch in batches for key_info in batch]
+
+
+class SessionKeyPool:
+    """
+    미리 생성된 세션키 풀 (선택 사항)
+
+    백그라운드 스레드가 generate_session_key() 결과를 미리 만들어 두고,
+    get() 호출 시 하나씩 꺼내 줍니다. 꺼낸 키는 풀에서 제거되므로
+    같은 키가 두 번 사용되지 않습니다.
+
+    - low_watermark: 남은 키가 이 값 이하로 떨어지면 보충을 시작
+    - high_watermark: 보충 시 이 개수까지 채움
+    - 풀이 비어 있으면 호출 스레드에서 동기적으로 키를 생성합니다.
+    - 보충 중 예외는 경고로 출력하고 stats()의 fill_errors에 기록하며, 보충 스레드는 계속 동작합니다.
+
+    사용 예:
+        with SessionKeyPool(low_watermark=4, high_watermark=16) as pool:
+            sso = MJUSSOLogin(user_id, user_pw, key_pool=pool)
+            sso.login('msi')
+    """
+
+    def __init__(self, length: int = 32, low_watermark: int = 4, high_watermark: int = 16,
+                 start: bool = True):
+        if not 0 <= low_watermark < high_watermark:
+            raise ValueError("low_watermark는 0 이상, high_watermark 미만이어야 합니다.")
+
+        self.length = length
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.hits = 0
+        self.misses = 0
+        # 백그라운드 보충 중 발생한 예외 수와 마지막 예외 (보충 스레드는 계속 동작)
+        self.fill_errors = 0
+        self.last_fill_error: Optional[BaseException] = None
+
+        self._keys: deque = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        if start:
+            self.start()
+
+    def start(self) -> None:
+        """백그라운드 보충 스레드를 시작합니다."""
+        if self._thread is not None:
+            return
+        self._closed = False
+        self._thread = threading.Thread(target=self._fill_loop, name="SessionKeyPool", daemon=True)
+        self._thread.start()
+        self._wakeup.set()
+
+    def close(self) -> None:
+        """보충 스레드를 종료하고 남은 키를 폐기합니다."""
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._keys.clear()
+
+    def __enter__(self) -> "SessionKeyPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get(self) -> dict:
+        """
+        세션키 하나를 꺼냅니다. (한 번 꺼낸 키는 다시 반환되지 않음)
+
+        Returns:
+            dict: { 'keyStr': str, 'key': bytes, 'iv': bytes }
+        """
+        with self._lock:
+            try:
+                # 꺼낸 키는 풀에서 제거되므로 여러 스레드가 같은 키를 받지 않음
+                key_info = self._keys.popleft()
+                self.hits += 1
+            except IndexError:
+                key_info = None
+                self.misses += 1
+
+        if len(self._keys) <= self.low_watermark:
+            self._wakeup.set()
+
+        if key_info is None:
+            # 풀이 비어 있으면 동기적으로 생성
+            key_info = generate_session_key(self.length)
+        return key_info
+
+    def stats(self) -> dict:
+        """풀 상태 및 적중/실패 통계를 반환합니다."""
+        with self._lock:
+            return {
+                'size': len(self._keys),
+                'low_watermark': self.low_watermark,
+                'high_watermark': self.high_watermark,
+                'hits': self.hits,
+                'misses': self.misses,
+                'fill_errors': self.fill_errors,
+                'last_fill_error': repr(self.last_fill_error) if self.last_fill_error else None,
+            }
+
+    def _fill_loop(self) -> None:
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._closed:
+                return
+            try:
+                while not self._closed and len(self._keys) < self.high_watermark:
+                    self._keys.append(generate_session_key(self.length))
+            except Exception as e:
+                # 보충을 멈추고 다음 get()의 깨우기를 기다림 (그동안 get()은 동기적으로 생성)
+                with self._lock:
+                    self.fill_errors += 1
+                    self.last_fill_error = e
+                log_warning(f"SessionKeyPool 보충 실패: {e!r}")
+
+
 def encrypt_with_rsa(data: str, public_key_str: str, verbose: bool = False) -> str:
     """
     RSA-PKCS1-v1.5로 데이터 암호화 (JavaScript bandiJS.encryptJavaPKI 대응)
@@ -83,20 +374,14 @@ def encrypt_with_rsa(data: str, public_key_str: str, verbose: bool = False) -> s
         print(f"\n{Colors.CYAN}    [RSA 암호화 과정]{Colors.END}")
         log_info("Input Data", f"{data[:30]}..." if len(data) > 30 else data, 6)
     
-    # PEM 형식으로 변환
-    pem_key = f"-----BEGIN PUBLIC KEY-----\n{public_key_str}\n-----END PUBLIC KEY-----"
-    
-    # RSA 키 로드 (cryptography)
-    rsa_key = serialization.load_pem_public_key(pem_key.encode('utf-8'), backend=default_backend())
+    # RSA 키 로드 (캐시된 키 객체 재사용)
+    rsa_key = load_public_key(public_key_str)
     
     if verbose:
-        log_info("RSA Key Size", f"{rsa_key.key_size} bits", 6)
+        log_info("RSA Key Size", f"{get_backend().rsa_key_size(rsa_key)} bits", 6)
     
     # PKCS1_v1_5 암호화 (Java 호환)
-    encrypted = rsa_key.encrypt(
-        data.encode('utf-8'),
-        padding.PKCS1v15()
-    )
+    encrypted = get_backend().rsa_pkcs1v15_encrypt(rsa_key, data.encode('utf-8'))
     result = base64.b64encode(encrypted).decode('utf-8')
     
     if verbose:
@@ -152,10 +437,8 @@ def encrypt_with_aes(plain_text: str, key_info: dict, verbose: bool = False) ->
     padding_len = block_size - (len(input_data) % block_size)
     padded = input_data + bytes([padding_len] * padding_len)
     
-    # AES-CBC 암호화 (cryptography)
-    cipher = Cipher(algorithms.AES(key_bytes), modes.CBC(iv_bytes), backend=default_backend())
-    encryptor = cipher.encryptor()
-    encrypted = encryptor.update(padded) + encryptor.finalize()
+    # AES-CBC 암호화
+    encrypted = get_backend().aes_cbc_encrypt(key_bytes, iv_bytes, padded)
     
     result = base64.b64encode(encrypted).decode('utf-8')
     
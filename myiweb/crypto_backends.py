@@ -0,0 +1,334 @@
+"""
+암호화 백엔드 계층
+=================
+SSO 로그인에 필요한 세 가지 연산(PBKDF2-SHA1, RSA-PKCS1-v1.5, AES-CBC)을
+여러 라이브러리로 구현하고, 처음 사용할 때 짧은 측정(calibration)을 거쳐
+연산별로 가장 빠른 구현을 선택합니다.
+
+구현체:
+- cryptography: KDF, RSA, AES
+- pycryptodome: KDF, RSA, AES
+- hashlib (표준 라이브러리): KDF(pbkdf2_hmac)만 지원
+
+인터페이스는 연산별로 나뉘어 있습니다(KDFBackend, RSABackend, AESBackend). 세 연산을 모두
+구현한 백엔드는 CryptoBackend를, 일부만 구현한 백엔드는 해당 인터페이스만 상속합니다.
+
+myiweb.crypto와 myiweb_logger.crypto 모두 get_backend()를 통해 같은 경로를 사용합니다.
+환경변수 MYIWEB_CRYPTO_BACKEND로 특정 백엔드를 강제할 수 있습니다.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Union
+
+
+# 측정용 샘플 공개키 (명지대 SSO 로그인 페이지에서 수집한 2048bit 키, doc/mju_sso_login.md 참고)
+_CALIBRATION_PUBLIC_KEY = (
+    "MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEAiLpIB1g9KmkaslpEvZ89iClfGpznC+IavVT7a0/H1LrLBZRp"
+    "MWCwWW2YLj+gsPKnQvq3ZYYCn6AJ3mjz6/Y2JtvYbEt4rn1eT5nqMA58KTEgxjOaK4nrVNQ7OPYS4dlOaVJOu77JLizc"
+    "OzRD61aiPgkqvJANsSV2tWJ82afLeX/6vmiuUd5wczB9XFhhgyfYAmExAQMmubgjmoIPXrF0wYpxbQYrXjzGBuSkv9jb"
+    "s1kHLPWEXVtxE7IbJtLRoBDqbNyELzL8u43gBL3ncjY5P0hV9SeLvbJAcZTRGPHYHePiaayplHiLn9HdoBHYE3rxa6D+"
+    "n1QESEhVCTFbGVrdEQIDAQAB"
+)
+
+# 지원 연산 이름
+KDF = 'kdf'
+RSA = 'rsa'
+AES = 'aes'
+
+
+class KDFBackend(ABC):
+    """KDF(PBKDF2-SHA1) 백엔드 인터페이스"""
+
+    name: str = ''
+    capabilities: frozenset = frozenset({KDF})
+
+    @abstractmethod
+    def pbkdf2_sha1(self, password: bytes, salt: bytes, iterations: int, length: int) -> bytes:
+        """PBKDF2-HMAC-SHA1로 키를 파생합니다."""
+        raise NotImplementedError
+
+
+class RSABackend(ABC):
+    """RSA-PKCS1-v1.5 백엔드 인터페이스"""
+
+    name: str = ''
+    capabilities: frozenset = frozenset({RSA})
+
+    @abstractmethod
+    def load_rsa_public_key(self, der: bytes):
+        """DER(SubjectPublicKeyInfo) 공개키를 백엔드 고유의 키 객체로 로드합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def rsa_key_size(self, key) -> int:
+        """키 길이(bit)를 반환합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def rsa_pkcs1v15_encrypt(self, key, data: bytes) -> bytes:
+        """RSA-PKCS1-v1.5로 암호화합니다."""
+        raise NotImplementedError
+
+
+class AESBackend(ABC):
+    """AES-CBC 백엔드 인터페이스"""
+
+    name: str = ''
+    capabilities: frozenset = frozenset({AES})
+
+    @abstractmethod
+    def aes_cbc_encrypt(self, key: bytes, iv: bytes, data: bytes) -> bytes:
+        """AES-CBC로 암호화합니다. (data는 이미 블록 크기에 맞게 패딩되어 있어야 함)"""
+        raise NotImplementedError
+
+
+class CryptoBackend(KDFBackend, RSABackend, AESBackend):
+    """세 연산을 모두 구현하는 암호화 백엔드 인터페이스"""
+
+    capabilities: frozenset = frozenset({KDF, RSA, AES})
+
+
+class CryptographyBackend(CryptoBackend):
+    """cryptography (OpenSSL) 기반 백엔드"""
+
+    name = 'cryptography'
+
+    def __init__(self):
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import padding
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+        self._hashes = hashes
+        self._serialization = serialization
+        self._padding = padding
+        self._Cipher = Cipher
+        self._algorithms = algorithms
+        self._modes = modes
+        self._PBKDF2HMAC = PBKDF2HMAC
+
+    def pbkdf2_sha1(self, password: bytes, salt: bytes, iterations: int, length: int) -> bytes:
+        kdf = self._PBKDF2HMAC(
+            algorithm=self._hashes.SHA1(),
+            length=length,
+            salt=salt,
+            iterations=iterations,
+        )
+        return kdf.derive(password)
+
+    def load_rsa_public_key(self, der: bytes):
+        return self._serialization.load_der_public_key(der)
+
+    def rsa_key_size(self, key) -> int:
+        return key.key_size
+
+    def rsa_pkcs1v15_encrypt(self, key, data: bytes) -> bytes:
+        return key.encrypt(data, self._padding.PKCS1v15())
+
+    def aes_cbc_encrypt(self, key: bytes, iv: bytes, data: bytes) -> bytes:
+        encryptor = self._Cipher(self._algorithms.AES(key), self._modes.CBC(iv)).encryptor()
+        return encryptor.update(data) + encryptor.finalize()
+
+
+class PycryptodomeBackend(CryptoBackend):
+    """pycryptodome 기반 백엔드"""
+
+    name = 'pycryptodome'
+
+    def __init__(self):
+        from Crypto.Cipher import AES as _AES, PKCS1_v1_5
+        from Crypto.Hash import SHA1
+        from Crypto.Protocol.KDF import PBKDF2
+        from Crypto.PublicKey import RSA as _RSA
+
+        self._AES = _AES
+        self._PKCS1_v1_5 = PKCS1_v1_5
+        self._SHA1 = SHA1
+        self._PBKDF2 = PBKDF2
+        self._RSA = _RSA
+
+    def pbkdf2_sha1(self, password: bytes, salt: bytes, iterations: int, length: int) -> bytes:
+        return self._PBKDF2(password, salt, dkLen=length, count=iterations, hmac_hash_module=self._SHA1)
+
+    def load_rsa_public_key(self, der: bytes):
+        # 키 객체와 함께 cipher 객체를 만들어 두어 암호화마다 재생성하지 않음
+        key = self._RSA.import_key(der)
+        return key, self._PKCS1_v1_5.new(key)
+
+    def rsa_key_size(self, key) -> int:
+        return key[0].size_in_bits()
+
+    def rsa_pkcs1v15_encrypt(self, key, data: bytes) -> bytes:
+        return key[1].encrypt(data)
+
+    def aes_cbc_encrypt(self, key: bytes, iv: bytes, data: bytes) -> bytes:
+        return self._AES.new(key, self._AES.MODE_CBC, iv).encrypt(data)
+
+
+class HashlibBackend(KDFBackend):
+    """표준 라이브러리 hashlib 기반 백엔드 (KDF 전용)"""
+
+    name = 'hashlib'
+
+    def pbkdf2_sha1(self, password: bytes, salt: bytes, iterations: int, length: int) -> bytes:
+        return hashlib.pbkdf2_hmac('sha1', password, salt, iterations, length)
+
+
+class SelectedBackend(CryptoBackend):
+    """연산별로 선택된 백엔드에 위임하는 복합 백엔드"""
+
+    name = 'selected'
+
+    def __init__(self, kdf: KDFBackend, rsa: RSABackend, aes: AESBackend):
+        self.kdf = kdf
+        self.rsa = rsa
+        self.aes = aes
+        self.name = f"kdf={kdf.name}, rsa={rsa.name}, aes={aes.name}"
+
+    def pbkdf2_sha1(self, password: bytes, salt: bytes, iterations: int, length: int) -> bytes:
+        return self.kdf.pbkdf2_sha1(password, salt, iterations, length)
+
+    def load_rsa_public_key(self, der: bytes):
+        return self.rsa.load_rsa_public_key(der)
+
+    def rsa_key_size(self, key) -> int:
+        return self.rsa.rsa_key_size(key)
+
+    def rsa_pkcs1v15_encrypt(self, key, data: bytes) -> bytes:
+        return self.rsa.rsa_pkcs1v15_encrypt(key, data)
+
+    def aes_cbc_encrypt(self, key: bytes, iv: bytes, data: bytes) -> bytes:
+        return self.aes.aes_cbc_encrypt(key, iv, data)
+
+
+# 백엔드 이름 -> 클래스 (우선순위 순). 인스턴스는 KDFBackend/RSABackend/AESBackend 중
+# 구현한 인터페이스만 상속하며, capabilities로 지원 연산을 확인합니다.
+Backend = Union[KDFBackend, RSABackend, AESBackend]
+
+BACKENDS: Dict[str, Callable[[], Backend]] = {
+    'cryptography': CryptographyBackend,
+    'pycryptodome': PycryptodomeBackend,
+    'hashlib': HashlibBackend,
+}
+
+_selected: Optional[SelectedBackend] = None
+_lock = threading.Lock()
+
+
+def available_backends() -> List[Backend]:
+    """현재 환경에서 import 가능한 백엔드 인스턴스 목록을 반환합니다."""
+    backends = []
+    for factory in BACKENDS.values():
+        try:
+            backends.append(factory())
+        except ImportError:
+            continue
+    return backends
+
+
+def _time_op(func: Callable[[], object], rounds: int) -> float:
+    """func를 rounds회 실행한 시간(초)을 반환합니다."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return time.perf_counter() - start
+
+
+def calibrate(backends: Optional[List[Backend]] = None) -> Dict[str, Dict[str, float]]:
+    """
+    각 백엔드의 연산별 소요 시간을 짧게 측정합니다.
+
+    Returns:
+        dict: { 연산: { 백엔드 이름: 소요 시간(초) } }
+    """
+    import base64
+
+    backends = backends if backends is not None else available_backends()
+    der = base64.b64decode(_CALIBRATION_PUBLIC_KEY)
+    key = os.urandom(32)
+    iv = key[-16:]
+    block = os.urandom(64)
+    results: Dict[str, Dict[str, float]] = {KDF: {}, RSA: {}, AES: {}}
+
+    for backend in backends:
+        if KDF in backend.capabilities:
+            backend.pbkdf2_sha1(b'warmup', b'salt', 1024, 32)
+            results[KDF][backend.name] = _time_op(
+                lambda: backend.pbkdf2_sha1(block, block[-16:], 1024, 32), 10)
+        if RSA in backend.capabilities:
+            rsa_key = backend.load_rsa_public_key(der)
+            backend.rsa_pkcs1v15_encrypt(rsa_key, b'warmup')
+            results[RSA][backend.name] = _time_op(
+                lambda: backend.rsa_pkcs1v15_encrypt(rsa_key, block[:48]), 10)
+        if AES in backend.capabilities:
+            backend.aes_cbc_encrypt(key, iv, block)
+            results[AES][backend.name] = _time_op(
+                lambda: backend.aes_cbc_encrypt(key, iv, block), 100)
+
+    return results
+
+
+def select_backend(backends: Optional[List[Backend]] = None) -> SelectedBackend:
+    """측정 결과를 바탕으로 연산별 가장 빠른 백엔드를 조합합니다."""
+    backends = backends if backends is not None else available_backends()
+    by_name = {backend.name: backend for backend in backends}
+    timings = calibrate(backends)
+
+    chosen = {}
+    for op, op_timings in timings.items():
+        if not op_timings:
+            raise ImportError(f"'{op}' 연산을 지원하는 암호화 라이브러리가 없습니다. (cryptography 또는 pycryptodome 필요)")
+        chosen[op] = by_name[min(op_timings, key=op_timings.get)]
+
+    return SelectedBackend(kdf=chosen[KDF], rsa=chosen[RSA], aes=chosen[AES])
+
+
+def get_backend() -> CryptoBackend:
+    """
+    현재 사용할 백엔드를 반환합니다.
+    처음 호출될 때 한 번만 측정하여 선택하며, 이후에는 같은 객체를 반환합니다.
+    """
+    global _selected
+    if _selected is not None:
+        return _selected
+
+    with _lock:
+        if _selected is None:
+            forced = os.getenv('MYIWEB_CRYPTO_BACKEND', '').strip()
+            if forced:
+                _selected = _force(forced)
+            else:
+                _selected = select_backend()
+    return _selected
+
+
+def set_backend(name: Optional[str]) -> CryptoBackend:
+    """
+    백엔드를 명시적으로 지정합니다.
+
+    Args:
+        name: 'cryptography', 'pycryptodome' 등 BACKENDS의 키. None이면 다시 자동 선택합니다.
+    """
+    global _selected
+    with _lock:
+        _selected = _force(name) if name else select_backend()
+    return _selected
+
+
+def _force(name: str) -> SelectedBackend:
+    if name not in BACKENDS:
+        raise ValueError(f"알 수 없는 암호화 백엔드: {name} (지원: {', '.join(BACKENDS)})")
+    backend = BACKENDS[name]()
+    if isinstance(backend, CryptoBackend):
+        return SelectedBackend(kdf=backend, rsa=backend, aes=backend)
+    # 일부 연산만 구현한 백엔드(hashlib: KDF 전용)는 나머지 연산을 자동 선택된 백엔드로 보완
+    fallback = select_backend([b for b in available_backends() if b.name != name])
+    return SelectedBackend(
+        kdf=backend if KDF in backend.capabilities else fallback.kdf,
+        rsa=backend if RSA in backend.capabilities else fallback.rsa,
+        aes=backend if AES in backend.capabilities else fallback.aes,
+    )
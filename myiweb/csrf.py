@@ -0,0 +1,89 @@
+"""
+MSI CSRF 토큰 캐시
+=================
+MSI의 CSRF 토큰은 서버 세션(JSESSIONID)마다 하나이므로, 같은 requests.Session으로
+여러 조회를 하면 같은 토큰을 계속 사용할 수 있습니다. 조회(fetcher)마다 MySecurityStart
+페이지를 다시 받아 토큰을 찾는 대신 세션별로 토큰을 기억합니다.
+
+- 로그인 최종 응답(index_Myiweb.jsp)에 토큰이 있으면 로그인 직후 바로 기억 (GET 생략)
+- 캐시에 없을 때만 MySecurityStart를 GET
+- 조회 POST가 403이거나 sso.mju.ac.kr로 리다이렉트되면 토큰을 버리고 새로 받아 한 번 더 요청
+- 세션 객체가 사라지면 항목도 함께 사라짐 (약한 참조)
+
+사용 예:
+    cache = CSRFTokenCache()
+    sso = MJUSSOLogin(user_id, user_pw, csrf_cache=cache)
+    session = sso.login('msi')                                     # 최종 응답에서 토큰 기억
+    _StudentCardFetcher(session, user_pw, csrf_cache=cache).fetch()       # GET 없이 토큰 사용
+    _StudentChangeLogFetcher(session, user_pw, csrf_cache=cache).fetch()  # 〃
+"""
+
+import threading
+import weakref
+from typing import Optional
+
+import requests
+
+
+class CSRFTokenCache:
+    """
+    세션별 MSI CSRF 토큰 (스레드 안전)
+
+    키는 requests.Session 객체 자체입니다. (저장소에서 복원한 새 Session은 새 항목)
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._tokens: "weakref.WeakKeyDictionary[requests.Session, str]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, session: requests.Session) -> Optional[str]:
+        with self._lock:
+            token = self._tokens.get(session)
+            if token is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return token
+
+    def put(self, session: requests.Session, token: str) -> None:
+        with self._lock:
+            self._tokens[session] = token
+
+    def invalidate(self, session: requests.Session, token: Optional[str] = None) -> None:
+        """
+        세션의 토큰을 버립니다.
+
+        Args:
+            token: 주어지면 저장된 토큰이 이 값일 때만 버림
+                (다른 스레드가 이미 새 토큰으로 바꿔 둔 경우 유지)
+        """
+        with self._lock:
+            if token is None or self._tokens.get(session) == token:
+                if self._tokens.pop(session, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'size': len(self._tokens), 'hits': self.hits, 'misses': self.misses,
+                    'invalidations': self.invalidations}
+
+
+_default_cache: Optional[CSRFTokenCache] = None
+_default_lock = threading.Lock()
+
+
+def default_csrf_cache() -> CSRFTokenCache:
+    """프로세스 전역 기본 캐시"""
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = CSRFTokenCache()
+    return _default_cache
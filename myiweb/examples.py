@@ -16,7 +16,7 @@ from dotenv import load_dotenv
 # 모듈 경로 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from myiweb import StudentCard, StudentChangeLog, MyIWebError
+from myiweb import MSIClient, MyIWebError
 from myiweb.sso import MJUSSOLogin
 from myiweb.utils import log_info, log_success, log_error
 
@@ -37,17 +37,19 @@ def example_high_level():
         return
     
     try:
-        # 1. 학생카드 정보 조회 (로그인부터 모든 과정 포함)
-        log_info("API Call", "StudentCard.fetch(user_id, user_pw) 호출...")
-        student_card = StudentCard.fetch(user_id, user_pw, verbose=False)
-        log_success("학생카드 정보 조회 성공!")
-        print("\n--- 학생카드 JSON 출력 ---")
-        print(json.dumps(student_card.to_dict(), ensure_ascii=False, indent=2))
-        
-        # 2. 학적변동내역 정보 조회
-        log_info("API Call", "StudentChangeLog.fetch(user_id, user_pw) 호출...")
-        change_log = StudentChangeLog.fetch(user_id, user_pw, verbose=False)
-        log_success("학적변동내역 정보 조회 성공!")
+        # MSI 로그인은 with 문 진입 시 한 번만 수행하고, 두 조회가 같은 세션을 사용
+        with MSIClient(user_id, user_pw, verbose=False) as client:
+            # 1. 학생카드 정보 조회
+            log_info("API Call", "client.student_card() 호출...")
+            student_card = client.student_card()
+            log_success("학생카드 정보 조회 성공!")
+            print("\n--- 학생카드 JSON 출력 ---")
+            print(json.dumps(student_card.to_dict(), ensure_ascii=False, indent=2))
+
+            # 2. 학적변동내역 정보 조회 (fetch_all()을 쓰면 2차 비밀번호 인증 후 두 조회를 동시에 요청)
+            log_info("API Call", "client.change_log() 호출...")
+            change_log = client.change_log()
+            log_success("학적변동내역 정보 조회 성공!")
         print("\n--- 학적변동내역 JSON 출력 ---")
         print(json.dumps(change_log.to_dict(), ensure_ascii=False, indent=2))
         print("---------------------------\n")
@@ -80,7 +82,72 @@ def example_services():
             log_error(f"✗ {service} 로그인 실패: {e}")
 
 
+def example_login_many():
+    """한 번의 자격 증명 확인으로 여러 서비스에 동시 로그인하는 예제"""
+    print("\n=== 여러 서비스 동시 로그인 예제 (login_many) ===\n")
+    load_dotenv()
+
+    user_id = os.getenv('MJU_ID')
+    user_pw = os.getenv('MJU_PW')
+
+    if not user_id or not user_pw:
+        log_error("Skipping login_many example: .env 파일에 MJU_ID와 MJU_PW를 설정해주세요.")
+        return
+
+    try:
+        sso = MJUSSOLogin(user_id, user_pw, verbose=False)
+        # 'msi'만 자격 증명으로 로그인하고 나머지는 SSO 세션으로 동시에 인가
+        results = sso.login_many(['msi', 'lms', 'portal', 'myicap', 'library'], return_exceptions=True)
+    except MyIWebError as e:
+        log_error(f"로그인 실패: {e}")
+        return
+
+    for service, result in results.items():
+        if isinstance(result, MyIWebError):
+            log_error(f"✗ {service} 로그인 실패: {result}")
+        else:
+            log_success(f"✓ {service} 로그인 성공")
+
+
+def example_async():
+    """비동기(asyncio) 로그인 예제 - 여러 서비스에 동시에 로그인"""
+    print("\n=== 비동기 로그인 예제 (httpx 필요) ===\n")
+    load_dotenv()
+
+    user_id = os.getenv('MJU_ID')
+    user_pw = os.getenv('MJU_PW')
+
+    if not user_id or not user_pw:
+        log_error("Skipping async example: .env 파일에 MJU_ID와 MJU_PW를 설정해주세요.")
+        return
+
+    import asyncio
+    try:
+        from myiweb.aio_sso import AsyncMJUSSOLogin
+    except ImportError as e:
+        # 선택 의존성 httpx가 없으면 건너뜀
+        log_error(f"Skipping async example: {e}")
+        return
+
+    async def login_one(service: str) -> str:
+        async with AsyncMJUSSOLogin(user_id, user_pw, verbose=False) as sso:
+            try:
+                await sso.login(service=service)
+                return f"✓ {service} 로그인 성공"
+            except MyIWebError as e:
+                return f"✗ {service} 로그인 실패: {e}"
+
+    async def main():
+        results = await asyncio.gather(*(login_one(s) for s in ['lms', 'portal', 'msi']))
+        for line in results:
+            print(line)
+
+    asyncio.run(main())
+
+
 if __name__ == "__main__":
     example_high_level()
     example_services()
+    example_login_many()
+    example_async()
 
@@ -0,0 +1,228 @@
+"""
+로그인 후 이동 단계(hop) 모델
+============================
+SSO 로그인 POST 이후 서비스 페이지에 도착하기까지의 이동 과정을 단계(hop)로 다룹니다.
+
+    SSO POST ─(302)→ redirect_uri?code=...          # 코드 교환 (HTTP 리다이렉트)
+             ─(JS 폼 자동 제출)→ /servlet/login_security
+             ─(location.href)→ /index_Myiweb.jsp      # 대상 페이지
+
+HopModel은 서비스별로 성공한 로그인의 JS 이동 경로(종류 + URL)를 기록하고, 같은 경로가
+연속으로 확인되면 이를 확정(learned)합니다. 확정된 뒤에는
+- 각 단계에서 예상된 종류의 매처 하나만 실행하고 (폼 단계에서 리다이렉트 검색 생략 등)
+- 마지막 단계 이후에는 대상 페이지에 도착했는지 URL만 확인하고 종료합니다.
+예상과 다른 응답이 오면(대상 페이지가 아닌 곳에서 경로가 끝난 경우 포함) 그 로그인은 기존의
+일반 탐지로 되돌아가며, 다른 경로로 성공한 로그인이 관측되면 모델을 다시 학습합니다.
+
+학습에는 대상 페이지(서비스의 test_url)에 2xx로 도착한 로그인만 사용합니다. (reached_target)
+중간 단계의 5xx 오류 페이지도 서비스 도메인이면 로그인 판정은 성공일 수 있으므로,
+이런 로그인으로 잘린 경로를 확정하지 않기 위함입니다.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from .parsing import DEFAULT_CHARSET, extract_form, find_js_form, find_js_redirect
+
+# 로그인 POST 이후 따라갈 JS 이동의 최대 횟수 (MSI 로그인에 필요한 실제 횟수)
+MAX_HOPS = 3
+
+# 동일한 경로가 이 횟수만큼 연속으로 관측되면 확정
+CONFIRM_AFTER = 2
+
+
+@dataclass
+class Hop:
+    """다음에 따라갈 이동 한 단계"""
+    kind: str                                   # 'form' (JS 폼 자동 제출) | 'redirect' (location.href)
+    url: str                                    # 절대 URL
+    form_data: Optional[Dict[str, str]] = None  # kind == 'form'일 때 제출할 값
+
+    @property
+    def method(self) -> str:
+        return 'POST' if self.kind == 'form' else 'GET'
+
+    @property
+    def signature(self) -> Tuple[str, str]:
+        """쿼리스트링을 제외한 (종류, URL) - 로그인마다 달라지는 값은 비교에서 제외"""
+        return self.kind, page_address(self.url)
+
+
+def page_address(url: str) -> str:
+    """쿼리스트링과 ;jsessionid 등 경로 매개변수를 제외한 페이지 주소"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path.split(';')[0]}"
+
+
+def reached_target(status: int, url: str, target_url: str) -> bool:
+    """응답이 대상 페이지에 2xx로 도착했는지 (HopModel.observe()에 넘길 로그인인지)"""
+    return 200 <= status < 300 and page_address(url) == page_address(target_url)
+
+
+@dataclass
+class HopRecord:
+    """이동 추적 기록 한 줄"""
+    kind: str            # 'post' (로그인 POST) | 'http' (HTTP 리다이렉트) | 'form' | 'redirect'
+    method: str
+    url: str
+    status: int
+    elapsed_ms: float
+    bytes: int
+    learned: bool = False  # 확정된 경로로 처리되었는지 여부
+
+
+@dataclass
+class HopTrace:
+    """로그인 1회의 이동 추적"""
+    service: str
+    records: List[HopRecord] = field(default_factory=list)
+    learned: bool = False
+
+    def add_response(self, kind: str, response, started: float, learned: bool = False) -> None:
+        """응답(과 자동으로 따라간 HTTP 리다이렉트)을 기록합니다."""
+        for redirect in getattr(response, 'history', ()):
+            self.records.append(HopRecord(
+                kind='http', method=redirect.request.method, url=str(redirect.url),
+                status=redirect.status_code, elapsed_ms=0.0, bytes=len(redirect.content),
+            ))
+        self.records.append(HopRecord(
+            kind=kind, method=response.request.method, url=str(response.url),
+            status=response.status_code, elapsed_ms=(time.perf_counter() - started) * 1000,
+            bytes=len(response.content), learned=learned,
+        ))
+
+    def summary(self) -> str:
+        """'POST 200 → http 302 → form 200 → ...' 형태의 한 줄 요약"""
+        return ' → '.join(f"{r.kind} {r.status}" for r in self.records)
+
+
+class HopModel:
+    """서비스 하나의 로그인 후 이동 경로 모델 (스레드 안전)"""
+
+    def __init__(self, service: str, confirm_after: int = CONFIRM_AFTER):
+        self.service = service
+        self.confirm_after = confirm_after
+        self.plan: Optional[Tuple[Tuple[str, str], ...]] = None
+        self.deviations = 0
+
+        self._lock = threading.Lock()
+        self._candidate: Optional[Tuple[Tuple[str, str], ...]] = None
+        self._streak = 0
+
+    @property
+    def learned(self) -> bool:
+        return self.plan is not None
+
+    def next_hop(self, index: int, body: bytes, page_url: str,
+                 plan: Optional[Tuple[Tuple[str, str], ...]],
+                 charset: str = DEFAULT_CHARSET,
+                 target_url: Optional[str] = None) -> Tuple[Optional[Hop], bool]:
+        """
+        index번째 이동을 찾습니다.
+
+        Args:
+            body: 현재 응답 본문 (디코딩하지 않은 바이트)
+            plan: 로그인 시작 시점의 확정 경로 (None이면 일반 탐지)
+            charset: 본문 문자 집합
+            target_url: 로그인 후 도착해야 하는 대상 페이지 (확정 경로가 끝났을 때 확인)
+
+        Returns:
+            (Hop 또는 None, 확정 경로로 처리했는지 여부)
+        """
+        if plan is not None:
+            if index >= len(plan):
+                # 확정된 경로를 모두 따라왔고 대상 페이지에 도착했으면 본문은 다시 검사하지 않음
+                if target_url is None or page_address(page_url) == page_address(target_url):
+                    return None, True
+            else:
+                kind, expected = plan[index]
+                hop = self._match(kind, body, page_url, charset)
+                if hop is not None and hop.signature == (kind, expected):
+                    return hop, True
+
+            # 예상과 다른 응답 (로그인 실패 등) - 이번 로그인은 일반 탐지로 처리
+            with self._lock:
+                self.deviations += 1
+
+        return self._detect(body, page_url, charset), False
+
+    def observe(self, hops: List[Hop]) -> None:
+        """
+        성공한 로그인의 이동 경로를 반영합니다.
+
+        대상 페이지에 도착한 로그인만 넘겨야 합니다. (reached_target)
+        빈 경로는 확정하지 않습니다. 단계가 줄어든 경로도 대상 페이지에 도착했다면 다시 학습합니다.
+        """
+        signature = tuple(hop.signature for hop in hops)
+        if not signature:
+            return
+        with self._lock:
+            if self.plan is not None and signature != self.plan:
+                # 서버 동작이 바뀜 - 다시 학습
+                self.plan = None
+
+            if signature == self._candidate:
+                self._streak += 1
+            else:
+                self._candidate = signature
+                self._streak = 1
+
+            if self._streak >= self.confirm_after:
+                self.plan = signature
+
+    def reset(self) -> None:
+        """학습한 경로를 버립니다."""
+        with self._lock:
+            self.plan = None
+            self._candidate = None
+            self._streak = 0
+
+    def stats(self) -> dict:
+        return {
+            'service': self.service,
+            'learned': self.learned,
+            'plan': [f"{kind} {url}" for kind, url in self.plan] if self.plan else None,
+            'deviations': self.deviations,
+        }
+
+    @staticmethod
+    def _match(kind: str, body: bytes, page_url: str, charset: str) -> Optional[Hop]:
+        """확정된 종류의 매처 하나만 실행"""
+        if kind == 'form':
+            form = extract_form(body, charset)
+            if form:
+                action, form_data = form
+                return Hop('form', urljoin(page_url, action), form_data)
+            return None
+
+        redirect_url = find_js_redirect(body, charset)
+        return Hop('redirect', redirect_url) if redirect_url else None
+
+    @staticmethod
+    def _detect(body: bytes, page_url: str, charset: str) -> Optional[Hop]:
+        """일반 탐지: JS 폼 자동 제출 → location.href 순으로 확인"""
+        form = find_js_form(body, charset)
+        if form:
+            action, form_data = form
+            return Hop('form', urljoin(page_url, action), form_data)
+
+        redirect_url = find_js_redirect(body, charset)
+        if redirect_url:
+            return Hop('redirect', redirect_url)
+        return None
+
+
+_models: Dict[str, HopModel] = {}
+_models_lock = threading.Lock()
+
+
+def hop_model(service: str) -> HopModel:
+    """서비스별 HopModel (프로세스 전역에서 공유)"""
+    model = _models.get(service)
+    if model is None:
+        with _models_lock:
+            model = _models.setdefault(service, HopModel(service))
+    return model
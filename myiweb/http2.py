@@ -0,0 +1,246 @@
+"""
+HTTP/2 전송 계층
+===============
+requests.Session에 장착하는 httpx 기반 어댑터입니다. 서버가 ALPN으로 HTTP/2를 지원하면
+호스트당 연결 하나에 여러 사용자의 요청을 스트림으로 다중화하고, 지원하지 않으면 HTTP/1.1로
+동작합니다. 쿠키와 리다이렉트는 기존처럼 requests.Session이 처리하므로 사용자 간 쿠키는
+공유되지 않습니다.
+
+요청은 전송 계층 전용 이벤트 루프 스레드에서 httpx.AsyncHTTPTransport로 보냅니다.
+(httpcore의 동기 HTTP/2 연결은 여러 스레드가 동시에 요청하면 스트림 ID 순서가 뒤바뀔 수
+있으므로, 한 연결의 프레임 송신은 이벤트 루프 하나에서만 일어나도록 함)
+
+사용 예:
+    from myiweb.http2 import HTTP2Transport
+    from myiweb.transport import set_default_transport
+
+    set_default_transport(HTTP2Transport())          # MJUSSOLogin, StudentCard.fetch 등 전체에 적용
+    sso = MJUSSOLogin(user_id, user_pw, transport=HTTP2Transport())   # 또는 인스턴스별로 지정
+
+언제 사용하나:
+- 서버/방화벽의 연결 수 제한이나 TLS 핸드셰이크 비용이 문제일 때 (동시 사용자 32명 기준 연결 62개 → 2개)
+- 요청 처리 자체는 순수 Python HTTP/2 스택과 이벤트 루프 스레드 하나를 거치므로 CPU 비용이 더 큽니다.
+  로컬 측정(benchmarks/bench_http2.py)에서는 로그인 지연이 기존 HTTP/1.1 풀보다 길었습니다.
+
+제한 사항:
+- 응답 본문은 항상 한 번에 받습니다. (stream=True여도 조기 종료로 수신량이 줄지 않음)
+- 인증서 검증/클라이언트 인증서는 요청별 설정 대신 HTTP2Transport 생성 시 설정을 사용합니다.
+- 프록시는 지원하지 않습니다.
+
+httpx와 h2가 필요합니다: pip install 'mju-sso-login[http2]'
+"""
+
+import asyncio
+import http.client
+import ssl
+import threading
+from typing import Dict, Optional, Set, Union
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.cookies import extract_cookies_to_jar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx의 HTTP/2 지원에 필요
+except ImportError as e:
+    raise ImportError("HTTP2Transport를 사용하려면 httpx와 h2가 필요합니다: pip install 'mju-sso-login[http2]'") from e
+
+from .transport import Transport, TransportStats
+
+# HTTP/2에서 금지된 연결 관련 헤더 (requests 기본 헤더의 Connection: keep-alive 등)
+_HOP_BY_HOP_HEADERS = frozenset({'connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade'})
+
+
+class _RawResponse:
+    """
+    requests.Response.raw 대용
+
+    쿠키 추출(_original_response.msg)과 sso.py가 사용하는 tell()/drain_conn()/release_conn()만 제공합니다.
+    """
+
+    def __init__(self, msg: http.client.HTTPMessage, num_bytes: int):
+        self._original_response = self
+        self.msg = msg
+        self._num_bytes = num_bytes
+
+    def tell(self) -> int:
+        """수신한 본문 바이트 수 (압축 응답이면 압축된 크기)"""
+        return self._num_bytes
+
+    def drain_conn(self) -> None:
+        pass
+
+    def release_conn(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class _HTTPXAdapter(BaseAdapter):
+    """requests 요청을 이벤트 루프 스레드의 httpx.AsyncHTTPTransport로 보내는 어댑터 (여러 Session이 공유)"""
+
+    def __init__(self, transport_factory, stats: TransportStats):
+        """
+        Args:
+            transport_factory: http2 -> httpx.AsyncHTTPTransport (이벤트 루프 스레드에서 호출)
+        """
+        super().__init__()
+        self._stats = stats
+        self._versions_lock = threading.Lock()
+        self.http_versions: Dict[str, int] = {}
+        # ALPN에서 HTTP/1.1로 응답한 호스트 - 이후 요청은 HTTP/1.1 전용 풀로 보냄
+        self._http1_hosts: Set[str] = set()
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="HTTP2Transport", daemon=True)
+        self._thread.start()
+        # HTTP/2 풀은 협상 중인 연결에도 요청을 모아 두므로, HTTP/2를 지원하지 않는 호스트에
+        # 동시 요청이 몰리면 연결 하나에 줄을 서게 됨 -> 그런 호스트는 HTTP/1.1 풀에서 병렬로 연결
+        self._transport: "httpx.AsyncHTTPTransport" = self._run(self._create(transport_factory, True))
+        self._http1_transport: "httpx.AsyncHTTPTransport" = self._run(self._create(transport_factory, False))
+
+    def _run(self, coro):
+        """이벤트 루프 스레드에서 코루틴을 실행하고 결과를 기다립니다."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    @staticmethod
+    async def _create(transport_factory, http2: bool) -> "httpx.AsyncHTTPTransport":
+        return transport_factory(http2)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        host = urlparse(request.url).hostname
+        self._stats.record_request(host)
+
+        async def on_trace(event: str, info: dict) -> None:
+            if event == 'connection.connect_tcp.complete':
+                self._stats.record_connection(host)
+
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        headers = [(name, value) for name, value in request.headers.items()
+                   if name.lower() not in _HOP_BY_HOP_HEADERS]
+
+        httpx_request = httpx.Request(
+            request.method, request.url, headers=headers, content=body,
+            extensions={'timeout': _timeout_extension(timeout), 'trace': on_trace},
+        )
+        transport = self._http1_transport if host in self._http1_hosts else self._transport
+        try:
+            httpx_response, content = self._run(self._send(transport, httpx_request))
+        except httpx.TimeoutException as e:
+            error = requests.ConnectTimeout if isinstance(e, httpx.ConnectTimeout) else requests.ReadTimeout
+            raise error(e, request=request) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e, request=request) from e
+
+        version = httpx_response.http_version
+        with self._versions_lock:
+            self.http_versions[version] = self.http_versions.get(version, 0) + 1
+        if version != 'HTTP/2' and transport is self._transport and request.url.startswith('https://'):
+            self._http1_hosts.add(host)
+        return self._build_response(request, httpx_response, content)
+
+    @staticmethod
+    async def _send(transport: "httpx.AsyncHTTPTransport", httpx_request: "httpx.Request") -> tuple:
+        httpx_response = await transport.handle_async_request(httpx_request)
+        try:
+            content = await httpx_response.aread()
+        finally:
+            await httpx_response.aclose()
+        return httpx_response, content
+
+    def _build_response(self, request, httpx_response: "httpx.Response", content: bytes) -> requests.Response:
+        msg = http.client.HTTPMessage()
+        for name, value in httpx_response.headers.multi_items():
+            msg[name] = value
+
+        response = requests.Response()
+        response.status_code = httpx_response.status_code
+        response.reason = httpx_response.reason_phrase
+        response.headers = CaseInsensitiveDict(
+            (name, ', '.join(msg.get_all(name))) for name in dict.fromkeys(msg.keys())
+        )
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = _RawResponse(msg, httpx_response.num_bytes_downloaded)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        # 본문은 httpx가 Content-Encoding에 따라 이미 해제한 상태
+        response._content = content
+        response._content_consumed = True
+        extract_cookies_to_jar(response.cookies, request, response.raw)
+        return response
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+        self._run(self._transport.aclose())
+        self._run(self._http1_transport.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+def _timeout_extension(timeout) -> dict:
+    """requests의 timeout(초, (connect, read) 튜플, None)을 httpcore 형식으로 변환"""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+    else:
+        connect = read = timeout
+    return {'connect': connect, 'read': read, 'write': read, 'pool': connect}
+
+
+class HTTP2Transport(Transport):
+    """
+    HTTP/2 다중화 전송 계층 (HTTP/1.1 자동 폴백)
+
+    - max_connections: 모든 호스트를 합친 최대 연결 수 (HTTP/1.1로 폴백한 경우에 의미가 있음)
+    - idle_timeout: 이 시간(초) 이상 쉬고 있던 연결은 닫음
+    - verify: 인증서 검증 여부, CA 번들 경로 또는 ssl.SSLContext
+    - http1: ALPN에서 HTTP/1.1 폴백을 허용할지 여부
+    """
+
+    def __init__(self, max_connections: int = 64, idle_timeout: Optional[float] = 60.0,
+                 verify: Union[bool, str, ssl.SSLContext] = True, http1: bool = True):
+        if isinstance(verify, str):
+            verify = ssl.create_default_context(cafile=verify)
+        self._stats = TransportStats()
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=idle_timeout,
+        )
+        self.adapter = _HTTPXAdapter(
+            lambda http2: httpx.AsyncHTTPTransport(verify=verify, http1=http1 or not http2, http2=http2,
+                                                   limits=limits),
+            self._stats,
+        )
+
+    def mount(self, session: requests.Session) -> None:
+        session.mount('https://', self.adapter)
+        session.mount('http://', self.adapter)
+
+    def record_login(self) -> None:
+        self._stats.record_login()
+
+    def stats(self) -> dict:
+        """
+        연결 재사용 통계 (SharedTransport.stats()와 같은 형식 + http_versions)
+
+        Returns:
+            dict: requests, connections, handshakes_avoided, reuse_rate, logins,
+                  handshakes_avoided_per_1000_logins, per_host, http_versions
+        """
+        stats = self._stats.snapshot()
+        with self.adapter._versions_lock:
+            stats['http_versions'] = dict(self.adapter.http_versions)
+        return stats
+
+    def close(self) -> None:
+        self.adapter.close()
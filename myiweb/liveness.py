@@ -0,0 +1,243 @@
+"""
+세션 생존 확인
+=============
+test_session()은 서비스 페이지를 리다이렉트까지 따라가 본문 전체를 받은 뒤 로그아웃 버튼을 찾습니다.
+세션이 살아 있는지만 알면 되는 경우(저장된 세션 재사용 전 확인 등)에는 다음 방식으로 비용을 줄입니다.
+
+- 리다이렉트를 자동으로 따라가지 않고 응답 헤더만 받음 (stream=True, 본문은 읽지 않음)
+  - 3xx → Location이 sso.mju.ac.kr 또는 login_security이면 만료 (서비스 안쪽 리다이렉트는 직접 따라감)
+  - 2xx → 유효
+  - 그 외 → 만료로 판단 (캐시하지 않음)
+- 남은 본문이 작으면 마저 읽어 연결을 풀에 돌려주고, 크면 연결을 닫음
+- 유효 판정은 (서비스, 서비스 도메인 쿠키 값) 단위로 ttl초 동안 기억하므로
+  같은 쿠키로 다시 확인하면 요청을 보내지 않음 (저장소에서 복원한 새 Session도 같은 항목을 사용)
+- check_sessions() / check_stored_sessions()로 여러 세션을 동시에 확인
+
+사용 예:
+    sso.check_alive('msi')                                   # 캐시 → 헤더 확인
+    check_stored_sessions(store, [(user_id, user_pw), ...])  # {user_id: bool}
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+from urllib.parse import urljoin, urlparse
+
+import requests
+
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from .session_store import SessionStore
+from .transport import release_response
+
+T = TypeVar('T')
+
+# 서비스 안쪽 리다이렉트를 따라가는 최대 횟수
+MAX_PROBE_REDIRECTS = 3
+
+# 헤더를 받은 뒤 남은 본문을 마저 읽어 연결을 재사용할 최대 크기
+PROBE_DRAIN_LIMIT = 16 * 1024
+
+
+class LivenessCache:
+    """
+    마지막으로 유효하다고 확인된 시각 캐시 (스레드 안전 LRU)
+
+    키는 (서비스, 서비스 도메인 쿠키의 이름=값 목록)의 SHA-256 다이제스트입니다.
+
+    - ttl: 유효 판정을 기억하는 시간(초)
+    - maxsize: 보관할 최대 세션 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 4096):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(session: requests.Session, service: str, domain: str) -> Optional[str]:
+        """세션 식별 키 (서비스 도메인 쿠키가 없으면 None)"""
+        cookies = sorted(f"{cookie.name}={cookie.value}" for cookie in session.cookies
+                         if domain.endswith(cookie.domain.lstrip('.')))
+        if not cookies:
+            return None
+        return hashlib.sha256('\n'.join([service] + cookies).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> bool:
+        """ttl 안에 유효 판정을 받은 적이 있으면 True"""
+        now = time.monotonic()
+        with self._lock:
+            checked_at = self._entries.get(key)
+            if checked_at is None or now - checked_at > self.ttl:
+                if checked_at is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True
+
+    def put(self, key: str) -> None:
+        with self._lock:
+            self._entries[key] = time.monotonic()
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+_default_cache: Optional[LivenessCache] = None
+_default_lock = threading.Lock()
+
+
+def default_liveness_cache() -> LivenessCache:
+    """프로세스 전역 기본 캐시 (ttl 60초)"""
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = LivenessCache()
+    return _default_cache
+
+
+def probe_session(session: requests.Session, test_url: str, retry_policy: Optional[RetryPolicy] = None,
+                  timeout: float = 10) -> bool:
+    """
+    응답 헤더만으로 세션이 살아 있는지 확인합니다. (캐시 사용 안 함)
+
+    Args:
+        session: 확인할 세션
+        test_url: 서비스 페이지 URL (MJUSSOLogin.SERVICES[...]['test_url'])
+        retry_policy: GET 재시도 정책 (None이면 기본 정책)
+        timeout: 요청 제한 시간(초)
+
+    Returns:
+        bool: 2xx 응답에 도달했으면 True, SSO/login_security로 리다이렉트되었거나 그 외 응답이면 False
+
+    Raises:
+        requests.RequestException: 네트워크 오류
+    """
+    retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+    host = urlparse(test_url).hostname
+    url = test_url
+    for _ in range(MAX_PROBE_REDIRECTS + 1):
+        response = retry_policy.get(session, url, 'liveness', timeout=timeout, allow_redirects=False, stream=True)
+        try:
+            if not response.is_redirect:
+                return 200 <= response.status_code < 300
+            location = urljoin(url, response.headers['Location'])
+        finally:
+            release_response(response, PROBE_DRAIN_LIMIT)
+        if 'sso.mju.ac.kr' in location or 'login_security' in location or urlparse(location).hostname != host:
+            return False
+        url = location
+    return False
+
+
+def check_alive(session: requests.Session, service: str, test_url: str,
+                cache: Optional[LivenessCache] = None, retry_policy: Optional[RetryPolicy] = None,
+                timeout: float = 10) -> bool:
+    """
+    캐시를 먼저 확인하고, 없으면 probe_session()으로 확인합니다. (네트워크 오류는 False)
+
+    Args:
+        cache: 유효 판정 캐시 (None이면 프로세스 전역 캐시)
+    """
+    cache = cache or default_liveness_cache()
+    key = LivenessCache.key(session, service, urlparse(test_url).hostname)
+    if key is None:
+        return False
+    if cache.get(key):
+        return True
+
+    try:
+        alive = probe_session(session, test_url, retry_policy, timeout)
+    except requests.RequestException:
+        return False
+    if alive:
+        # 응답으로 쿠키가 바뀌었을 수 있으므로 확인 후의 쿠키로 기억
+        cache.put(LivenessCache.key(session, service, urlparse(test_url).hostname) or key)
+    return alive
+
+
+def _map_concurrently(func: Callable[[T], bool], items: List[T], max_workers: int) -> List[bool]:
+    """items를 최대 max_workers개 스레드로 동시에 처리하여 입력 순서대로 결과를 반환합니다."""
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix='liveness') as executor:
+        return list(executor.map(func, items))
+
+
+def check_sessions(sessions: Iterable[Tuple[requests.Session, str]], max_workers: int = 16,
+                   cache: Optional[LivenessCache] = None,
+                   retry_policy: Optional[RetryPolicy] = None) -> List[bool]:
+    """
+    여러 세션을 동시에 확인합니다.
+
+    Args:
+        sessions: (세션, 서비스 이름) 목록
+        max_workers: 동시 확인 스레드 수
+
+    Returns:
+        list: 입력 순서대로 생존 여부
+    """
+    from .sso import MJUSSOLogin
+
+    def check(item: Tuple[requests.Session, str]) -> bool:
+        session, service = item
+        return check_alive(session, service, MJUSSOLogin.SERVICES[service]['test_url'], cache, retry_policy)
+
+    return _map_concurrently(check, list(sessions), max_workers)
+
+
+def check_stored_sessions(store: SessionStore, credentials: Iterable[Tuple[str, str]], service: str = 'msi',
+                          max_workers: int = 16, cache: Optional[LivenessCache] = None,
+                          prune: bool = False, **login_kwargs) -> Dict[str, bool]:
+    """
+    세션 저장소에 저장된 여러 사용자의 세션을 동시에 확인합니다.
+
+    사용자마다 저장된 세션 복원(키 파생 + 복호화)과 헤더 확인을 같은 작업 스레드에서 수행합니다.
+
+    Args:
+        store: 세션 저장소
+        credentials: (아이디, 비밀번호) 목록 - 저장된 쿠키 복호화에 사용
+        service: 서비스 이름
+        prune: True이면 만료된 세션을 저장소에서 삭제
+        **login_kwargs: MJUSSOLogin 생성 인자 (transport, retry_policy 등)
+
+    Returns:
+        dict: {아이디: 생존 여부} (저장된 세션이 없으면 False)
+    """
+    from .sso import MJUSSOLogin
+
+    test_url = MJUSSOLogin.SERVICES[service]['test_url']
+    credentials = list(credentials)
+
+    def check(credential: Tuple[str, str]) -> bool:
+        user_id, user_pw = credential
+        sso = MJUSSOLogin(user_id, user_pw, verbose=False, **login_kwargs)
+        if not sso.restore_session(store, service):
+            return False
+        alive = check_alive(sso.session, service, test_url, cache, sso.retry_policy)
+        if prune and not alive:
+            store.delete(user_id, service)
+        return alive
+
+    alive = _map_concurrently(check, credentials, max_workers)
+    return {user_id: ok for (user_id, _), ok in zip(credentials, alive)}
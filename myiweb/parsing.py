@@ -0,0 +1,598 @@
+"""
+SSO 페이지 파싱 함수
+===================
+네트워크와 로깅에 의존하지 않는 순수 파싱 함수 모음입니다.
+동기(MJUSSOLogin)와 비동기(AsyncMJUSSOLogin) 로그인이 같은 파싱/판정 로직을 공유합니다.
+
+응답 본문은 디코딩하지 않은 바이트(response.content) 그대로 받아 바이트 정규식으로 검색하고,
+찾아낸 작은 값(토큰, URL, 표 항목)만 문자 집합에 맞춰 디코딩합니다.
+(response.text는 본문 전체 디코딩과, charset 헤더가 없으면 문자 집합 추측까지 수행함)
+문자 집합은 response_charset()이 헤더 → 엔드포인트별 캐시 → <meta charset> 순으로 정합니다.
+ASCII 호환 문자 집합(UTF-8, EUC-KR 등)을 가정하며, 하위 호환을 위해 str 본문도 받습니다.
+
+사용 예:
+    charset = response_charset(response)
+    public_key, csrf_token, form_action = parse_login_page(response.content, charset)
+    result = classify_login_result(response.content, response.url, 'msi.mju.ac.kr', charset)
+"""
+
+import codecs
+import html as html_lib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from .exceptions import PageParsingError
+
+# 문자 집합을 알 수 없을 때 사용하는 기본값 (SSO/MSI 페이지는 모두 UTF-8)
+DEFAULT_CHARSET = 'utf-8'
+
+Body = Union[bytes, str]
+
+
+def _as_bytes(body: Body, charset: str) -> Tuple[bytes, str]:
+    """본문을 (바이트, 문자 집합)으로 맞춤 - str이면 UTF-8로 인코딩"""
+    if isinstance(body, str):
+        return body.encode('utf-8'), 'utf-8'
+    return body, charset
+
+
+def _decode(value: bytes, charset: str) -> str:
+    return value.decode(charset, 'replace')
+
+
+# --- 문자 집합 ---
+
+_CONTENT_TYPE_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb'<meta\b[^>]*?charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+# <meta charset>를 찾는 앞부분 크기 (HTML 표준상 1024바이트 안에 있어야 함)
+META_SNIFF_BYTES = 1024
+# 엔드포인트별 문자 집합 캐시 크기 (경로에 쿼리/세션 ID가 섞여도 커지지 않도록 제한)
+CHARSET_CACHE_SIZE = 256
+
+_charsets: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+_charsets_lock = threading.Lock()
+
+
+def _normalize_charset(name: str) -> Optional[str]:
+    """파이썬 코덱 이름으로 정규화 (알 수 없는 이름이면 None)"""
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def _endpoint(url: str) -> Tuple[str, str]:
+    """(호스트, ;jsessionid 등 경로 매개변수를 뗀 경로)"""
+    parts = urlsplit(url)
+    return parts.hostname or '', parts.path.split(';', 1)[0]
+
+
+def response_charset(response, sniff: bool = True) -> str:
+    """
+    응답 본문의 문자 집합을 정합니다. (requests / httpx 응답 모두 지원)
+
+    Content-Type의 charset → 같은 엔드포인트에서 이전에 확인한 값 → 본문 앞부분의
+    <meta charset> 순으로 확인하고, 모두 없으면 DEFAULT_CHARSET을 사용합니다.
+    확인된 값은 (호스트, 경로) 단위로 기억하므로 헤더에 charset이 없는 엔드포인트도
+    두 번째 응답부터는 본문을 보지 않습니다. 본문 전체로 문자 집합을 추측하지 않습니다.
+
+    Args:
+        sniff: False이면 <meta charset>을 확인하지 않음 (본문을 스트리밍으로 읽는 경우)
+    """
+    key = _endpoint(str(response.url))
+    match = _CONTENT_TYPE_CHARSET_RE.search(response.headers.get('Content-Type', ''))
+    charset = _normalize_charset(match.group(1)) if match else None
+
+    if charset is None:
+        with _charsets_lock:
+            charset = _charsets.get(key)
+            if charset is not None:
+                _charsets.move_to_end(key)
+                return charset
+        if not sniff:
+            return DEFAULT_CHARSET
+        match = _META_CHARSET_RE.search(response.content[:META_SNIFF_BYTES])
+        charset = _normalize_charset(match.group(1).decode('ascii')) if match else None
+        if charset is None:
+            return DEFAULT_CHARSET
+
+    with _charsets_lock:
+        _charsets[key] = charset
+        _charsets.move_to_end(key)
+        while len(_charsets) > CHARSET_CACHE_SIZE:
+            _charsets.popitem(last=False)
+    return charset
+
+
+def clear_charset_cache() -> None:
+    """엔드포인트별 문자 집합 캐시를 비웁니다."""
+    with _charsets_lock:
+        _charsets.clear()
+
+
+@lru_cache(maxsize=64)
+def _encoded(text: str, charset: str) -> bytes:
+    """문자 집합별로 인코딩한 검색 표식 (인코딩할 수 없으면 빈 바이트열 - 검색하지 않음)"""
+    try:
+        return text.encode(charset)
+    except UnicodeError:
+        return b''
+
+
+# --- 로그인 페이지 ---
+
+# <input ...> / <form ...> 태그 하나와 그 속성 문자열
+_LOGIN_TAG_RE = re.compile(rb'<(input|form)\b([^>]*)>', re.IGNORECASE)
+# 속성 하나 (큰따옴표/작은따옴표/따옴표 없는 값 모두 허용)
+_ATTR_RE = re.compile(rb'([^\s=/>]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))')
+# 로그인 페이지에서 찾는 id (태그 속성 문자열에 이 중 하나가 있을 때만 속성을 분해)
+_LOGIN_IDS = (b'public-key', b'c_r_t', b'signin-form')
+
+
+def _parse_attrs(attrs: bytes, charset: str) -> Dict[str, str]:
+    """태그 속성 문자열을 {이름(소문자): 값} 딕셔너리로 변환"""
+    result = {}
+    for name, dq, sq, bare in _ATTR_RE.findall(attrs):
+        result.setdefault(name.decode('ascii', 'replace').lower(), _decode(dq or sq or bare, charset))
+    return result
+
+
+class LoginPageScanner:
+    """
+    로그인 페이지를 청크 단위로 받아 공개키, CSRF 토큰, 로그인 폼 action을 점진적으로 찾는 스캐너
+
+    청크 경계에 걸친 태그는 다음 청크가 올 때까지 보류합니다.
+    청크는 디코딩하지 않은 바이트이며, 찾아낸 값만 charset으로 디코딩합니다.
+
+    사용 예:
+        scanner = LoginPageScanner(response_charset(response, sniff=False))
+        for chunk in response.iter_content(8192):
+            if scanner.feed(chunk):
+                break
+        public_key, csrf_token, form_action = scanner.result()
+    """
+
+    def __init__(self, charset: str = DEFAULT_CHARSET):
+        self.charset = charset
+        self.public_key: Optional[str] = None
+        self.csrf_token: Optional[str] = None
+        self.form_action: Optional[str] = None
+        self._pending = b''
+
+    @property
+    def done(self) -> bool:
+        """세 값을 모두 찾았는지 여부"""
+        return bool(self.public_key and self.csrf_token and self.form_action)
+
+    def result(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """(public_key, csrf_token, form_action) - 찾지 못한 값은 None"""
+        return self.public_key, self.csrf_token, self.form_action
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        다음 청크를 스캔합니다.
+
+        Returns:
+            bool: 세 값을 모두 찾았으면 True (이후 청크는 필요 없음)
+        """
+        data = self._pending + chunk
+        # 마지막 '<' 뒤에 '>'가 없으면 태그가 청크 경계에 걸친 것이므로 다음 청크로 보류
+        cut = data.rfind(b'<')
+        if cut == -1 or data.find(b'>', cut) != -1:
+            cut = len(data)
+        self._pending = data[cut:]
+        self._scan(data[:cut])
+        return self.done
+
+    def _scan(self, data: bytes) -> None:
+        for match in _LOGIN_TAG_RE.finditer(data):
+            attrs = match.group(2)
+            # 대부분의 태그는 여기서 걸러지므로 속성 분해 비용이 들지 않음
+            if not any(target in attrs for target in _LOGIN_IDS):
+                continue
+
+            parsed = _parse_attrs(attrs, self.charset)
+            tag_id = parsed.get('id')
+            if match.group(1).lower() == b'form':
+                if tag_id == 'signin-form' and self.form_action is None:
+                    self.form_action = parsed.get('action')
+            elif tag_id == 'public-key' and self.public_key is None:
+                self.public_key = parsed.get('value')
+            elif tag_id == 'c_r_t' and self.csrf_token is None:
+                self.csrf_token = parsed.get('value')
+
+            if self.done:
+                return
+
+
+def scan_login_page(body: Body, charset: str = DEFAULT_CHARSET) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    문서를 앞에서부터 한 번만 훑으며 공개키, CSRF 토큰, 로그인 폼 action을 찾습니다.
+
+    속성 순서와 따옴표 종류에 관계없이 동작하며, 세 값을 모두 찾으면 즉시 멈춥니다.
+
+    Returns:
+        tuple: (public_key, csrf_token, form_action) - 찾지 못한 값은 None
+    """
+    body, charset = _as_bytes(body, charset)
+    scanner = LoginPageScanner(charset)
+    scanner._scan(body)
+    return scanner.result()
+
+
+def parse_login_page(body: Body, charset: str = DEFAULT_CHARSET) -> Tuple[str, str, str]:
+    """
+    로그인 페이지에서 공개키, CSRF 토큰(c_r_t), 로그인 폼 action을 추출합니다.
+
+    Args:
+        body: 응답 본문 (response.content)
+        charset: 본문 문자 집합 (response_charset())
+
+    Returns:
+        tuple: (public_key, csrf_token, form_action)
+
+    Raises:
+        PageParsingError: 필요한 값을 찾지 못했을 때
+    """
+    body, charset = _as_bytes(body, charset)
+    # 단일 패스 스캐너로 먼저 추출 시도
+    public_key, csrf_token, form_action = scan_login_page(body, charset)
+
+    # 모두 찾은 경우 BeautifulSoup 스킵
+    if public_key and csrf_token and form_action:
+        return public_key, csrf_token, form_action
+
+    # 스캐너 실패 시 (속성 값 안에 '>'가 있는 등) lxml + SoupStrainer로 폴백
+    parse_only = SoupStrainer(['input', 'form'])
+    soup = BeautifulSoup(body, 'lxml', parse_only=parse_only, from_encoding=charset)
+
+    # 1. 공개키 추출
+    public_key_input = soup.find('input', {'id': 'public-key'})
+    if not public_key_input:
+        raise PageParsingError("공개키(public-key)를 찾을 수 없습니다.")
+
+    # 2. CSRF 토큰 추출
+    csrf_input = soup.find('input', {'id': 'c_r_t'})
+    if not csrf_input:
+        raise PageParsingError("CSRF 토큰(c_r_t)을 찾을 수 없습니다.")
+
+    # 3. Form Action URL 추출
+    form = soup.find('form', {'id': 'signin-form'})
+    if not form:
+        raise PageParsingError("로그인 폼(signin-form)을 찾을 수 없습니다.")
+
+    return public_key_input.get('value'), csrf_input.get('value'), form.get('action')
+
+
+# 로그인 후 이동 단계(JS 폼 자동 제출 / location.href)에서 쓰는 패턴
+_FORM_ACTION_RE = re.compile(rb'<form[^>]*action=["\"]([^"\"]+)["\"]')
+_FORM_INPUT_RE = re.compile(rb'<input[^>]*name=["\"]([^"\"]+)["\"][^>]*value=["\"]([^"\"]*)["\"]|<input[^>]*value=["\"]([^"\"]*)["\"][^>]*name=["\"]([^"\"]+)["\"]')
+_JS_REDIRECT_RE = re.compile(rb"location\.href\s*=\s*['\"](.*?)['\"]")
+
+
+def find_js_form(body: Body, charset: str = DEFAULT_CHARSET) -> Optional[Tuple[str, Dict[str, str]]]:
+    """
+    onLoad 시 자동 제출되는 폼을 찾습니다.
+
+    예: <body onLoad="doLogin()">
+        <form action="/servlet/login_security" method="post">
+            <input name="code" value="..."/>
+            <input name="_csrf" value="..."/>
+        </form>
+
+    Returns:
+        tuple: (action, form_data) 또는 None (자동 제출 폼이 없는 경우)
+    """
+    body, charset = _as_bytes(body, charset)
+    # onLoad에서 폼 제출하는 패턴 감지
+    if b'onLoad=' not in body or (b'submit()' not in body and b'doLogin()' not in body):
+        return None
+
+    return extract_form(body, charset)
+
+
+def extract_form(body: Body, charset: str = DEFAULT_CHARSET) -> Optional[Tuple[str, Dict[str, str]]]:
+    """
+    첫 번째 폼의 action과 input 값들을 추출합니다. (자동 제출 여부는 확인하지 않음)
+
+    Returns:
+        tuple: (action, form_data) 또는 None (폼이나 input이 없는 경우)
+    """
+    body, charset = _as_bytes(body, charset)
+    # 정규표현식으로 빠르게 폼 데이터 추출 시도
+    form_action_match = _FORM_ACTION_RE.search(body)
+    if not form_action_match:
+        return None
+
+    action = _decode(form_action_match.group(1), charset)
+    if not action:
+        return None
+
+    # hidden input들 추출
+    form_data = {}
+    for match in _FORM_INPUT_RE.finditer(body):
+        if match.group(1):
+            form_data[_decode(match.group(1), charset)] = _decode(match.group(2), charset)
+        elif match.group(4):
+            form_data[_decode(match.group(4), charset)] = _decode(match.group(3), charset)
+
+    if not form_data:
+        # 정규표현식 실패 시 lxml로 폴백
+        parse_only = SoupStrainer('form')
+        soup = BeautifulSoup(body, 'lxml', parse_only=parse_only, from_encoding=charset)
+        form = soup.find('form')
+        if not form:
+            return None
+        for input_tag in form.find_all('input'):
+            name = input_tag.get('name')
+            value = input_tag.get('value', '')
+            if name:
+                form_data[name] = value
+
+    if not form_data:
+        return None
+
+    return action, form_data
+
+
+def find_js_redirect(body: Body, charset: str = DEFAULT_CHARSET) -> Optional[str]:
+    """location.href = '...' 형태의 JS 리다이렉트 대상 URL(절대 URL)을 찾습니다."""
+    body, charset = _as_bytes(body, charset)
+    js_redirect_match = _JS_REDIRECT_RE.search(body)
+    if js_redirect_match:
+        redirect_url = js_redirect_match.group(1)
+        if redirect_url.startswith(b'http'):
+            return _decode(redirect_url, charset)
+    return None
+
+
+# MSI 페이지의 CSRF 토큰 (meta 태그 → JS의 X-CSRF-TOKEN 헤더 설정 → hidden input 순)
+_CSRF_PATTERNS = (
+    re.compile(rb'meta[^>]*_csrf[^>]*content="([^"]+)"'),
+    re.compile(rb"X-CSRF-TOKEN[\"']?\s*:\s*[\"']([^\"']+)[\"']"),
+    re.compile(rb'name="_csrf"\s+value="([^"]+)"'),
+)
+
+
+def find_csrf_token(body: Body, charset: str = DEFAULT_CHARSET) -> Optional[str]:
+    """MSI 페이지(MySecurityStart, index_Myiweb.jsp 등)에서 CSRF 토큰을 찾습니다. (없으면 None)"""
+    body, charset = _as_bytes(body, charset)
+    for pattern in _CSRF_PATTERNS:
+        match = pattern.search(body)
+        if match:
+            return _decode(match.group(1), charset)
+    return None
+
+
+# --- MSI 조회 페이지 (div.flex-table-item 표) ---
+
+@dataclass
+class TableItem:
+    """
+    <div class="flex-table-item"> 항목 하나
+
+    title/text는 BeautifulSoup의 get_text(strip=True)와 같은 규칙(텍스트 조각마다 공백 제거 후 연결)으로 만듭니다.
+    """
+    title: str
+    text: str                                                   # item-data 텍스트
+    inputs: List[Dict[str, str]] = field(default_factory=list)  # item-data 안의 <input> 속성 (문서 순서)
+
+    @property
+    def value(self) -> str:
+        """첫 번째 input의 value, input이 없으면 텍스트"""
+        return self.inputs[0].get('value', '') if self.inputs else self.text
+
+    def input(self, name: str) -> Optional[Dict[str, str]]:
+        """name이 일치하는 첫 번째 input의 속성"""
+        for attrs in self.inputs:
+            if attrs.get('name') == name:
+                return attrs
+        return None
+
+    def input_value(self, name: str) -> str:
+        attrs = self.input(name)
+        return attrs.get('value', '') if attrs else ''
+
+
+_ITEM_RE = re.compile(rb'<div\b[^>]*?\bclass\s*=\s*["\'][^"\']*\bflex-table-item\b[^"\']*["\'][^>]*>', re.IGNORECASE)
+_DIV_TAG_RE = re.compile(rb'<(/?)div\b([^>]*)>', re.IGNORECASE)
+_CLASS_ATTR_RE = re.compile(rb'\bclass\s*=\s*["\']([^"\']*)["\']', re.IGNORECASE)
+_INPUT_TAG_RE = re.compile(rb'<input\b([^>]*)>', re.IGNORECASE)
+_CHECKED_RE = re.compile(rb'(?:^|\s)checked(?:[\s=/]|$)', re.IGNORECASE)
+_MARKUP_RE = re.compile(rb'<[^>]*>')
+_DATA_IMAGE_RE = re.compile(rb'<img\b[^>]*?\bsrc\s*=\s*["\']data:image[^"\',]*base64,([^"\']*)["\']', re.IGNORECASE)
+
+
+def _text(fragment: bytes, charset: str) -> str:
+    """태그를 뺀 텍스트 (조각마다 엔티티 해제 + 공백 제거 후 연결)"""
+    pieces = (html_lib.unescape(_decode(piece, charset)).strip() for piece in _MARKUP_RE.split(fragment))
+    return ''.join(piece for piece in pieces if piece)
+
+
+def _input_attrs(attrs: bytes, charset: str) -> Dict[str, str]:
+    parsed = {name: html_lib.unescape(value) for name, value in _parse_attrs(attrs, charset).items()}
+    # 값 없는 불리언 속성 (<input type="checkbox" checked>)
+    if 'checked' not in parsed and _CHECKED_RE.search(attrs):
+        parsed['checked'] = ''
+    return parsed
+
+
+def _scan_table_items(body: bytes, charset: str) -> List[TableItem]:
+    items = []
+    for start in _ITEM_RE.finditer(body):
+        # 중첩 div를 따라가며 항목 끝과 item-title/item-data 영역을 찾음
+        stack = [None]
+        spans: Dict[bytes, Tuple[int, int]] = {}
+        for tag in _DIV_TAG_RE.finditer(body, start.end()):
+            if not tag.group(1):
+                class_match = _CLASS_ATTR_RE.search(tag.group(2))
+                classes = class_match.group(1).split() if class_match else ()
+                role = next((name for name in (b'item-title', b'item-data') if name in classes), None)
+                stack.append((role, tag.end()))
+                continue
+            opened = stack.pop()
+            if not stack:
+                break
+            role, content_start = opened
+            if role is not None and role not in spans:
+                spans[role] = (content_start, tag.start())
+
+        if b'item-title' not in spans or b'item-data' not in spans:
+            continue
+        title = _text(body[slice(*spans[b'item-title'])], charset)
+        data = body[slice(*spans[b'item-data'])]
+        inputs = [_input_attrs(match.group(1), charset) for match in _INPUT_TAG_RE.finditer(data)]
+        items.append(TableItem(title, _text(data, charset), inputs))
+    return items
+
+
+def _soup_table_items(body: bytes, charset: str) -> List[TableItem]:
+    """BeautifulSoup 폴백 (마크업이 예상과 달라 스캐너가 항목을 찾지 못한 경우)"""
+    parse_only = SoupStrainer('div', class_='flex-table-item')
+    soup = BeautifulSoup(body, 'lxml', parse_only=parse_only, from_encoding=charset)
+    items = []
+    for item in soup.find_all('div', class_='flex-table-item'):
+        title_div = item.find('div', class_='item-title')
+        data_div = item.find('div', class_='item-data')
+        if not title_div or not data_div:
+            continue
+        inputs = [{name: ' '.join(value) if isinstance(value, list) else value
+                   for name, value in input_tag.attrs.items()}
+                  for input_tag in data_div.find_all('input')]
+        items.append(TableItem(title_div.get_text(strip=True), data_div.get_text(strip=True), inputs))
+    return items
+
+
+def parse_table_items(body: Body, charset: str = DEFAULT_CHARSET) -> List[TableItem]:
+    """
+    MSI 조회 페이지의 <div class="flex-table-item"> 항목들을 문서 순서대로 추출합니다.
+
+    본문을 트리로 만들지 않고 바이트 정규식으로 항목 영역만 찾아 그 안의 텍스트와 input만 디코딩합니다.
+    항목을 하나도 찾지 못하면 BeautifulSoup으로 다시 파싱합니다.
+
+    Args:
+        body: 응답 본문 (response.content)
+        charset: 본문 문자 집합 (response_charset())
+    """
+    body, charset = _as_bytes(body, charset)
+    return _scan_table_items(body, charset) or _soup_table_items(body, charset)
+
+
+def find_data_image(body: Body) -> Optional[str]:
+    """<img src="data:image/...;base64,..."> 의 Base64 데이터 (없으면 None)"""
+    body, _ = _as_bytes(body, DEFAULT_CHARSET)
+    match = _DATA_IMAGE_RE.search(body)
+    return match.group(1).decode('ascii', 'replace') if match else None
+
+
+# --- 로그인 결과 판정 ---
+
+class LoginOutcome(Enum):
+    """로그인 결과 분류"""
+    SUCCESS = 'success'
+    INVALID_CREDENTIALS = 'invalid_credentials'
+    HTTP_ERROR = 'http_error'      # 최종 응답이 4xx/5xx (오류 페이지는 판정하지 않음)
+    UNKNOWN = 'unknown'
+
+
+@dataclass(frozen=True)
+class LoginResult:
+    """로그인 최종 응답의 판정 결과"""
+    outcome: LoginOutcome
+    message: Optional[str] = None  # 서버 에러 메시지 (errorMsg / alert)
+    has_signin_form: bool = False  # 로그인 폼이 다시 표시됨 (인증 실패)
+    has_logout: bool = False       # 로그아웃 버튼/링크가 있음 (로그인 상태)
+    status: Optional[int] = None   # 최종 응답의 HTTP 상태 코드 (주어진 경우)
+
+    @property
+    def success(self) -> bool:
+        return self.outcome is LoginOutcome.SUCCESS
+
+
+# 로그인 결과 판정에 쓰는 패턴 (에러 메시지는 실패가 확실할 때만 검색)
+_ERROR_VAR_RE = re.compile(rb'var errorMsg = "([^"]+)"')
+_ALERT_SQ_RE = re.compile(rb"alert\('(.+?)'\)")
+_ALERT_DQ_RE = re.compile(rb'alert\("(.+?)"\)')
+# 대소문자 무시 검색을 문자 클래스로 표현하여 body.lower() 사본 없이 찾음
+_LOGOUT_RE = re.compile(rb'[lL][oO][gG][oO][uU][tT]')
+
+
+def _decode_js_escape(message: str) -> str:
+    """\\uXXXX 형태의 JS 이스케이프 디코딩 (이스케이프가 없거나 실패하면 원문 유지)"""
+    # 이미 한글 등이 그대로 들어 있는 메시지를 unicode_escape로 디코딩하면 깨지므로 건너뜀
+    if '\\' not in message or not message.isascii():
+        return message
+    try:
+        return message.encode('utf-8').decode('unicode_escape')
+    except UnicodeError:
+        return message
+
+
+def has_logout(body: Body, charset: str = DEFAULT_CHARSET) -> bool:
+    """로그아웃 버튼/링크가 있는지 (한글 표식이 있으면 영문 검색 생략)"""
+    body, charset = _as_bytes(body, charset)
+    marker = _encoded('로그아웃', charset)
+    return (bool(marker) and marker in body) or _LOGOUT_RE.search(body) is not None
+
+
+def _has_pending_hop(body: bytes, charset: str) -> bool:
+    """JS 폼 자동 제출이나 location.href 이동이 남은 중간 페이지인지 (코드 교환, login_security 등)"""
+    return find_js_form(body, charset) is not None or find_js_redirect(body, charset) is not None
+
+
+def classify_login_result(body: Body, final_url: str = '', success_domain: Optional[str] = None,
+                          charset: str = DEFAULT_CHARSET, status: Optional[int] = None) -> LoginResult:
+    """
+    로그인 최종 응답을 판정합니다. (로그인 결과 확인과 세션 유효성 테스트가 같은 규칙을 사용)
+
+    판정에 필요한 순서대로 검사하고 결과가 정해지면 바로 반환하므로, 성공한 로그인에서는
+    에러 메시지 정규식을 실행하지 않으며 본문을 디코딩하지도 않습니다.
+
+    Args:
+        body: 최종 응답 본문 (response.content)
+        final_url: 최종 응답 URL
+        success_domain: 로그인 성공 시 도착해야 하는 도메인 (None이면 URL 판정 생략)
+        charset: 본문 문자 집합 (에러 메시지 디코딩과 한글 표식 검색에 사용)
+        status: 최종 응답의 HTTP 상태 코드 (4xx/5xx이면 본문을 보지 않고 HTTP_ERROR)
+
+    Returns:
+        LoginResult: 성공 / 인증 실패(서버 메시지 포함) / HTTP 오류 / 알 수 없음
+    """
+    # 대상 도메인의 오류 페이지를 성공으로 보지 않도록 상태 코드를 먼저 확인
+    if status is not None and not 200 <= status < 400:
+        return LoginResult(LoginOutcome.HTTP_ERROR, status=status)
+
+    body, charset = _as_bytes(body, charset)
+    # 로그인 폼이 다시 나타났는지 확인 (실패 시 폼이 다시 표시됨)
+    has_signin_form = b'signin-form' in body and b'input-password' in body
+    # 로그아웃 버튼이 있는지 확인 (로그인 상태 표시)
+    logout = has_logout(body, charset)
+
+    # 실제 대상 도메인으로 이동했는지 확인 (URL 파싱)
+    actually_redirected = bool(success_domain) and success_domain in (urlsplit(final_url).netloc or '')
+
+    # 성공 판정:
+    # 1. 로그아웃 버튼이 있는 경우
+    # 2. 또는 실제 대상 도메인으로 이동했고, 아직 따라가지 않은 JS 이동이 남은 중간 페이지가 아닌 경우
+    #    (세션이 만료되어 SSO를 거쳐 돌아온 코드 교환 페이지 등은 대상 도메인이어도 성공이 아님)
+    # 두 경우 모두 로그인 폼이 없어야 하며, 성공이면 에러 메시지 정규식은 실행하지 않음
+    if not has_signin_form and (logout or (actually_redirected and not _has_pending_hop(body, charset))):
+        return LoginResult(LoginOutcome.SUCCESS, None, has_signin_form, logout, status)
+
+    # 에러 메시지 우선순위: var errorMsg > alert('...') > alert("...")
+    error_match = _ERROR_VAR_RE.search(body) or _ALERT_SQ_RE.search(body) or _ALERT_DQ_RE.search(body)
+
+    # 에러 메시지가 있거나 폼이 다시 나타났으면 실패
+    if error_match or has_signin_form:
+        message = _decode_js_escape(_decode(error_match.group(1), charset)) if error_match else None
+        return LoginResult(LoginOutcome.INVALID_CREDENTIALS, message, has_signin_form, logout, status)
+
+    return LoginResult(LoginOutcome.UNKNOWN, None, has_signin_form, logout, status)
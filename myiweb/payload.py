@@ -0,0 +1,88 @@
+"""
+로그인 요청 본문 인코더
+=====================
+SSO 로그인 POST 본문(application/x-www-form-urlencoded)을 한 번에 만들어 냅니다.
+
+기존 방식은 dict를 만든 뒤 requests가 다시 urlencode하고, AES 암호화 과정에서도
+Base64 인코딩과 패딩 연결로 중간 바이트열이 여러 번 생성되었습니다.
+LoginPayloadEncoder는 패딩/암호문을 미리 할당한 버퍼에 채우고,
+암호문을 Base64 + 퍼센트 인코딩한 결과를 바로 최종 본문에 이어 붙입니다.
+"""
+
+import binascii
+from urllib.parse import quote_plus
+
+from .crypto import load_public_key
+from .crypto_backends import get_backend
+
+# AES 블록 크기
+_BLOCK_SIZE = 16
+
+
+def _form_base64(data: bytes) -> bytes:
+    """바이트열을 Base64로 인코딩한 뒤 폼 값으로 쓸 수 있게 퍼센트 인코딩합니다."""
+    # Base64 문자 중 폼 인코딩이 필요한 것은 '+', '/', '=' 세 가지뿐
+    encoded = binascii.b2a_base64(data, newline=False)
+    return encoded.replace(b'+', b'%2B').replace(b'/', b'%2F').replace(b'=', b'%3D')
+
+
+class LoginPayloadEncoder:
+    """
+    SSO 로그인 POST 본문 인코더
+
+    사용 예:
+        encoder = LoginPayloadEncoder(user_id, csrf_token)
+        body = encoder.encode(user_pw, key_info, public_key, timestamp)
+        session.post(action_url, data=body, headers={'Content-Type': 'application/x-www-form-urlencoded'})
+    """
+
+    def __init__(self, user_id: str, csrf_token: str):
+        """
+        Args:
+            user_id: 학번/교번
+            csrf_token: 로그인 페이지에서 추출한 c_r_t 값
+        """
+        # 변하지 않는 부분은 미리 인코딩해 둠
+        self._prefix = b'user_id=' + quote_plus(user_id).encode('ascii') + b'&pw=&pw_enc='
+        self._suffix = b'&c_r_t=' + quote_plus(csrf_token or '').encode('ascii') + b'&user_id_enc='
+
+    @staticmethod
+    def encrypt_password(user_pw: str, key_info: dict) -> bytes:
+        """
+        비밀번호를 Base64 인코딩 후 AES-CBC로 암호화한 원시 암호문을 반환합니다.
+        (crypto.encrypt_with_aes와 같은 결과이지만 마지막 Base64 인코딩은 하지 않음)
+        """
+        pw_bytes = user_pw.encode('utf-8')
+        b64_len = 4 * ((len(pw_bytes) + 2) // 3)
+        pad_len = _BLOCK_SIZE - (b64_len % _BLOCK_SIZE)
+
+        # Base64 결과와 PKCS7 패딩을 하나의 버퍼에 직접 채움
+        buffer = bytearray(b64_len + pad_len)
+        buffer[:b64_len] = binascii.b2a_base64(pw_bytes, newline=False)
+        buffer[b64_len:] = bytes((pad_len,)) * pad_len
+
+        return get_backend().aes_cbc_encrypt(key_info['key'], key_info['iv'], buffer)
+
+    @staticmethod
+    def encrypt_session_key(key_info: dict, public_key: str, timestamp: str) -> bytes:
+        """'keyStr,타임스탬프'를 RSA로 암호화한 원시 암호문을 반환합니다."""
+        backend = get_backend()
+        payload = f"{key_info['keyStr']},{timestamp}".encode('utf-8')
+        return backend.rsa_pkcs1v15_encrypt(load_public_key(public_key), payload)
+
+    def encode(self, user_pw: str, key_info: dict, public_key: str, timestamp: str) -> bytes:
+        """
+        최종 POST 본문을 생성합니다.
+
+        Args:
+            user_pw: 비밀번호
+            key_info: generate_session_key()에서 반환된 키 정보 dict
+            public_key: Base64로 인코딩된 RSA 공개키
+            timestamp: 밀리초 단위 타임스탬프 문자열
+
+        Returns:
+            bytes: user_id=...&pw=&pw_enc=...&encsymka=...&c_r_t=...&user_id_enc=
+        """
+        pw_enc = _form_base64(self.encrypt_password(user_pw, key_info))
+        encsymka = _form_base64(self.encrypt_session_key(key_info, public_key, timestamp))
+        return b''.join((self._prefix, pw_enc, b'&encsymka=', encsymka, self._suffix))
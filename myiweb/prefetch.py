@@ -0,0 +1,225 @@
+"""
+로그인 페이지 사전 요청 풀
+=========================
+MJUSSOLogin.login의 1단계(인가 URL GET → public-key / c_r_t / signin-form 파싱)는
+사용자 자격 증명과 무관하므로 미리 해 둘 수 있습니다.
+
+LoginPagePool은 백그라운드 스레드에서 서비스별로 로그인 페이지를 미리 받아
+(쿠키, 공개키, CSRF 토큰, 폼 action) 묶음을 보관하고, 로그인 시 하나씩 꺼내 줍니다.
+풀에서 꺼낸 항목을 사용하면 로그인이 바로 암호화 POST부터 시작되므로
+사용자 체감 지연에서 왕복 1회가 줄어듭니다.
+
+- 각 항목은 한 번만 사용됩니다. (CSRF 토큰과 SSO 세션 쿠키는 일회용)
+- ttl이 지난 항목은 폐기합니다. 서버 세션 만료 시간보다 충분히 짧게 설정하세요.
+- 풀이 비어 있으면 get()은 None을 반환하고, 로그인은 평소처럼 직접 GET합니다.
+
+사용 예:
+    with LoginPagePool(services=('msi',), size=4, ttl=300) as pages:
+        sso = MJUSSOLogin(user_id, user_pw, page_pool=pages)
+        sso.login('msi')
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+import requests
+from requests.cookies import RequestsCookieJar
+
+from .exceptions import PageParsingError
+from .parsing import parse_login_page, response_charset
+from .transport import Transport, default_transport
+from .utils import log_warning
+
+
+@dataclass
+class PrefetchedLoginPage:
+    """미리 받아 둔 로그인 페이지에서 추출한 값"""
+    service: str
+    cookies: RequestsCookieJar
+    public_key: str
+    csrf_token: str
+    form_action: str
+    page_url: str
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        """받은 뒤 지난 시간(초)"""
+        return time.monotonic() - self.fetched_at
+
+
+class LoginPagePool:
+    """
+    서비스별 로그인 페이지 사전 요청 풀
+
+    - services: 미리 받아 둘 서비스 이름 목록 (MJUSSOLogin.SERVICES의 키)
+    - size: 서비스별로 보관할 항목 수
+    - ttl: 항목 유효 시간(초). 지나면 사용하지 않고 새로 받음
+    - retry_interval: 사전 요청 실패 시 다시 시도하기까지 기다리는 시간(초)
+    - transport: HTTP 전송 계층 (None이면 프로세스 전역 공유 연결 풀)
+    """
+
+    def __init__(self, services: Iterable[str] = ('msi',), size: int = 2, ttl: float = 300.0,
+                 retry_interval: float = 5.0, transport: Optional[Transport] = None,
+                 start: bool = True):
+        # 순환 참조 방지를 위해 메서드 내에서 임포트
+        from .sso import MJUSSOLogin
+
+        services = tuple(services)
+        unknown = [s for s in services if s not in MJUSSOLogin.SERVICES]
+        if unknown:
+            raise ValueError(f"알 수 없는 서비스: {', '.join(unknown)}")
+        if size < 1:
+            raise ValueError("size는 1 이상이어야 합니다.")
+
+        self.services = services
+        self.size = size
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+        self.transport = transport or default_transport()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.errors = 0
+
+        self._urls = {s: MJUSSOLogin.SERVICES[s]['url'] for s in services}
+        self._headers = MJUSSOLogin.DEFAULT_HEADERS
+        self._pages: Dict[str, deque] = {s: deque() for s in services}
+        self._lock = threading.Lock()
+        # get()이 보충을 요청하는 이벤트와 종료 이벤트를 나눠, 실패 후 대기는 close()만 깨우도록 함
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        if start:
+            self.start()
+
+    def start(self) -> None:
+        """백그라운드 사전 요청 스레드를 시작합니다."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._fill_loop, name="LoginPagePool", daemon=True)
+        self._thread.start()
+        self._wakeup.set()
+
+    def close(self) -> None:
+        """사전 요청 스레드를 종료하고 남은 항목을 폐기합니다."""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for pages in self._pages.values():
+            pages.clear()
+
+    def __enter__(self) -> "LoginPagePool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(len(pages) for pages in self._pages.values())
+
+    def get(self, service: str) -> Optional[PrefetchedLoginPage]:
+        """
+        서비스의 로그인 페이지 항목 하나를 꺼냅니다. (한 번 꺼낸 항목은 다시 반환되지 않음)
+
+        Returns:
+            PrefetchedLoginPage, 또는 None (풀에 없는 서비스이거나 유효한 항목이 없음)
+        """
+        pages = self._pages.get(service)
+        if pages is None:
+            return None
+
+        page = None
+        with self._lock:
+            while True:
+                try:
+                    # 꺼낸 항목은 풀에서 제거되므로 여러 스레드가 같은 항목을 받지 않음
+                    candidate = pages.popleft()
+                except IndexError:
+                    break
+                if candidate.age <= self.ttl:
+                    page = candidate
+                    break
+                self.expired += 1
+
+            if page is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        # 꺼낸 만큼 바로 보충
+        self._wakeup.set()
+        return page
+
+    def stats(self) -> dict:
+        """풀 상태 및 적중/실패 통계를 반환합니다."""
+        with self._lock:
+            return {
+                'size': {service: len(pages) for service, pages in self._pages.items()},
+                'hits': self.hits,
+                'misses': self.misses,
+                'expired': self.expired,
+                'errors': self.errors,
+            }
+
+    def _fetch(self, service: str) -> PrefetchedLoginPage:
+        """로그인 페이지를 새 쿠키 저장소로 받아 파싱합니다."""
+        session = requests.Session()
+        session.headers.update(self._headers)
+        self.transport.mount(session)
+
+        response = session.get(self._urls[service], timeout=10)
+        public_key, csrf_token, form_action = parse_login_page(response.content, response_charset(response))
+        return PrefetchedLoginPage(
+            service=service,
+            cookies=session.cookies,
+            public_key=public_key,
+            csrf_token=csrf_token,
+            form_action=form_action,
+            page_url=response.url,
+            fetched_at=time.monotonic(),
+        )
+
+    def _evict_expired(self, pages: deque) -> None:
+        """오래된 항목은 앞쪽에 있으므로 앞에서부터 ttl이 지난 항목을 제거"""
+        with self._lock:
+            while pages and pages[0].age > self.ttl:
+                pages.popleft()
+                self.expired += 1
+
+    def _fill_loop(self) -> None:
+        while True:
+            # ttl 안에 한 번은 깨어나 만료된 항목을 새로 받아 둠
+            self._wakeup.wait(timeout=self.ttl / 2)
+            self._wakeup.clear()
+            if self._stop.is_set():
+                return
+
+            failed = False
+            for service, pages in self._pages.items():
+                self._evict_expired(pages)
+                while not self._stop.is_set() and len(pages) < self.size:
+                    try:
+                        pages.append(self._fetch(service))
+                    except Exception as e:
+                        # 네트워크/파싱 오류 외의 예외도 보충 스레드를 끝내지 않음
+                        with self._lock:
+                            self.errors += 1
+                        if not isinstance(e, (requests.RequestException, PageParsingError)):
+                            log_warning(f"LoginPagePool 사전 요청 실패 ({service}): {e!r}")
+                        failed = True
+                        break
+
+            if failed:
+                # 서버 오류 시 계속 재시도하지 않도록 retry_interval 동안 대기 후 다시 보충
+                # (그 사이 get()이 보낸 보충 요청은 _wakeup에 남아 있다가 대기 후 처리됨)
+                if self._stop.wait(timeout=self.retry_interval):
+                    return
+                self._wakeup.set()
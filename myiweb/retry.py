@@ -0,0 +1,264 @@
+"""
+멱등 GET 재시도 / 헤지 요청
+==========================
+일시적인 네트워크 오류나 게이트웨이 오류(502/503/504)로 로그인·조회 전체가 실패하지 않도록,
+다시 보내도 안전한 GET 요청에만 재시도와 헤지(hedged) 요청을 적용합니다.
+
+적용 대상 (멱등 GET):
+- SSO 로그인 페이지(인가 URL) GET          key='login_page'
+- SSO 세션으로 서비스 인가 GET (login_many) key='authorize'
+- MSI 홈 CSRF 토큰 GET                     key='csrf'
+- test_session의 서비스 페이지 GET          key='test_session'
+- check_alive의 서비스 페이지 헤더 확인 GET  key='liveness'
+
+자격 증명 POST, JS 폼 자동 제출 등 POST 요청은 서버 상태를 바꾸므로 재시도하지 않습니다.
+
+- 재시도: 지수 백오프(backoff * 2^n, 최대 max_backoff)에 지터를 섞어 대기 후 다시 보냅니다.
+- 헤지: 첫 응답이 해당 요청의 p95 지연 시간 안에 오지 않으면 같은 GET을 한 번 더 보내고
+  먼저 도착한 응답을 사용합니다. (꼬리 지연 감소, 요청 수는 최대 약 5% 증가)
+  p95는 trace 히스토그램의 'http.<key>' 기록에서 구하며, 기록이 부족하면 헤지하지 않습니다.
+  두 요청은 쿠키 저장소를 분리해 보내고 채택된 응답의 쿠키만 세션에 반영합니다.
+  (로그인 페이지의 c_r_t는 그 응답이 발급한 SSO 세션 쿠키와 짝이 맞아야 함)
+
+사용 예:
+    policy = RetryPolicy(attempts=3, hedge=True)
+    sso = MJUSSOLogin(user_id, user_pw, retry_policy=policy)
+"""
+
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterable, Optional
+
+import requests
+
+from .trace import latency_percentile, observe_latency
+
+# 재시도할 예외 (요청이 서버에 도달하지 못했거나 응답을 끝까지 받지 못함)
+RETRY_EXCEPTIONS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+class RetryPolicy:
+    """
+    멱등 GET 요청의 재시도 / 헤지 정책
+
+    - attempts: 최대 시도 횟수 (1이면 재시도하지 않음)
+    - backoff: 첫 재시도 전 대기 시간(초), 이후 두 배씩 증가
+    - max_backoff: 대기 시간 상한(초)
+    - jitter: 대기 시간을 줄이는 무작위 비율 (0.5면 대기 시간의 50~100% 사이에서 선택)
+    - retry_statuses: 재시도할 HTTP 상태 코드 (마지막 시도면 그 응답을 그대로 반환)
+    - hedge: 헤지 요청 사용 여부
+    - hedge_percentile: 헤지 지연으로 사용할 백분위
+    - hedge_min_samples: 헤지를 시작하기 위해 필요한 지연 시간 기록 수
+    - hedge_delay: 고정 헤지 지연(초) - 지정하면 백분위 대신 사용
+    """
+
+    def __init__(self, attempts: int = 3, backoff: float = 0.2, max_backoff: float = 2.0,
+                 jitter: float = 0.5, retry_statuses: Iterable[int] = (502, 503, 504),
+                 hedge: bool = False, hedge_percentile: float = 95.0, hedge_min_samples: int = 20,
+                 hedge_delay: Optional[float] = None):
+        if attempts < 1:
+            raise ValueError("attempts는 1 이상이어야 합니다.")
+        if not 0.0 <= jitter <= 1.0:
+            raise ValueError("jitter는 0과 1 사이여야 합니다.")
+
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_delay = hedge_delay
+
+        self.requests = 0
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        # 기본 정책은 여러 로그인 스레드가 함께 사용하므로 통계 갱신을 잠금으로 보호
+        self._lock = threading.Lock()
+
+    def stats(self) -> dict:
+        """요청/재시도/헤지 통계를 반환합니다."""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'retries': self.retries,
+                'hedges': self.hedges,
+                'hedge_wins': self.hedge_wins,
+            }
+
+    def backoff_delay(self, retry: int) -> float:
+        """retry번째(0부터) 재시도 전 대기 시간(초)"""
+        delay = min(self.max_backoff, self.backoff * (2 ** retry))
+        return delay * (1.0 - self.jitter * random.random())
+
+    def get(self, session: requests.Session, url: str, key: str, **kwargs) -> requests.Response:
+        """
+        정책에 따라 GET 요청을 보냅니다.
+
+        Args:
+            session: 요청을 보낼 세션
+            url: 요청 URL
+            key: 지연 시간 기록 키 ('http.<key>'로 히스토그램에 합산, 헤지 지연 계산에 사용)
+            **kwargs: session.get()에 그대로 전달 (timeout, stream, allow_redirects 등)
+
+        Returns:
+            requests.Response: 마지막 응답 (재시도 대상 상태 코드일 수 있음)
+
+        Raises:
+            requests.RequestException: 모든 시도가 실패했거나, 재시도 대상이 아닌 예외
+        """
+        for attempt in range(self.attempts):
+            last = attempt == self.attempts - 1
+            with self._lock:
+                self.requests += 1
+            try:
+                delay = self._hedge_delay(key)
+                if delay is None:
+                    response = self._timed_get(session, url, key, kwargs)
+                else:
+                    response = self._hedged_get(session, url, key, kwargs, delay)
+            except RETRY_EXCEPTIONS:
+                if last:
+                    raise
+            else:
+                if last or response.status_code not in self.retry_statuses:
+                    return response
+                response.close()
+
+            with self._lock:
+                self.retries += 1
+            time.sleep(self.backoff_delay(attempt))
+
+    async def aget(self, client, url: str, key: str, **kwargs):
+        """
+        httpx.AsyncClient용 get() (재시도만 적용, 헤지하지 않음)
+
+        Raises:
+            httpx.TransportError: 모든 시도가 실패했거나, 재시도 대상이 아닌 예외
+        """
+        import httpx
+
+        for attempt in range(self.attempts):
+            last = attempt == self.attempts - 1
+            with self._lock:
+                self.requests += 1
+            started = time.perf_counter()
+            try:
+                response = await client.get(url, **kwargs)
+            except httpx.TransportError:
+                if last:
+                    raise
+            else:
+                observe_latency(f'http.{key}', time.perf_counter() - started)
+                if last or response.status_code not in self.retry_statuses:
+                    return response
+
+            with self._lock:
+                self.retries += 1
+            await asyncio.sleep(self.backoff_delay(attempt))
+
+    def _hedge_delay(self, key: str) -> Optional[float]:
+        """헤지 요청을 보내기까지 기다릴 시간(초), 헤지하지 않으면 None"""
+        if not self.hedge:
+            return None
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        return latency_percentile(f'http.{key}', self.hedge_percentile, self.hedge_min_samples)
+
+    @staticmethod
+    def _timed_get(session: requests.Session, url: str, key: str, kwargs: dict) -> requests.Response:
+        started = time.perf_counter()
+        response = session.get(url, **kwargs)
+        observe_latency(f'http.{key}', time.perf_counter() - started)
+        return response
+
+    def _hedged_get(self, session: requests.Session, url: str, key: str, kwargs: dict,
+                    delay: float) -> requests.Response:
+        """delay 안에 응답이 없으면 같은 GET을 한 번 더 보내고 먼저 성공한 응답을 사용"""
+        executor = _hedge_executor()
+        branches = {}
+        primary = _isolated_session(session)
+        branches[executor.submit(self._timed_get, primary, url, key, kwargs)] = primary
+
+        done, _ = wait(branches, timeout=delay)
+        hedge_future = None
+        if not done:
+            hedged = _isolated_session(session)
+            hedge_future = executor.submit(self._timed_get, hedged, url, key, kwargs)
+            branches[hedge_future] = hedged
+            with self._lock:
+                self.hedges += 1
+
+        pending = set(branches)
+        winner, error = None, None
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    winner = future
+                    break
+                error = future.exception()
+
+        # 늦게 끝난 쪽 응답은 연결을 풀에 돌려주도록 닫음
+        for future in pending:
+            future.add_done_callback(_close_response)
+        for future in done:
+            if future is not winner and future.exception() is None:
+                future.result().close()
+
+        if winner is None:
+            raise error
+        if winner is hedge_future:
+            with self._lock:
+                self.hedge_wins += 1
+        session.cookies.update(branches[winner].cookies)
+        return winner.result()
+
+
+# 기본 정책: 일시적 오류에 최대 2회 재시도, 헤지 없음
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+# 재시도/헤지를 하지 않는 정책
+NO_RETRY = RetryPolicy(attempts=1)
+
+
+def _isolated_session(session: requests.Session) -> requests.Session:
+    """연결(adapters)과 헤더는 공유하고 쿠키 저장소만 복사한 세션"""
+    clone = requests.Session()
+    clone.headers = session.headers.copy()
+    clone.cookies = session.cookies.copy()
+    clone.adapters = session.adapters
+    clone.proxies = session.proxies
+    clone.verify = session.verify
+    clone.cert = session.cert
+    clone.trust_env = session.trust_env
+    clone.max_redirects = session.max_redirects
+    return clone
+
+
+def _close_response(future) -> None:
+    if future.exception() is None:
+        future.result().close()
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _hedge_executor() -> ThreadPoolExecutor:
+    """헤지 요청을 실행할 프로세스 전역 스레드 풀"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='hedge')
+    return _executor
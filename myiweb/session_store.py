@@ -0,0 +1,250 @@
+"""
+로그인 세션 저장소
+=================
+SSO 로그인 후의 쿠키를 사용자별로 저장해 두었다가, 다음 조회 때 다시 사용하여
+5회 이상의 왕복이 필요한 SSO 로그인을 건너뜁니다.
+
+- 저장 키: 저장소 salt로 HMAC-SHA256한 (서비스, 사용자 ID) - 평문 학번은 저장되지 않음
+- 저장 값: 쿠키 목록(JSON)을 Fernet(AES-128-CBC + HMAC)으로 암호화
+- 암호화 키: 사용자 비밀번호(+선택적 secret)에서 PBKDF2로 파생하므로
+  비밀번호를 모르면 저장된 세션을 복호화할 수 없음
+
+구현체:
+- MemorySessionStore: 프로세스 메모리 (프로세스 종료 시 사라짐)
+- SQLiteSessionStore: SQLite 파일
+- FileSessionStore: 디렉토리 내 사용자별 파일
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from http.cookiejar import Cookie
+from typing import Dict, List, Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+from requests.cookies import RequestsCookieJar
+
+# 암호화 키 파생 반복 횟수
+KDF_ITERATIONS = 100_000
+
+# 저장소별로 보관할 파생 키(Fernet) 개수 - 같은 사용자의 save/load마다 PBKDF2를 다시 계산하지 않음
+FERNET_CACHE_SIZE = 64
+
+
+# 저장할 비표준 쿠키 속성 (Cookie.get_nonstandard_attr로 읽음)
+COOKIE_ATTRS = ('HttpOnly',)
+
+
+def _cookie_to_dict(cookie: Cookie) -> dict:
+    return {
+        'name': cookie.name,
+        'value': cookie.value,
+        'domain': cookie.domain,
+        'path': cookie.path,
+        'secure': cookie.secure,
+        'expires': cookie.expires,
+        'rest': {attr: cookie.get_nonstandard_attr(attr) for attr in COOKIE_ATTRS
+                 if cookie.has_nonstandard_attr(attr)},
+    }
+
+
+def _jar_from_dicts(cookies: List[dict]) -> RequestsCookieJar:
+    jar = RequestsCookieJar()
+    for c in cookies:
+        jar.set(c['name'], c['value'], domain=c['domain'], path=c['path'],
+                secure=c['secure'], expires=c['expires'], rest=c.get('rest') or {})
+    return jar
+
+
+class SessionStore(ABC):
+    """
+    세션 저장소 기본 클래스
+
+    하위 클래스는 암호화된 바이트열을 읽고 쓰는 _get/_put/_delete만 구현합니다.
+    """
+
+    def __init__(self, salt: bytes, secret: bytes = b'', max_age: Optional[float] = 6 * 3600):
+        """
+        Args:
+            salt: 저장 키/암호화 키 파생에 쓰는 저장소 고유 salt
+            secret: 비밀번호와 함께 키 파생에 섞을 서버 측 비밀값 (선택)
+            max_age: 저장된 세션의 최대 보관 시간(초). None이면 무제한
+        """
+        self.salt = salt
+        self.secret = secret
+        self.max_age = max_age
+        # (저장 키, 비밀번호)의 해시 -> 파생된 Fernet (가장 오래 사용되지 않은 항목부터 제거)
+        self._fernets: "OrderedDict[str, Fernet]" = OrderedDict()
+        self._fernets_lock = threading.Lock()
+
+    # --- 하위 클래스 구현 ---
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _put(self, key: str, blob: bytes) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    # --- 공통 로직 ---
+
+    def _key(self, user_id: str, service: str) -> str:
+        """(서비스, 사용자 ID)의 salted 해시"""
+        return hmac.new(self.salt, f"{service}:{user_id}".encode('utf-8'), hashlib.sha256).hexdigest()
+
+    def _fernet(self, key: str, user_pw: str) -> Fernet:
+        """(저장 키, 비밀번호)의 Fernet - PBKDF2 파생 결과는 FERNET_CACHE_SIZE개까지 캐시"""
+        material = user_pw.encode('utf-8') + b'\0' + self.secret
+        # 캐시 키에는 평문 비밀번호 대신 해시를 사용
+        cache_key = hashlib.sha256(key.encode('ascii') + b'\0' + material).hexdigest()
+        with self._fernets_lock:
+            fernet = self._fernets.get(cache_key)
+            if fernet is not None:
+                self._fernets.move_to_end(cache_key)
+                return fernet
+
+        derived = hashlib.pbkdf2_hmac('sha256', material, self.salt + key.encode('ascii'), KDF_ITERATIONS, 32)
+        fernet = Fernet(base64.urlsafe_b64encode(derived))
+        with self._fernets_lock:
+            self._fernets[cache_key] = fernet
+            self._fernets.move_to_end(cache_key)
+            while len(self._fernets) > FERNET_CACHE_SIZE:
+                self._fernets.popitem(last=False)
+        return fernet
+
+    def save(self, user_id: str, user_pw: str, service: str, cookies: RequestsCookieJar) -> None:
+        """로그인된 쿠키를 암호화하여 저장합니다."""
+        key = self._key(user_id, service)
+        payload = json.dumps([_cookie_to_dict(c) for c in cookies]).encode('utf-8')
+        self._put(key, self._fernet(key, user_pw).encrypt(payload))
+
+    def load(self, user_id: str, user_pw: str, service: str) -> Optional[RequestsCookieJar]:
+        """
+        저장된 쿠키를 복호화하여 반환합니다.
+
+        Returns:
+            RequestsCookieJar, 또는 None (없음/만료/비밀번호 불일치)
+        """
+        key = self._key(user_id, service)
+        blob = self._get(key)
+        if blob is None:
+            return None
+
+        try:
+            payload = self._fernet(key, user_pw).decrypt(blob, ttl=int(self.max_age) if self.max_age else None)
+        except InvalidToken:
+            # 만료되었거나 비밀번호가 바뀐 경우 - 쓸 수 없는 항목은 제거
+            self._delete(key)
+            return None
+
+        return _jar_from_dicts(json.loads(payload))
+
+    def delete(self, user_id: str, service: str) -> None:
+        """저장된 세션을 삭제합니다. (세션 만료가 확인되었을 때 호출)"""
+        self._delete(self._key(user_id, service))
+
+
+class MemorySessionStore(SessionStore):
+    """프로세스 메모리 세션 저장소"""
+
+    def __init__(self, secret: bytes = b'', max_age: Optional[float] = 6 * 3600):
+        super().__init__(os.urandom(16), secret, max_age)
+        self._data: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._data.get(key)
+
+    def _put(self, key: str, blob: bytes) -> None:
+        with self._lock:
+            self._data[key] = blob
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+
+class SQLiteSessionStore(SessionStore):
+    """SQLite 파일 세션 저장소 (salt는 DB 안에 함께 보관)"""
+
+    def __init__(self, path: str, secret: bytes = b'', max_age: Optional[float] = 6 * 3600):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value BLOB)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions (key TEXT PRIMARY KEY, blob BLOB)")
+            self._conn.execute("INSERT OR IGNORE INTO meta VALUES ('salt', ?)", (os.urandom(16),))
+            salt = self._conn.execute("SELECT value FROM meta WHERE name = 'salt'").fetchone()[0]
+        super().__init__(bytes(salt), secret, max_age)
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute("SELECT blob FROM sessions WHERE key = ?", (key,)).fetchone()
+        return bytes(row[0]) if row else None
+
+    def _put(self, key: str, blob: bytes) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO sessions VALUES (?, ?)", (key, blob))
+
+    def _delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM sessions WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class FileSessionStore(SessionStore):
+    """디렉토리 기반 세션 저장소 (사용자별 파일, salt는 .salt 파일에 보관)"""
+
+    def __init__(self, directory: str, secret: bytes = b'', max_age: Optional[float] = 6 * 3600):
+        self.directory = directory
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        salt_path = os.path.join(directory, '.salt')
+        try:
+            with open(salt_path, 'xb') as f:
+                f.write(os.urandom(16))
+        except FileExistsError:
+            pass
+        with open(salt_path, 'rb') as f:
+            salt = f.read()
+        super().__init__(salt, secret, max_age)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.session")
+
+    def _get(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _put(self, key: str, blob: bytes) -> None:
+        # 임시 파일에 쓴 뒤 교체하여 동시 읽기 시 깨진 파일이 보이지 않도록 함
+        tmp_path = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(blob)
+        os.replace(tmp_path, self._path(key))
+
+    def _delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
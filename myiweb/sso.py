@@ -1,25 +1,43 @@
-import re
 import time
-from typing import Optional
+from urllib.parse import parse_qsl
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Union
 
 import requests
-from bs4 import BeautifulSoup, SoupStrainer
 
 from .utils import (
     Colors, log_section, log_step, log_info, log_success, log_error, 
     log_warning, log_request, log_response, mask_sensitive
 )
-from .crypto import generate_session_key, encrypt_with_rsa, encrypt_with_aes
+from .crypto import SessionKeyPool, generate_session_key
+from .csrf import CSRFTokenCache, default_csrf_cache
+from .hops import MAX_HOPS, Hop, HopModel, HopTrace, hop_model, reached_target
+from .liveness import LivenessCache, check_alive
+from .parsing import (
+    DEFAULT_CHARSET, LoginOutcome, LoginPageScanner, classify_login_result, find_csrf_token,
+    parse_login_page, response_charset,
+)
+from .payload import LoginPayloadEncoder
+from .prefetch import LoginPagePool
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from .session_store import SessionStore
+from .trace import Trace
+from .transport import Transport, default_transport, release_response
 from .exceptions import (
     MyIWebError,
     NetworkError,
-    PageParsingError,
     InvalidCredentialsError
 )
 
 
-class MJUSSOLogin:
-    """명지대학교 SSO 로그인 클래스"""
+class _SSOLoginSteps:
+    """
+    동기(MJUSSOLogin)/비동기(AsyncMJUSSOLogin) 로그인이 공유하는 단계 (요청을 보내지 않는 부분)
+    
+    로그인 페이지 파싱, 세션키 생성과 암호화, 로그인 POST 구성, JS 이동 탐지, 결과 판정을 담당합니다.
+    사용하는 클래스는 user_id, user_pw, verbose, key_pool, trace, public_key, csrf_token, form_action을
+    속성으로 가져야 합니다.
+    """
     
     # 서비스별 로그인 URL 설정
     SERVICES = {
@@ -55,204 +73,347 @@ class MJUSSOLogin:
         }
     }
     
-    def __init__(self, user_id: str, user_pw: str, verbose: bool = True):
+    # 브라우저와 동일한 기본 요청 헤더
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+    }
+    
+    def _parse_login_page(self, body: bytes, charset: str = DEFAULT_CHARSET):
+        """로그인 페이지에서 필요한 정보 추출 (본문은 디코딩하지 않은 바이트)"""
+        if self.verbose:
+            log_step("1-2", "로그인 페이지 파싱")
+        
+        with self.trace.stage('parse'):
+            self.public_key, self.csrf_token, self.form_action = parse_login_page(body, charset)
+        
+        if self.verbose:
+            log_info("Public Key", self.public_key)
+            log_info("CSRF Token", self.csrf_token)
+            log_info("Form Action", self.form_action)
+            log_success("페이지 파싱 완료")
+    
+    def _next_hop(self, model: HopModel, plan, step: int, body: bytes, page_url: str,
+                  charset: str = DEFAULT_CHARSET) -> tuple:
+        """
+        다음 JS 이동(폼 자동 제출 / location.href) 확인
+        
+        Args:
+            model: 서비스의 이동 경로 모델
+            plan: 로그인 시작 시점의 확정 경로 (None이면 일반 탐지)
+            step: 현재 단계 번호 (로깅용)
+            body: 현재 응답 본문 (디코딩하지 않은 바이트)
+            page_url: 현재 응답 URL (상대 action 해석에 사용)
+            charset: 본문 문자 집합
+        
+        Returns:
+            (Hop 또는 None, 확정 경로로 처리했는지 여부)
+        """
+        target_url = self.SERVICES[model.service]['test_url']
+        hop, learned = model.next_hop(step, body, page_url, plan, charset, target_url)
+        if hop is None or not self.verbose:
+            return hop, learned
+        
+        if hop.kind == 'form':
+            log_step(f"3-{step+2}", f"JS 폼 자동 제출 처리{' (확정 경로)' if learned else ''}")
+            log_info("Form Action", hop.url, 4)
+            # 민감 정보 마스킹
+            safe_data = {k: (mask_sensitive(v) if k in ('user_id', 'password', 'pw') else v[:30]+'...' if len(str(v)) > 30 else v) for k, v in hop.form_data.items()}
+            log_info("Form Data", str(safe_data), 4)
+        else:
+            log_step(f"3-{step+2}", f"JS 리다이렉트 따라가기{' (확정 경로)' if learned else ''}")
+            log_info("JS Redirect URL", hop.url, 4)
+        return hop, learned
+    
+    @staticmethod
+    def _js_form_headers(page_url: str) -> dict:
+        """JS 폼 자동 제출 요청 헤더"""
+        return {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Origin': f"https://{page_url.split('/')[2]}",
+            'Referer': page_url,
+        }
+    
+    def _next_session_key(self) -> dict:
+        """세션키 생성 (PBKDF2 파생 키 포함) - 풀이 있으면 미리 생성된 키 사용"""
+        with self.trace.stage('session_key'):
+            if self.key_pool is not None:
+                return self.key_pool.get()
+            return generate_session_key(32)
+    
+    def _prepare_login_body(self) -> bytes:
+        """
+        암호화된 로그인 POST 본문(urlencoded bytes)을 LoginPayloadEncoder로 한 번에 생성
+        
+        verbose 여부와 관계없이 같은 인코더를 사용하며, 로그에는 본문을 다시 나눈 필드를
+        마스킹하여 출력합니다. (_login_fields_for_log)
+        """
+        if self.verbose:
+            log_step("2", "암호화 데이터 준비")
+        
+        # 1. 세션키 생성
+        key_info = self._next_session_key()
+        
+        if self.verbose:
+            log_info("Session Key (keyStr)", f"{key_info['keyStr'][:16]}...({len(key_info['keyStr'])} chars)", 4)
+        
+        # 2. RSA 암호화 (keyStr + 타임스탬프)와 AES 암호화 (비밀번호)를 본문에 바로 인코딩
+        timestamp = str(int(time.time() * 1000))
+        with self.trace.stage('encrypt'):
+            encoder = LoginPayloadEncoder(self.user_id, self.csrf_token)
+            body = encoder.encode(self.user_pw, key_info, self.public_key, timestamp)
+        
+        if self.verbose:
+            log_success("암호화 완료")
+        return body
+    
+    @staticmethod
+    def _login_fields_for_log(body: bytes) -> dict:
+        """로그용 로그인 POST 필드 (아이디는 마스킹, 긴 암호문은 앞부분만 - pw 필드는 log_request에서 마스킹)"""
+        fields = dict(parse_qsl(body.decode('ascii'), keep_blank_values=True))
+        if fields.get('user_id'):
+            fields['user_id'] = mask_sensitive(fields['user_id'])
+        return {k: (f"{v[:30]}...({len(v)} chars)" if len(v) > 30 else v) for k, v in fields.items()}
+    
+    def _build_signin_request(self, login_url: str, login_body: bytes) -> tuple:
+        """로그인 POST 요청의 (action_url, headers) 구성"""
+        if self.verbose:
+            log_step("3", "로그인 요청 전송 (POST)")
+        
+        if self.form_action.startswith('/'):
+            action_url = f"https://sso.mju.ac.kr{self.form_action}"
+        else:
+            action_url = self.form_action
+        
+        headers = {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Origin': 'https://sso.mju.ac.kr',
+            'Referer': login_url,
+            'Upgrade-Insecure-Requests': '1',
+        }
+        
+        if self.verbose:
+            log_request('POST', action_url, headers, self._login_fields_for_log(login_body))
+        
+        return action_url, headers
+    
+    def _observe_hops(self, service: str, status: int, final_url: str, hops: List[Hop]) -> None:
+        """대상 페이지에 2xx로 도착한 로그인의 이동 경로만 학습합니다. (오류 페이지에서 끝난 경로 제외)"""
+        if reached_target(status, final_url, self.SERVICES[service]['test_url']):
+            hop_model(service).observe(hops)
+    
+    def _check_login_result(self, body: bytes, final_url: str, service_info: dict,
+                            charset: str = DEFAULT_CHARSET, status: Optional[int] = None) -> None:
+        """
+        로그인 최종 응답으로 성공 여부를 판정합니다. 실패 시 예외를 발생시킵니다.
+        
+        Raises:
+            InvalidCredentialsError: 로그인 정보가 틀렸을 때
+            NetworkError: 최종 응답이 4xx/5xx일 때
+            MyIWebError: 결과를 판단할 수 없을 때
+        """
+        if self.verbose:
+            log_step("4", "로그인 결과 확인")
+        
+        result = classify_login_result(body, final_url, service_info['success_domain'], charset, status)
+        
+        if result.outcome is LoginOutcome.SUCCESS:
+            if self.verbose:
+                log_success(f"로그인 성공! ({service_info['name']})")
+            return
+        
+        # 서비스 도메인이어도 오류 페이지에서 끝났으면 실패 (세션이 완성되지 않음)
+        if result.outcome is LoginOutcome.HTTP_ERROR:
+            if self.verbose:
+                log_error(f"로그인 실패 (HTTP {status})")
+            raise NetworkError(f"로그인 응답 오류 (HTTP {status}): {final_url}")
+        
+        # 에러 메시지가 있으면 실패
+        if result.message:
+            if self.verbose:
+                log_error("로그인 실패")
+                log_info("Server Error", result.message, 4)
+            raise InvalidCredentialsError(result.message)
+        
+        # 폼이 다시 나타났으면 실패
+        if result.outcome is LoginOutcome.INVALID_CREDENTIALS:
+            if self.verbose:
+                log_error("로그인 실패")
+                log_info("원인", "로그인 폼이 다시 표시됨 (인증 실패)", 4)
+            raise InvalidCredentialsError('인증 실패 (로그인 정보를 확인해주세요)')
+        
+        # 알 수 없는 상태
+        if self.verbose:
+            log_warning("로그인 결과 불확실")
+        
+        raise MyIWebError('알 수 없는 오류가 발생했습니다.')
+    
+    def _check_session_page(self, body: bytes, final_url: str, service_info: dict,
+                            charset: str = DEFAULT_CHARSET, status: Optional[int] = None) -> bool:
+        """test_session() 응답 판정 - 로그인 결과 확인과 같은 규칙(classify_login_result)을 사용"""
+        result = classify_login_result(body, final_url, service_info['success_domain'], charset, status)
+        if self.verbose:
+            if result.success:
+                log_success("세션 유효함")
+            elif result.has_signin_form:
+                log_warning("세션이 유효하지 않음 (로그인 페이지로 리다이렉트)")
+            elif result.outcome is LoginOutcome.HTTP_ERROR:
+                log_warning(f"세션이 유효하지 않음 (HTTP {status})")
+            else:
+                log_warning("세션이 유효하지 않음 (로그인 상태 표시 없음)")
+        return result.success
+
+
+class MJUSSOLogin(_SSOLoginSteps):
+    """명지대학교 SSO 로그인 클래스"""
+    
+    # 스트리밍 모드에서 한 번에 읽는 크기와, 값을 찾은 뒤 남은 본문을 마저 읽어
+    # 연결을 재사용할 최대 크기 (이보다 많이 남았으면 연결을 닫음)
+    STREAM_CHUNK_SIZE = 4096
+    STREAM_DRAIN_LIMIT = 16 * 1024
+    
+    def __init__(self, user_id: str, user_pw: str, verbose: bool = True,
+                 key_pool: Optional[SessionKeyPool] = None,
+                 transport: Optional[Transport] = None,
+                 page_pool: Optional[LoginPagePool] = None,
+                 stream_login_page: bool = False,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 csrf_cache: Optional[CSRFTokenCache] = None):
         """
         Args:
             user_id: 학번/교번
             user_pw: 비밀번호
             verbose: 상세 로그 출력 여부
+            key_pool: 미리 생성된 세션키 풀 (None이면 로그인 시 직접 생성)
+            transport: HTTP 전송 계층 (None이면 프로세스 전역 공유 연결 풀 사용)
+            page_pool: 미리 받아 둔 로그인 페이지 풀 (있으면 로그인 페이지 GET 생략)
+            stream_login_page: 로그인 페이지를 스트리밍으로 받아 필요한 값을 찾는 즉시 중단
+            retry_policy: 멱등 GET(로그인 페이지, 서비스 인가, 세션 테스트)의 재시도/헤지 정책
+                (None이면 일시적 오류에 최대 2회 재시도, 로그인 POST는 재시도하지 않음)
+            csrf_cache: MSI 로그인 최종 응답에서 얻은 CSRF 토큰을 조회(fetcher)에 넘겨줄 캐시
+                (None이면 프로세스 전역 캐시 - fetcher의 기본값과 같음)
         """
         self.user_id = user_id
         self.user_pw = user_pw
         self.verbose = verbose
-        
-        # requests 세션 생성 (쿠키 자동 관리)
+        self.key_pool = key_pool
+        self.page_pool = page_pool
+        self.stream_login_page = stream_login_page
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self.csrf_cache = csrf_cache or default_csrf_cache()
+        
+        # requests 세션 생성 (쿠키는 사용자별, 연결은 transport에서 공유)
+        self.transport = transport or default_transport()
         self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-        })
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        self.transport.mount(self.session)
         
         # 로그인 과정에서 획득한 데이터
         self.public_key: Optional[str] = None
         self.csrf_token: Optional[str] = None
         self.form_action: Optional[str] = None
         
-    def _parse_login_page(self, html: str):
-        """로그인 페이지에서 필요한 정보 추출"""
-        if self.verbose:
-            log_step("1-2", "로그인 페이지 파싱")
+        # 마지막 로그인 페이지 요청의 전송량/소요 시간
+        self.login_page_stats: dict = {}
         
-        # 정규표현식으로 먼저 빠르게 추출 시도
-        public_key_match = re.search(r'id=["\"]public-key["\"][^>]*value=["\"]([^"\"]+)["\"]', html)
-        if not public_key_match:
-            public_key_match = re.search(r'value=["\"]([^"\"]+)["\"][^>]*id=["\"]public-key["\"]', html)
+        # 마지막 로그인의 이동 추적 (로그인 POST 이후)
+        self.hop_trace: Optional[HopTrace] = None
         
-        csrf_match = re.search(r'id=["\"]c_r_t["\"][^>]*value=["\"]([^"\"]+)["\"]', html)
-        if not csrf_match:
-            csrf_match = re.search(r'value=["\"]([^"\"]+)["\"][^>]*id=["\"]c_r_t["\"]', html)
+        # 마지막 로그인의 단계별 기록 (login() 호출마다 새로 생성)
+        self.trace = Trace('login', aggregate=False)
         
-        form_action_match = re.search(r'<form[^>]*id=["\"]signin-form["\"][^>]*action=["\"]([^"\"]+)["\"]', html)
-        if not form_action_match:
-            form_action_match = re.search(r'<form[^>]*action=["\"]([^"\"]+)["\"][^>]*id=["\"]signin-form["\"]', html)
+    def _fetch_login_page(self, login_url: str) -> None:
+        """로그인 페이지 GET 후 파싱 (stream_login_page이면 값을 찾는 즉시 수신 중단)"""
+        if self.verbose:
+            log_step("1-1", "로그인 페이지 접속 (GET)")
+            log_request('GET', login_url)
         
-        # 정규표현식으로 모두 찾은 경우 BeautifulSoup 스킵
-        if public_key_match and csrf_match and form_action_match:
-            self.public_key = public_key_match.group(1)
-            self.csrf_token = csrf_match.group(1)
-            self.form_action = form_action_match.group(1)
+        started = time.perf_counter()
+        with self.trace.stage('login_page') as stage:
+            try:
+                response = self.retry_policy.get(self.session, login_url, 'login_page',
+                                                 timeout=10, stream=self.stream_login_page)
+                if self.verbose:
+                    log_response(response)
+                
+                charset = response_charset(response, sniff=not self.stream_login_page)
+                if self.stream_login_page:
+                    body = self._scan_login_page_stream(response, charset)
+                else:
+                    body = response.content
+            except requests.RequestException as e:
+                raise NetworkError(f"페이지 접속 실패: {e}") from e
             
-            if self.verbose:
-                log_info("Public Key", self.public_key)
-                log_info("CSRF Token", self.csrf_token)
-                log_info("Form Action", self.form_action)
-                log_success("페이지 파싱 완료 (regex)")
-            return
-
-        # 정규표현식 실패 시 lxml + SoupStrainer로 폴백
-        parse_only = SoupStrainer(['input', 'form'])
-        soup = BeautifulSoup(html, 'lxml', parse_only=parse_only)
-        
-        # 1. 공개키 추출
-        public_key_input = soup.find('input', {'id': 'public-key'})
-        if not public_key_input:
-            raise PageParsingError("공개키(public-key)를 찾을 수 없습니다.")
-        self.public_key = public_key_input.get('value')
-        
-        if self.verbose:
+            self.login_page_stats = {
+                'streamed': self.stream_login_page,
+                # 압축 응답이면 압축된 상태의 바이트 수
+                'bytes_read': response.raw.tell() if response.raw is not None else len(response.content),
+                'content_length': response.headers.get('Content-Length'),
+                'seconds': time.perf_counter() - started,
+            }
+            stage.record(response, self.login_page_stats['bytes_read'])
+        
+        # 스트리밍 중 세 값을 모두 찾은 경우 body는 None
+        if body is not None:
+            self._parse_login_page(body, charset)
+        elif self.verbose:
+            log_step("1-2", "로그인 페이지 파싱 (스트리밍)")
             log_info("Public Key", self.public_key)
-        
-        # 2. CSRF 토큰 추출
-        csrf_input = soup.find('input', {'id': 'c_r_t'})
-        if not csrf_input:
-            raise PageParsingError("CSRF 토큰(c_r_t)을 찾을 수 없습니다.")
-        self.csrf_token = csrf_input.get('value')
-        
-        if self.verbose:
             log_info("CSRF Token", self.csrf_token)
-        
-        # 3. Form Action URL 추출
-        form = soup.find('form', {'id': 'signin-form'})
-        if not form:
-            raise PageParsingError("로그인 폼(signin-form)을 찾을 수 없습니다.")
-        self.form_action = form.get('action')
-        
-        if self.verbose:
             log_info("Form Action", self.form_action)
+            log_info("Bytes Read", f"{self.login_page_stats['bytes_read']} / {self.login_page_stats['content_length'] or '?'}")
             log_success("페이지 파싱 완료")
 
-    def _handle_js_form_submit(self, response: requests.Response, step: int) -> Optional[requests.Response]:
+    def _scan_login_page_stream(self, response: requests.Response, charset: str) -> Optional[bytes]:
         """
-        JavaScript 자동 폼 제출 처리
-        
-        예: <body onLoad="doLogin()">
-            <form action="/servlet/login_security" method="post">
-                <input name="code" value="..."/>
-                <input name="_csrf" value="..."/>
-            </form>
-        
-        Args:
-            response: 현재 응답
-            step: 현재 단계 번호 (로깅용)
+        스트리밍 응답을 청크 단위로 스캔합니다. (청크는 디코딩하지 않음)
         
         Returns:
-            폼 제출 후 응답, 또는 None (폼이 없는 경우)
+            세 값을 모두 찾았으면 None, 못 찾았으면 지금까지 받은 전체 본문 (일반 파싱으로 폴백)
         """
-        html = response.text
-        
-        # onLoad에서 폼 제출하는 패턴 감지
-        if 'onLoad=' not in html or ('submit()' not in html and 'doLogin()' not in html):
-            return None
-        
-        # 정규표현식으로 빠르게 폼 데이터 추출 시도
-        form_action_match = re.search(r'<form[^>]*action=["\"]([^"\"]+)["\"]', html)
-        if not form_action_match:
-            return None
-        
-        action = form_action_match.group(1)
-        if not action:
-            return None
-        
-        # hidden input들 추출
-        input_pattern = re.compile(r'<input[^>]*name=["\"]([^"\"]+)["\"][^>]*value=["\"]([^"\"]*)["\"]|<input[^>]*value=["\"]([^"\"]*)["\"][^>]*name=["\"]([^"\"]+)["\"]')
-        form_data = {}
-        for match in input_pattern.finditer(html):
-            if match.group(1):
-                form_data[match.group(1)] = match.group(2)
-            elif match.group(4):
-                form_data[match.group(4)] = match.group(3)
-        
-        if not form_data:
-            # 정규표현식 실패 시 lxml로 폴백
-            parse_only = SoupStrainer('form')
-            soup = BeautifulSoup(html, 'lxml', parse_only=parse_only)
-            form = soup.find('form')
-            if not form:
-                return None
-            for input_tag in form.find_all('input'):
-                name = input_tag.get('name')
-                value = input_tag.get('value', '')
-                if name:
-                    form_data[name] = value
-        
-        if not form_data:
-            return None
-        
-        # 절대 URL로 변환
-        from urllib.parse import urljoin
-        action_url = urljoin(response.url, action)
-        
-        if self.verbose:
-            log_step(f"3-{step+2}", f"JS 폼 자동 제출 처리")
-            log_info("Form Action", action_url, 4)
-            # 민감 정보 마스킹
-            safe_data = {k: (mask_sensitive(v) if k in ('user_id', 'password', 'pw') else v[:30]+'...' if len(str(v)) > 30 else v) for k, v in form_data.items()}
-            log_info("Form Data", str(safe_data), 4)
-        
-        headers = {
-            'Content-Type': 'application/x-www-form-urlencoded',
-            'Origin': f"https://{response.url.split('/')[2]}",
-            'Referer': response.url,
-        }
-        
-        return self.session.post(action_url, data=form_data, headers=headers, allow_redirects=True, timeout=15)
+        scanner = LoginPageScanner(charset)
+        chunks = []
+        try:
+            for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                chunks.append(chunk)
+                if scanner.feed(chunk):
+                    self.public_key, self.csrf_token, self.form_action = scanner.result()
+                    return None
+            return b''.join(chunks)
+        finally:
+            release_response(response, self.STREAM_DRAIN_LIMIT)
 
-    def _prepare_encrypted_data(self) -> dict:
-        """암호화된 로그인 데이터 준비"""
-        if self.verbose:
-            log_step("2", "암호화 데이터 준비")
-        
-        # 1. 세션키 생성 (PBKDF2 파생 키 포함)
-        key_info = generate_session_key(32)
-        
-        if self.verbose:
-            log_info("Session Key (keyStr)", f"{key_info['keyStr'][:16]}...({len(key_info['keyStr'])} chars)", 4)
+    def _use_prefetched_page(self, service: str) -> bool:
+        """
+        사전 요청 풀에서 로그인 페이지를 꺼내 현재 세션에 적용합니다.
         
-        # 2. 타임스탬프 생성
-        timestamp = str(int(time.time() * 1000))
+        Returns:
+            bool: 미리 받아 둔 페이지를 사용했으면 True (1단계 GET 생략)
+        """
+        if self.page_pool is None:
+            return False
         
-        # 3. RSA 암호화 (keyStr + 타임스탬프) - 서버로 keyStr 전송
-        rsa_payload = f"{key_info['keyStr']},{timestamp}"
-        encsymka = encrypt_with_rsa(rsa_payload, self.public_key, verbose=self.verbose)
+        page = self.page_pool.get(service)
+        if page is None:
+            return False
         
-        # 4. AES 암호화 (비밀번호) - PBKDF2로 파생된 key와 iv 사용
-        pw_enc = encrypt_with_aes(self.user_pw, key_info, verbose=self.verbose)
+        # 로그인 페이지를 받을 때 발급된 SSO 세션 쿠키를 이어받아야 c_r_t가 유효함
+        self.session.cookies.update(page.cookies)
+        self.public_key = page.public_key
+        self.csrf_token = page.csrf_token
+        self.form_action = page.form_action
         
         if self.verbose:
-            log_success("암호화 완료")
-        
-        return {
-            'user_id': self.user_id,
-            'pw': '',
-            'pw_enc': pw_enc,
-            'encsymka': encsymka,
-            'c_r_t': self.csrf_token,
-            'user_id_enc': '',
-        }
-    
+            log_step("1-1", "미리 받아 둔 로그인 페이지 사용 (GET 생략)")
+            log_info("Page Age", f"{page.age:.1f}s")
+            log_info("Public Key", self.public_key)
+            log_info("CSRF Token", self.csrf_token)
+            log_info("Form Action", self.form_action)
+        return True
+
     def login(self, service: str = 'msi') -> requests.Session:
         """
         SSO 로그인 수행
@@ -268,169 +429,266 @@ class MJUSSOLogin:
             PageParsingError: 로그인 페이지 파싱에 실패했을 때
             NetworkError: 네트워크 요청에 실패했을 때
             MyIWebError: 그 외 알 수 없는 에러
+        
+        단계별 소요 시간은 self.trace에 기록됩니다. (myiweb.trace 참고)
         """
         if service not in self.SERVICES:
             raise MyIWebError(f'Unknown service: {service}')
         
+        self.trace = Trace(f'login.{service}')
+        with self.trace:
+            self._login(service)
+        if self.verbose:
+            log_info("Trace", self.trace.breakdown())
+        return self.session
+
+    def _login(self, service: str) -> None:
+        """login()의 본문 (self.trace가 준비된 상태에서 호출)"""
         service_info = self.SERVICES[service]
+        self.transport.record_login()
         
         if self.verbose:
             log_section(f"MJU SSO 로그인: {service_info['name']}")
             print(f"  User ID: {mask_sensitive(self.user_id)}")
         
         # Step 1: 로그인 페이지 접속
-        if self.verbose:
-            log_step("1-1", "로그인 페이지 접속 (GET)")
-        
         login_url = service_info['url']
         
-        if self.verbose:
-            log_request('GET', login_url)
-        
-        try:
-            response = self.session.get(login_url, timeout=10)
-            if self.verbose:
-                log_response(response)
-        except requests.RequestException as e:
-            raise NetworkError(f"페이지 접속 실패: {e}") from e
-        
-        # 페이지 파싱
-        self._parse_login_page(response.text)
+        if not self._use_prefetched_page(service):
+            self._fetch_login_page(login_url)
         
         # Step 2: 암호화 데이터 준비
-        encrypted_data = self._prepare_encrypted_data()
+        login_body = self._prepare_login_body()
         
         # Step 3: 로그인 요청
-        if self.verbose:
-            log_step("3", "로그인 요청 전송 (POST)")
+        action_url, headers = self._build_signin_request(login_url, login_body)
         
-        if self.form_action.startswith('/'):
-            action_url = f"https://sso.mju.ac.kr{self.form_action}"
-        else:
-            action_url = self.form_action
-        
-        headers = {
-            'Content-Type': 'application/x-www-form-urlencoded',
-            'Origin': 'https://sso.mju.ac.kr',
-            'Referer': login_url,
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
-        if self.verbose:
-            log_request('POST', action_url, headers, encrypted_data)
+        self.hop_trace = HopTrace(service)
         
         try:
-            response = self.session.post(
-                action_url, 
-                data=encrypted_data, 
-                headers=headers,
-                allow_redirects=True,
-                timeout=15
-            )
+            started = time.perf_counter()
+            with self.trace.stage('signin_post') as stage:
+                response = self.session.post(
+                    action_url, 
+                    data=login_body,
+                    headers=headers,
+                    allow_redirects=True,
+                    timeout=15
+                )
+                stage.record(response)
+            self.hop_trace.add_response('post', response, started)
             if self.verbose:
                 log_response(response)
             
-            # JavaScript 폼 제출 및 리다이렉트 처리 (최대 3회 - MSI 로그인에 필요한 실제 횟수)
-            for i in range(3):
-                # JavaScript 폼 자동 제출 처리 (onLoad="doLogin()" 등)
-                form_handled = self._handle_js_form_submit(response, i)
-                if form_handled:
-                    response = form_handled
-                    if self.verbose:
-                        log_response(response)
-                    continue
-                
-                # location.href 리다이렉트 처리
-                js_redirect_match = re.search(r"location\.href\s*=\s*['\"](.*?)['\"]", response.text)
-                if js_redirect_match:
-                    redirect_url = js_redirect_match.group(1)
-                    if redirect_url.startswith('http'):
-                        if self.verbose:
-                            log_step(f"3-{i+2}", "JS 리다이렉트 따라가기")
-                            log_info("JS Redirect URL", redirect_url, 4)
-                        response = self.session.get(redirect_url, allow_redirects=True, timeout=15)
-                        if self.verbose:
-                            log_response(response)
-                        continue
-                
-                # 더 이상 처리할 JS 동작이 없음
-                break
+            # JavaScript 폼 제출 및 리다이렉트 처리
+            response, hops = self._follow_hops(response, service)
                         
         except requests.RequestException as e:
             raise NetworkError(f"로그인 요청 실패: {e}") from e
         
         # Step 4: 결과 확인
+        with self.trace.stage('check_result'):
+            self._check_login_result(response.content, response.url, service_info, response_charset(response),
+                                     response.status_code)
+        self._harvest_csrf_token(response)
+        self._observe_hops(service, response.status_code, response.url, hops)
         if self.verbose:
-            log_step("4", "로그인 결과 확인")
+            log_info("Hop Trace", self.hop_trace.summary())
+
+    def _follow_hops(self, response: requests.Response, service: str) -> tuple:
+        """
+        JS 폼 자동 제출 / location.href 이동을 따라갑니다. (최대 3회 - MSI 로그인에 필요한 실제 횟수)
+        
+        Returns:
+            (마지막 응답, 따라간 Hop 목록)
+        """
+        model = hop_model(service)
+        plan = model.plan
+        self.hop_trace.learned = plan is not None
+        hops = []
+        
+        for i in range(MAX_HOPS):
+            hop, learned = self._next_hop(model, plan, i, response.content, response.url, response_charset(response))
+            if hop is None:
+                # 더 이상 처리할 JS 동작이 없음
+                break
+            hops.append(hop)
+            
+            started = time.perf_counter()
+            with self.trace.stage(f'hop{i+1}_{hop.kind}') as stage:
+                if hop.kind == 'form':
+                    # JavaScript 폼 자동 제출 처리 (onLoad="doLogin()" 등)
+                    response = self.session.post(hop.url, data=hop.form_data, headers=self._js_form_headers(response.url),
+                                                 allow_redirects=True, timeout=15)
+                else:
+                    # location.href 리다이렉트 처리
+                    response = self.session.get(hop.url, allow_redirects=True, timeout=15)
+                stage.record(response)
+            self.hop_trace.add_response(hop.kind, response, started, learned)
+            if self.verbose:
+                log_response(response)
         
-        final_url = response.url
-        success_domain = service_info['success_domain']
+        return response, hops
+
+    def login_many(self, services: Optional[Iterable[str]] = None, max_workers: Optional[int] = None,
+                   return_exceptions: bool = False) -> Dict[str, Union[requests.Session, MyIWebError]]:
+        """
+        여러 서비스에 한 번에 로그인
         
-        # 에러 메시지 확인 - var errorMsg = "..." 패턴
-        error_msg = None
-        var_error_match = re.search(r'var errorMsg = "([^"]+)"', response.text)
-        if var_error_match:
-            error_msg = var_error_match.group(1)
+        첫 번째 서비스만 자격 증명으로 로그인하고, 나머지 서비스는 그 SSO 세션 쿠키를 복사한
+        별도 세션에서 인가 과정(authorize → code 교환 → JS 이동)만 동시에 수행합니다.
+        
+        Args:
+            services: 로그인할 서비스 목록 (None이면 SERVICES 전체, 첫 번째가 자격 증명 로그인)
+            max_workers: 동시 인가 스레드 수 (None이면 나머지 서비스 수)
+            return_exceptions: True이면 실패한 서비스의 예외를 결과에 담아 반환, False이면 첫 예외를 발생
+        
+        Returns:
+            dict: {서비스 이름: 로그인된 requests.Session (또는 예외)}
+        
+        Raises:
+            InvalidCredentialsError: 로그인 정보가 틀렸을 때 (첫 번째 서비스)
+            MyIWebError: 알 수 없는 서비스이거나, return_exceptions=False에서 인가에 실패했을 때
+        """
+        services = list(services) if services is not None else list(self.SERVICES)
+        if not services:
+            return {}
+        for service in services:
+            if service not in self.SERVICES:
+                raise MyIWebError(f'Unknown service: {service}')
+        
+        first, rest = services[0], services[1:]
+        sessions: Dict[str, Union[requests.Session, MyIWebError]] = {first: self.login(first)}
+        if not rest:
+            return sessions
+        
+        if self.verbose:
+            log_step("5", f"SSO 세션으로 나머지 서비스 동시 인가 ({', '.join(rest)})")
+        
+        def authorize(service: str) -> requests.Session:
+            child = MJUSSOLogin(self.user_id, self.user_pw, verbose=False, key_pool=self.key_pool,
+                                transport=self.transport, retry_policy=self.retry_policy,
+                                csrf_cache=self.csrf_cache)
+            child.session.cookies.update(self.session.cookies)
+            return child._login_with_sso_session(service)
+        
+        with ThreadPoolExecutor(max_workers=max_workers or len(rest), thread_name_prefix='login_many') as executor:
+            futures = {service: executor.submit(authorize, service) for service in rest}
+        
+        for service, future in futures.items():
             try:
-                # Unicode escape 디코딩
-                error_msg = error_msg.encode('utf-8').decode('unicode_escape')
-            except:
-                pass
-        
-        # alert() 패턴도 확인
-        if not error_msg:
-            alert_match = re.search(r"alert\('(.+?)'\)", response.text)
-            if not alert_match:
-                alert_match = re.search(r'alert\("(.+?)"\)', response.text)
-            if alert_match:
-                error_msg = alert_match.group(1)
-                try:
-                    error_msg = error_msg.encode('utf-8').decode('unicode_escape')
-                except:
-                    pass
-        
-        # 로그인 폼이 다시 나타났는지 확인 (실패 시 폼이 다시 표시됨)
-        has_signin_form = 'signin-form' in response.text and 'input-password' in response.text
-        
-        # 실제 대상 도메인으로 이동했는지 확인 (URL 파싱)
-        from urllib.parse import urlparse
-        parsed_url = urlparse(final_url)
-        actually_redirected = success_domain in parsed_url.netloc
-        
-        # 로그아웃 버튼이 있는지 확인 (로그인 상태 표시)
-        has_logout_button = '로그아웃' in response.text or 'logout' in response.text.lower()
-        
-        # 성공 판정:
-        # 1. 실제 대상 도메인으로 이동했고 로그인 폼이 없는 경우
-        # 2. 또는 로그아웃 버튼이 있는 경우
-        if (actually_redirected and not has_signin_form) or (has_logout_button and not has_signin_form):
-            if self.verbose:
-                log_success(f"로그인 성공! ({service_info['name']})")
-            
-            return self.session
+                sessions[service] = future.result()
+                if self.verbose:
+                    log_success(f"{self.SERVICES[service]['name']} 인가 완료")
+            except MyIWebError as e:
+                if self.verbose:
+                    log_error(f"{self.SERVICES[service]['name']} 인가 실패: {e}")
+                if not return_exceptions:
+                    raise
+                sessions[service] = e
         
-        # 에러 메시지가 있으면 실패
-        if error_msg:
-            if self.verbose:
-                log_error("로그인 실패")
-                log_info("Server Error", error_msg, 4)
-            raise InvalidCredentialsError(error_msg)
+        return sessions
+
+    def _login_with_sso_session(self, service: str) -> requests.Session:
+        """
+        이미 SSO에 로그인된 쿠키로 서비스 인가 과정만 수행 (자격 증명 POST 생략)
         
-        # 폼이 다시 나타났으면 실패
-        if has_signin_form:
+        SSO 세션이 인정되지 않아 로그인 페이지가 나오면 일반 로그인을 수행합니다.
+        """
+        service_info = self.SERVICES[service]
+        self.hop_trace = HopTrace(service)
+        self.trace = Trace(f'authorize.{service}')
+        
+        with self.trace:
+            try:
+                started = time.perf_counter()
+                with self.trace.stage('authorize_get') as stage:
+                    response = self.retry_policy.get(self.session, service_info['url'], 'authorize',
+                                                     allow_redirects=True, timeout=15)
+                    stage.record(response)
+                self.hop_trace.add_response('get', response, started)
+                
+                if classify_login_result(response.content, charset=response_charset(response)).has_signin_form:
+                    self.trace.aggregate = False
+                    return self.login(service)
+                
+                response, hops = self._follow_hops(response, service)
+            except requests.RequestException as e:
+                raise NetworkError(f"서비스 인가 실패: {e}") from e
+            
+            with self.trace.stage('check_result'):
+                self._check_login_result(response.content, response.url, service_info, response_charset(response),
+                                         response.status_code)
+        self._harvest_csrf_token(response)
+        self._observe_hops(service, response.status_code, response.url, hops)
+        return self.session
+
+    def _harvest_csrf_token(self, response: requests.Response) -> None:
+        """MSI 로그인 최종 응답(index_Myiweb.jsp)에 CSRF 토큰이 있으면 조회용으로 기억합니다. (MySecurityStart GET 생략)"""
+        if 'msi.mju.ac.kr' not in response.url:
+            return
+        token = find_csrf_token(response.content, response_charset(response))
+        if token:
+            self.csrf_cache.put(self.session, token)
             if self.verbose:
-                log_error("로그인 실패")
-                log_info("원인", "로그인 폼이 다시 표시됨 (인증 실패)", 4)
-            raise InvalidCredentialsError('인증 실패 (로그인 정보를 확인해주세요)')
+                log_info("MSI CSRF Token", token)
+
+    def restore_session(self, store: SessionStore, service: str = 'msi', validate: bool = False) -> bool:
+        """
+        세션 저장소에서 이전 로그인 쿠키를 불러와 현재 세션에 적용합니다.
         
-        # 알 수 없는 상태
+        Args:
+            store: 세션 저장소
+            service: 서비스 이름
+            validate: True이면 check_alive()로 유효성을 확인 (캐시에 없으면 헤더만 받는 요청 1회 추가)
+        
+        Returns:
+            bool: 쓸 수 있는 세션을 불러왔으면 True
+        """
+        cookies = store.load(self.user_id, self.user_pw, service)
+        if cookies is None:
+            return False
+        
+        self.session.cookies.update(cookies)
         if self.verbose:
-            log_warning("로그인 결과 불확실")
+            log_success(f"저장된 세션 사용 ({len(cookies)} cookies)")
         
-        raise MyIWebError('알 수 없는 오류가 발생했습니다.')
+        if validate and not self.check_alive(service):
+            store.delete(self.user_id, service)
+            self.session.cookies.clear()
+            return False
+        return True
+    
+    def save_session(self, store: SessionStore, service: str = 'msi') -> None:
+        """현재 세션의 쿠키를 세션 저장소에 저장합니다."""
+        store.save(self.user_id, self.user_pw, service, self.session.cookies)
+    
+    def check_alive(self, service: str = 'msi', cache: Optional[LivenessCache] = None) -> bool:
+        """
+        세션이 살아 있는지 빠르게 확인합니다. (myiweb.liveness 참고)
+        
+        ttl 안에 같은 쿠키로 유효 판정을 받은 적이 있으면 요청을 보내지 않고, 아니면 서비스 페이지를
+        리다이렉트 없이 요청해 응답 헤더만으로 판단합니다. 본문의 로그아웃 버튼까지 확인하려면
+        test_session()을 사용하세요.
+        
+        Args:
+            service: 서비스 이름
+            cache: 유효 판정 캐시 (None이면 프로세스 전역 캐시, ttl 60초)
+        """
+        test_url = self.SERVICES.get(service, {}).get('test_url')
+        if not test_url:
+            return False
+        
+        alive = check_alive(self.session, service, test_url, cache, self.retry_policy)
+        if self.verbose:
+            if alive:
+                log_success("세션 유효함")
+            else:
+                log_warning("세션이 유효하지 않음")
+        return alive
     
     def test_session(self, service: str = 'msi') -> bool:
-        """세션 유효성 테스트"""
+        """세션 유효성 테스트 (페이지 전체를 받아 로그인 결과와 같은 규칙으로 판정)"""
         service_info = self.SERVICES.get(service, {})
         test_url = service_info.get('test_url')
         
@@ -442,27 +700,15 @@ class MJUSSOLogin:
             log_info("Test URL", test_url)
         
         try:
-            response = self.session.get(test_url, timeout=10, allow_redirects=True)
+            response = self.retry_policy.get(self.session, test_url, 'test_session',
+                                             timeout=10, allow_redirects=True)
             
             if self.verbose:
                 log_info("응답 상태", response.status_code)
                 log_info("최종 URL", response.url)
             
-            # SSO 또는 login_security로 리다이렉트되면 세션 만료
-            if 'sso.mju.ac.kr' in response.url or 'login_security' in response.url:
-                if self.verbose:
-                    log_warning("세션이 유효하지 않음 (로그인 페이지로 리다이렉트)")
-                return False
-            
-            # 로그아웃 버튼이 있으면 유효한 세션
-            if '로그아웃' in response.text or 'logout' in response.text.lower():
-                if self.verbose:
-                    log_success("세션 유효함")
-                return True
-            
-            if self.verbose:
-                log_warning("세션 상태 불확실")
-            return False
+            return self._check_session_page(response.content, response.url, service_info,
+                                            response_charset(response), response.status_code)
             
         except requests.RequestException as e:
             log_error(f"테스트 실패: {e}")
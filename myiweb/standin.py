@@ -0,0 +1,764 @@
+"""
+로컬 SSO / MSI 대역 서버
+=======================
+실제 sso.mju.ac.kr / msi.mju.ac.kr 대신 로컬에서 같은 프로토콜로 응답하는 테스트·부하 측정용 서버입니다.
+
+- 로그인 페이지: 서버 시작 시 생성한 RSA 키(public-key)와 세션별 c_r_t를 담은 signin-form
+- 로그인 POST: encsymka(RSA-PKCS1 v1.5)로 세션키를 복원하고, PBKDF2로 파생한 AES 키로 pw_enc를
+  복호화하여 비밀번호를 확인 (실패 시 errorMsg가 담긴 로그인 페이지를 다시 표시)
+- 성공 시 302 → redirect_uri?code=... → onLoad 폼 자동 제출(/servlet/login_security)
+  → location.href → index_Myiweb.jsp 순서로 실제와 같은 이동 과정을 거침
+- MSI: MySecurityStart(CSRF meta), Sum00Svl01getStdCard(Sys15Svl01verifyPW 2차 인증 포함),
+  Sud00Svl03viewChangeLog
+- 그 외 서비스(lms, portal, library, myicap): 코드 교환 후 로그아웃 버튼이 있는 페이지
+
+StandInTransport는 https://<서비스>.mju.ac.kr 요청을 로컬 서버로 보내되 응답 URL과 쿠키 도메인은
+원래 주소를 유지하므로, MJUSSOLogin과 fetcher를 수정 없이 그대로 사용할 수 있습니다.
+
+사용 예:
+    from myiweb.standin import StandInServer, StandInTransport
+    from myiweb.transport import set_default_transport
+
+    with StandInServer(users={'60201234': 'password'}, latency=0.02, error_rate=0.01) as server:
+        sso = MJUSSOLogin('60201234', 'password', transport=StandInTransport(server))
+        session = sso.login('msi')
+        set_default_transport(StandInTransport(server))   # StudentCard.fetch 등 전체에 적용
+
+    # 비동기 로그인 (httpx 필요)
+    client = httpx.AsyncClient(transport=server.async_transport(), follow_redirects=True)
+    AsyncMJUSSOLogin(user_id, user_pw, client=client)
+"""
+
+import base64
+import hashlib
+import html
+import random
+import secrets
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qs, quote, urlencode, urlsplit, urlunsplit
+
+import requests
+from cryptography.hazmat.primitives import padding, serialization
+from cryptography.hazmat.primitives.asymmetric import padding as asym_padding
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from requests.adapters import HTTPAdapter
+
+from .sso import MJUSSOLogin
+from .transport import PooledAdapter, SharedTransport, TransportStats
+
+SSO_HOST = 'sso.mju.ac.kr'
+MSI_HOST = 'msi.mju.ac.kr'
+
+# 서비스 이름 -> (호스트, redirect_uri 경로, 로그인 후 이동할 test_url)
+_SERVICE_ROUTES: Dict[str, Tuple[str, str, str]] = {}
+for _name, _info in MJUSSOLogin.SERVICES.items():
+    _redirect = urlsplit(parse_qs(urlsplit(_info['url']).query)['redirect_uri'][0])
+    _SERVICE_ROUTES[_name] = (_redirect.hostname, _redirect.path, _info['test_url'])
+del _name, _info, _redirect
+
+# 대역 서버가 응답하는 호스트 (StandInTransport가 장착되는 주소)
+VIRTUAL_HOSTS = (SSO_HOST,) + tuple(dict.fromkeys(host for host, _, _ in _SERVICE_ROUTES.values()))
+
+# 로그인 POST의 타임스탬프 허용 오차(초)
+MAX_CLOCK_SKEW = 300.0
+
+INVALID_CREDENTIALS_MESSAGE = "아이디 또는 비밀번호가 일치하지 않습니다."
+
+# 1x1 PNG (학생카드 사진)
+_PHOTO = ('iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg==')
+
+
+@dataclass
+class StandInProfile:
+    """대역 서버가 돌려주는 학생 정보"""
+    name_korean: str = "홍길동"
+    name_english_first: str = "HONG"
+    name_english_last: str = "GILDONG"
+    grade: str = "3"
+    status: str = "재학"
+    department: str = "컴퓨터공학과"
+    advisor: str = "김교수"
+    completed_semesters: str = "5"
+    phone: str = "02-300-1234"
+    mobile: str = "010-1234-5678"
+    email: str = "student@mju.ac.kr"
+    address: Tuple[str, str, str, str] = ("03", "674", "서울특별시 서대문구 거북골로 34", "명지대학교")
+    focus_newsletter: bool = True
+
+
+@dataclass
+class _SSOSession:
+    c_r_t: str
+    user_id: Optional[str] = None
+
+
+@dataclass
+class _ServiceSession:
+    """서비스(MSI 등) 쪽 세션"""
+    user_id: str
+    code: Optional[str] = None        # login_security로 교환할 코드 (MSI)
+    logged_in: bool = False
+    csrf: str = field(default_factory=lambda: secrets.token_hex(16))
+    verified: bool = False            # 2차 비밀번호 인증 여부
+
+
+class StandInServer:
+    """
+    SSO + MSI 대역 서버 (ThreadingHTTPServer)
+
+    - users: {아이디: 비밀번호}
+    - profiles: {아이디: StandInProfile} (없으면 기본값)
+    - latency / jitter: 모든 응답 전 대기 시간(초)과 그 위에 더하는 균등 분포 무작위 시간(초)
+    - route_latency: {경로 이름: 대기 시간(초)} - latency 대신 사용 (경로 이름은 ROUTES 참고)
+    - error_rate: 오류를 주입할 요청 비율 (0~1)
+    - error_status: 주입할 HTTP 상태 코드. 0이면 응답 없이 연결을 끊음 (ConnectionError)
+    - error_routes: 오류를 주입할 경로 이름 (None이면 모든 경로)
+    - second_factor: 학생카드 조회에 2차 비밀번호 인증을 요구할지 여부
+    - page_padding: HTML 응답의 </body> 앞에 덧붙일 메뉴 마크업 크기(바이트) - 실제 페이지 크기 재현용
+    - charset_header: Content-Type에 charset을 표시할지 여부
+    - seed: 지연/오류 주입 난수 시드
+    """
+
+    # 경로 이름 (route_latency, error_routes, stats()['routes']에 사용)
+    ROUTES = ('login_page', 'signin', 'authorize', 'code', 'login_security', 'home', 'security_start',
+              'student_card', 'verify_pw', 'change_log', 'service', 'not_found')
+
+    def __init__(self, users: Optional[Dict[str, str]] = None, host: str = '127.0.0.1', port: int = 0,
+                 profiles: Optional[Dict[str, StandInProfile]] = None,
+                 latency: float = 0.0, jitter: float = 0.0,
+                 route_latency: Optional[Dict[str, float]] = None,
+                 error_rate: float = 0.0, error_status: int = 503,
+                 error_routes: Optional[Iterable[str]] = None,
+                 second_factor: bool = True, page_padding: int = 0, charset_header: bool = True,
+                 key_bits: int = 2048, seed: Optional[int] = None):
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate는 0과 1 사이여야 합니다.")
+
+        self.users = dict(users or {})
+        self.profiles = dict(profiles or {})
+        self.latency = latency
+        self.jitter = jitter
+        self.route_latency = dict(route_latency or {})
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.error_routes = frozenset(error_routes) if error_routes is not None else None
+        self.second_factor = second_factor
+        self.content_type = 'text/html;charset=UTF-8' if charset_header else 'text/html'
+        self._padding = _menu_markup(page_padding)
+
+        self._private_key = rsa.generate_private_key(public_exponent=65537, key_size=key_bits)
+        self.public_key = base64.b64encode(self._private_key.public_key().public_bytes(
+            serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo,
+        )).decode('ascii')
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._sso_sessions: Dict[str, _SSOSession] = {}
+        self._service_sessions: Dict[str, _ServiceSession] = {}
+        self._codes: Dict[str, Tuple[str, str]] = {}     # code -> (서비스, 아이디)
+        self._counters: Dict[str, int] = {}
+        self._routes: Dict[str, int] = {}
+
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.standin = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """(호스트, 포트) - port=0이면 실제로 할당된 포트"""
+        return self._httpd.server_address[:2]
+
+    @property
+    def url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        """백그라운드 스레드에서 요청 처리를 시작합니다."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="StandInServer", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """요청 처리를 멈추고 소켓을 닫습니다."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def add_user(self, user_id: str, user_pw: str, profile: Optional[StandInProfile] = None) -> None:
+        with self._lock:
+            self.users[user_id] = user_pw
+            if profile is not None:
+                self.profiles[user_id] = profile
+
+    def async_transport(self):
+        """
+        httpx.AsyncClient에 넣을 전송 계층 (AsyncMJUSSOLogin용, httpx 필요)
+
+        StandInTransport와 마찬가지로 요청만 로컬 서버로 보내고 응답 URL/쿠키는 원래 주소를 유지합니다.
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError("async_transport()를 사용하려면 httpx가 필요합니다: pip install 'mju-sso-login[async]'") from e
+
+        server = self
+
+        class _StandInAsyncTransport(httpx.AsyncHTTPTransport):
+            async def handle_async_request(self, request: "httpx.Request") -> "httpx.Response":
+                # Host 헤더는 원래 요청의 값이 유지됨 (응답의 request는 httpx가 원래 요청으로 설정)
+                host, port = server.address
+                routed = httpx.Request(
+                    request.method, request.url.copy_with(scheme='http', host=host, port=port),
+                    headers=request.headers, stream=request.stream, extensions=request.extensions,
+                )
+                return await super().handle_async_request(routed)
+
+        return _StandInAsyncTransport()
+
+    def stats(self) -> dict:
+        """
+        처리 통계
+
+        Returns:
+            dict: requests, routes({경로 이름: 요청 수}), logins, login_failures, authorizations,
+                  second_auth, second_auth_failures, csrf_rejected, injected_errors, sso_sessions, service_sessions
+        """
+        with self._lock:
+            result = {'requests': sum(self._routes.values()), 'routes': dict(self._routes)}
+            for name in ('logins', 'login_failures', 'authorizations', 'second_auth', 'second_auth_failures',
+                         'csrf_rejected', 'injected_errors'):
+                result[name] = self._counters.get(name, 0)
+            result['sso_sessions'] = len(self._sso_sessions)
+            result['service_sessions'] = len(self._service_sessions)
+            return result
+
+    # --- 내부 상태 (핸들러 스레드에서 호출) ---
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + 1
+
+    def _enter_route(self, route: str) -> bool:
+        """요청 수를 기록하고 지연을 적용합니다. 오류를 주입해야 하면 True"""
+        with self._lock:
+            self._routes[route] = self._routes.get(route, 0) + 1
+            delay = self.route_latency.get(route, self.latency)
+            if self.jitter:
+                delay += self._random.random() * self.jitter
+            inject = (self.error_rate > 0 and (self.error_routes is None or route in self.error_routes)
+                      and self._random.random() < self.error_rate)
+            if inject:
+                self._counters['injected_errors'] = self._counters.get('injected_errors', 0) + 1
+        if delay > 0:
+            time.sleep(delay)
+        return inject
+
+    def _profile(self, user_id: str) -> StandInProfile:
+        return self.profiles.get(user_id) or StandInProfile()
+
+    def _new_sso_session(self) -> Tuple[str, _SSOSession]:
+        session_id = secrets.token_hex(16).upper()
+        sso_session = _SSOSession(c_r_t=secrets.token_urlsafe(32))
+        with self._lock:
+            self._sso_sessions[session_id] = sso_session
+        return session_id, sso_session
+
+    def _issue_code(self, service: str, user_id: str) -> str:
+        code = secrets.token_hex(12)
+        with self._lock:
+            self._codes[code] = (service, user_id)
+            self._counters['authorizations'] = self._counters.get('authorizations', 0) + 1
+        return code
+
+    def _redeem_code(self, code: str, service: str) -> Optional[str]:
+        """일회용 코드를 아이디로 교환합니다. (잘못된 코드면 None)"""
+        with self._lock:
+            entry = self._codes.pop(code, None)
+        if entry is None or entry[0] != service:
+            return None
+        return entry[1]
+
+    def _new_service_session(self, service_session: _ServiceSession) -> str:
+        session_id = secrets.token_hex(16).upper()
+        with self._lock:
+            self._service_sessions[session_id] = service_session
+        return session_id
+
+    def _check_credentials(self, form: Dict[str, str], sso_session: _SSOSession) -> bool:
+        """실제 서버처럼 c_r_t를 확인하고 encsymka/pw_enc를 복호화하여 비밀번호를 비교합니다."""
+        if not secrets.compare_digest(form.get('c_r_t', ''), sso_session.c_r_t):
+            return False
+        expected = self.users.get(form.get('user_id', ''))
+        if expected is None:
+            return False
+        try:
+            password = self.decrypt_password(form['encsymka'], form['pw_enc'])
+        except (KeyError, ValueError):
+            return False
+        return secrets.compare_digest(password.encode('utf-8'), expected.encode('utf-8'))
+
+    def decrypt_password(self, encsymka: str, pw_enc: str) -> str:
+        """
+        로그인 POST의 encsymka / pw_enc를 복호화합니다.
+
+        encsymka = RSA("keyStr,timestamp"), key = PBKDF2-SHA1(keyStr, keyStr[-16:], 1024, 32), iv = key[-16:],
+        pw_enc = AES-256-CBC(Base64(비밀번호))
+
+        Raises:
+            ValueError: 복호화에 실패했거나 타임스탬프가 허용 범위를 벗어남
+        """
+        payload = self._private_key.decrypt(base64.b64decode(encsymka), asym_padding.PKCS1v15()).decode('utf-8')
+        key_str, _, timestamp = payload.rpartition(',')
+        if not key_str or abs(time.time() - int(timestamp) / 1000) > MAX_CLOCK_SKEW:
+            raise ValueError("세션키 형식 또는 타임스탬프가 올바르지 않습니다.")
+
+        key = hashlib.pbkdf2_hmac('sha1', key_str.encode('utf-8'), key_str[-16:].encode('utf-8'), 1024, 32)
+        decryptor = Cipher(algorithms.AES(key), modes.CBC(key[-16:])).decryptor()
+        padded = decryptor.update(base64.b64decode(pw_enc)) + decryptor.finalize()
+        unpadder = padding.PKCS7(128).unpadder()
+        encoded = unpadder.update(padded) + unpadder.finalize()
+        return base64.b64decode(encoded).decode('utf-8')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Host 헤더로 가상 호스트(sso/msi/...)를 구분하여 응답"""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'StandIn'
+
+    def setup(self) -> None:
+        super().setup()
+        # 헤더와 본문을 따로 쓰므로 Nagle 알고리즘 + 지연 ACK로 응답마다 ~40ms가 더해지지 않도록 함
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    @property
+    def standin(self) -> StandInServer:
+        return self.server.standin
+
+    def do_GET(self) -> None:
+        self._dispatch('GET')
+
+    def do_POST(self) -> None:
+        self._dispatch('POST')
+
+    # --- 요청/응답 공통 ---
+
+    def _dispatch(self, method: str) -> None:
+        host = (self.headers.get('Host') or '').split(':')[0].lower()
+        parts = urlsplit(self.path)
+        # /sso/auth;jsessionid=... 형태의 경로 매개변수 제거
+        path = parts.path.split(';')[0]
+        self._query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        self._form = {k: v[0] for k, v in parse_qs(body.decode('utf-8')).items()} if body else {}
+        self._cookies = _parse_cookie_header(self.headers.get('Cookie', ''))
+
+        route, handler = self._route(method, host, path)
+        if self.standin._enter_route(route):
+            self._inject_error()
+            return
+        handler(host, path)
+
+    def _route(self, method: str, host: str, path: str):
+        if host == SSO_HOST and path == '/sso/auth':
+            if method == 'POST':
+                return 'signin', self._signin
+            sso_session = self._sso_session()
+            authorized = sso_session is not None and sso_session.user_id is not None
+            return ('authorize' if authorized else 'login_page'), self._authorize
+        if host == MSI_HOST:
+            if path == '/index_Myiweb.jsp':
+                return ('code', self._msi_index) if 'code' in self._query else ('home', self._msi_index)
+            if method == 'POST':
+                routes = {
+                    '/servlet/login_security': ('login_security', self._msi_login_security),
+                    '/servlet/su/sum/Sum00Svl01getStdCard': ('student_card', self._msi_student_card),
+                    '/servlet/sys/sys15/Sys15Svl01verifyPW': ('verify_pw', self._msi_verify_pw),
+                    '/servlet/su/sud/Sud00Svl03viewChangeLog': ('change_log', self._msi_change_log),
+                }
+                if path in routes:
+                    return routes[path]
+            elif path == '/servlet/security/MySecurityStart':
+                return 'security_start', self._msi_security_start
+        for service, (service_host, redirect_path, _) in _SERVICE_ROUTES.items():
+            if host == service_host and service != 'msi':
+                if path == redirect_path and 'code' in self._query:
+                    return 'code', self._service_code
+                return 'service', self._service_page
+        return 'not_found', self._not_found
+
+    def _inject_error(self) -> None:
+        status = self.standin.error_status
+        if not status:
+            # 응답 없이 연결 종료 → 클라이언트에서 ConnectionError
+            self.close_connection = True
+            return
+        self._send(status, f"<html><body><h1>{status}</h1></body></html>")
+
+    def _send(self, status: int, body: str = '', headers: Optional[Dict[str, str]] = None,
+              cookies: Optional[Dict[str, str]] = None) -> None:
+        if status == 200 and self.standin._padding:
+            body = body.replace('</body>', self.standin._padding + '</body>', 1)
+        payload = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', self.standin.content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        for name, value in (cookies or {}).items():
+            self.send_header('Set-Cookie', f"{name}={value}; Path=/; HttpOnly")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _redirect(self, location: str, cookies: Optional[Dict[str, str]] = None) -> None:
+        self._send(302, '', {'Location': location}, cookies)
+
+    def _not_found(self, host: str, path: str) -> None:
+        self._send(404, "<html><body><h1>404 Not Found</h1></body></html>")
+
+    def _service_session(self) -> Optional[_ServiceSession]:
+        session_id = self._cookies.get('JSESSIONID')
+        if session_id is None:
+            return None
+        with self.standin._lock:
+            return self.standin._service_sessions.get(session_id)
+
+    def _service_for_host(self, host: str) -> str:
+        for service, (service_host, _, _) in _SERVICE_ROUTES.items():
+            if service_host == host:
+                return service
+        return 'msi'
+
+    def _to_sso(self, host: str) -> None:
+        """로그인되지 않은 서비스 요청 → SSO 인가 URL로 리다이렉트"""
+        self._redirect(MJUSSOLogin.SERVICES[self._service_for_host(host)]['url'])
+
+    # --- SSO ---
+
+    def _sso_session(self) -> Optional[_SSOSession]:
+        session_id = self._cookies.get('JSESSIONID')
+        if session_id is None:
+            return None
+        with self.standin._lock:
+            return self.standin._sso_sessions.get(session_id)
+
+    def _authorize(self, host: str, path: str) -> None:
+        """GET /sso/auth - SSO 세션이 있으면 바로 코드 발급, 없으면 로그인 페이지"""
+        session_id = self._cookies.get('JSESSIONID')
+        sso_session = self._sso_session()
+        if sso_session is not None and sso_session.user_id is not None:
+            self._redirect_with_code(sso_session.user_id)
+            return
+
+        cookies = None
+        if sso_session is None:
+            session_id, sso_session = self.standin._new_sso_session()
+            cookies = {'JSESSIONID': session_id}
+        self._send(200, _signin_page(self.standin.public_key, sso_session.c_r_t, session_id, self._query),
+                   cookies=cookies)
+
+    def _signin(self, host: str, path: str) -> None:
+        """POST /sso/auth;jsessionid=... - 자격 증명 확인"""
+        session_id = self._cookies.get('JSESSIONID')
+        sso_session = self._sso_session()
+        if sso_session is None or not self.standin._check_credentials(self._form, sso_session):
+            self.standin._count('login_failures')
+            if sso_session is None:
+                session_id, sso_session = self.standin._new_sso_session()
+            else:
+                sso_session.c_r_t = secrets.token_urlsafe(32)
+            self._send(200, _signin_page(self.standin.public_key, sso_session.c_r_t, session_id, self._query,
+                                         error=INVALID_CREDENTIALS_MESSAGE),
+                       cookies={'JSESSIONID': session_id})
+            return
+
+        sso_session.user_id = self._form['user_id']
+        self.standin._count('logins')
+        self._redirect_with_code(sso_session.user_id)
+
+    def _redirect_with_code(self, user_id: str) -> None:
+        client_id = self._query.get('client_id', '')
+        service = next((name for name in MJUSSOLogin.SERVICES if name == client_id), None)
+        redirect_uri = self._query.get('redirect_uri')
+        if service is None or not redirect_uri:
+            self._send(400, "<html><body>invalid_request</body></html>")
+            return
+        code = self.standin._issue_code(service, user_id)
+        query = urlencode({'code': code, 'state': self._query.get('state', '')})
+        self._redirect(f"{redirect_uri}{'&' if '?' in redirect_uri else '?'}{query}")
+
+    # --- MSI ---
+
+    def _msi_index(self, host: str, path: str) -> None:
+        code = self._query.get('code')
+        if code is None:
+            service_session = self._service_session()
+            if service_session is None or not service_session.logged_in:
+                self._to_sso(host)
+                return
+            self._send(200, _msi_home_page(service_session.csrf))
+            return
+
+        user_id = self.standin._redeem_code(code, 'msi')
+        if user_id is None:
+            self._to_sso(host)
+            return
+        service_session = _ServiceSession(user_id=user_id, code=code)
+        session_id = self.standin._new_service_session(service_session)
+        self._send(200, _auto_submit_page('/servlet/login_security', {'code': code, '_csrf': service_session.csrf}),
+                   cookies={'JSESSIONID': session_id})
+
+    def _msi_login_security(self, host: str, path: str) -> None:
+        service_session = self._service_session()
+        if (service_session is None or service_session.code is None
+                or self._form.get('code') != service_session.code):
+            self._to_sso(host)
+            return
+        service_session.code = None
+        service_session.logged_in = True
+        self._send(200, "<html><head><script>location.href='https://msi.mju.ac.kr/index_Myiweb.jsp';"
+                        "</script></head><body></body></html>")
+
+    def _msi_security_start(self, host: str, path: str) -> None:
+        service_session = self._service_session()
+        if service_session is None or not service_session.logged_in:
+            self._to_sso(host)
+            return
+        self._send(200, _msi_home_page(service_session.csrf))
+
+    def _msi_post_session(self, host: str) -> Optional[_ServiceSession]:
+        """로그인과 CSRF 토큰을 확인합니다. (실패 시 응답을 보내고 None)"""
+        service_session = self._service_session()
+        if service_session is None or not service_session.logged_in:
+            self._to_sso(host)
+            return None
+        token = self.headers.get('X-CSRF-TOKEN') or self._form.get('_csrf')
+        if token != service_session.csrf:
+            self.standin._count('csrf_rejected')
+            self._send(403, "<html><body><h1>403 Forbidden</h1><p>Invalid CSRF Token</p></body></html>")
+            return None
+        return service_session
+
+    def _msi_student_card(self, host: str, path: str) -> None:
+        service_session = self._msi_post_session(host)
+        if service_session is None:
+            return
+        if self.standin.second_factor and not service_session.verified:
+            self._send(200, _verify_pw_page(service_session.csrf))
+            return
+        self._send(200, _student_card_page(service_session.user_id, self.standin._profile(service_session.user_id)))
+
+    def _msi_verify_pw(self, host: str, path: str) -> None:
+        service_session = self._msi_post_session(host)
+        if service_session is None:
+            return
+        expected = self.standin.users.get(service_session.user_id, '')
+        if not secrets.compare_digest(self._form.get('tfpassword', '').encode('utf-8'), expected.encode('utf-8')):
+            self.standin._count('second_auth_failures')
+            self._send(200, _verify_pw_page(service_session.csrf, error="비밀번호가 일치하지 않습니다."))
+            return
+        service_session.verified = True
+        self.standin._count('second_auth')
+        original_url = self._form.get('originalurl') or 'https://msi.mju.ac.kr/servlet/su/sum/Sum00Svl01getStdCard'
+        self._send(200, _auto_submit_page(original_url, {'_csrf': service_session.csrf}))
+
+    def _msi_change_log(self, host: str, path: str) -> None:
+        service_session = self._msi_post_session(host)
+        if service_session is None:
+            return
+        self._send(200, _change_log_page(service_session.user_id, self.standin._profile(service_session.user_id)))
+
+    # --- 그 외 서비스 ---
+
+    def _service_code(self, host: str, path: str) -> None:
+        service = self._service_for_host(host)
+        user_id = self.standin._redeem_code(self._query['code'], service)
+        if user_id is None:
+            self._to_sso(host)
+            return
+        session_id = self.standin._new_service_session(_ServiceSession(user_id=user_id, logged_in=True))
+        self._redirect(_SERVICE_ROUTES[service][2], cookies={'JSESSIONID': session_id})
+
+    def _service_page(self, host: str, path: str) -> None:
+        service_session = self._service_session()
+        if service_session is None or not service_session.logged_in:
+            self._to_sso(host)
+            return
+        self._send(200, f"<html><body><h1>{html.escape(host)}</h1><a href=\"/logout\">로그아웃</a></body></html>")
+
+
+def _parse_cookie_header(header: str) -> Dict[str, str]:
+    cookies = {}
+    for item in header.split(';'):
+        name, sep, value = item.strip().partition('=')
+        if sep:
+            cookies[name] = value
+    return cookies
+
+
+# --- 페이지 ---
+
+def _menu_markup(size: int) -> str:
+    """UTF-8로 약 size바이트가 되는 메뉴 마크업"""
+    item = '<li class="menu-item"><a href="#" onclick="goMenu(\'W_SUD005\')">학적 정보 조회</a></li>\n'
+    count = -(-size // len(item.encode('utf-8'))) if size > 0 else 0
+    return f'<ul class="menu">\n{item * count}</ul>\n' if count else ''
+
+
+def _signin_page(public_key: str, c_r_t: str, session_id: str, query: Dict[str, str],
+                 error: Optional[str] = None) -> str:
+    action = f"https://sso.mju.ac.kr/sso/auth;jsessionid={session_id}?{urlencode(query, quote_via=quote)}"
+    script = f'<script>var errorMsg = "{error}"; alert(errorMsg);</script>\n' if error else ''
+    return (
+        '<!DOCTYPE html>\n<html lang="ko"><head><meta charset="UTF-8"><title>명지대학교 통합로그인</title></head>\n'
+        f'<body>\n{script}'
+        f'<form id="signin-form" action="{action}" method="post">\n'
+        '<input type="text" id="input-userId" name="user_id" placeholder="아이디">\n'
+        '<input type="password" id="input-password" name="pw" placeholder="비밀번호">\n'
+        '<input type="hidden" name="user_id_enc" id="input-userId-enc">\n'
+        '<input type="hidden" name="pw_enc" id="input-password-enc">\n'
+        '<input type="hidden" name="encsymka" id="input-encsymka">\n'
+        f'<input type="hidden" value="{public_key}" id="public-key">\n'
+        f'<input type="hidden" name="c_r_t" value="{c_r_t}" id="c_r_t">\n'
+        '</form>\n</body></html>\n'
+    )
+
+
+def _auto_submit_page(action: str, fields: Dict[str, str]) -> str:
+    inputs = ''.join(f'<input type="hidden" name="{name}" value="{html.escape(value)}"/>'
+                     for name, value in fields.items())
+    return (f'<html><body onLoad="doLogin()"><form action="{html.escape(action)}" method="post">{inputs}</form>'
+            '<script>function doLogin(){document.forms[0].submit();}</script></body></html>')
+
+
+def _msi_home_page(csrf: str) -> str:
+    return (
+        '<!DOCTYPE html>\n<html lang="ko"><head><meta charset="UTF-8">'
+        f'<meta name="_csrf" content="{csrf}"/><meta name="_csrf_header" content="X-CSRF-TOKEN"/>'
+        '<title>My iWeb</title></head>\n<body><div id="header"><a href="/logout">로그아웃</a></div>'
+        '<form id="sideform" method="post"></form></body></html>\n'
+    )
+
+
+def _verify_pw_page(csrf: str, error: Optional[str] = None) -> str:
+    script = f"<script>alert('{error}');</script>" if error else ''
+    return (
+        f'<html><head><meta name="_csrf" content="{csrf}"/></head><body>{script}'
+        '<form id="verifyForm" action="/servlet/sys/sys15/Sys15Svl01verifyPW" method="post">'
+        '<input type="hidden" name="originalurl" value="https://msi.mju.ac.kr/servlet/su/sum/Sum00Svl01getStdCard"/>'
+        '<input type="password" id="tfpassword" name="tfpassword"/>'
+        f'<input type="hidden" name="_csrf" value="{csrf}"/></form></body></html>'
+    )
+
+
+def _item(title: str, data: str) -> str:
+    return (f'<div class="flex-table-item"><div class="item-title">{title}</div>'
+            f'<div class="item-data">{data}</div></div>')
+
+
+def _input(name: str, value: str, extra: str = '') -> str:
+    return f'<input type="text" name="{name}" value="{html.escape(value)}"{extra}/>'
+
+
+def _student_card_page(user_id: str, profile: StandInProfile) -> str:
+    zip1, zip2, addr1, addr2 = profile.address
+    items = [
+        _item('학번', user_id),
+        _item('한글성명', profile.name_korean),
+        _item('영문성명(성)', profile.name_english_first),
+        _item('영문성명(이름)', profile.name_english_last),
+        _item('학년', f"{profile.grade}학년"),
+        _item('학적상태', profile.status),
+        _item('학부(과)', profile.department),
+        _item('상담교수', profile.advisor),
+        _item('전화번호', _input('std_tel', profile.phone)),
+        _item('휴대폰', _input('htel', profile.mobile)),
+        _item('E-Mail', _input('email', profile.email)),
+        _item('현거주지 주소', _input('zip1', zip1) + _input('zip2', zip2) + _input('addr1', addr1)
+              + _input('addr2', addr2)),
+        _item('주민등록 주소', _input('zip1_2', zip1) + _input('zip2_2', zip2) + _input('addr1_2', addr1)
+              + _input('addr2_2', addr2)),
+        _item('명지포커스 수신여부', '<input type="checkbox" name="focus_yn" value="Y"'
+              + (' checked' if profile.focus_newsletter else '') + '/>'),
+    ]
+    return (f'<html><body><img src="data:image/png;base64,{_PHOTO}"/>'
+            f'<div class="flex-table">{"".join(items)}</div></body></html>')
+
+
+def _change_log_page(user_id: str, profile: StandInProfile) -> str:
+    items = [
+        _item('학번', user_id),
+        _item('성명', profile.name_korean),
+        _item('학적상태', profile.status),
+        _item('학년', profile.grade),
+        _item('이수학기', profile.completed_semesters),
+        _item('학부(과)', profile.department),
+    ]
+    return f'<html><body><div class="flex-table">{"".join(items)}</div></body></html>'
+
+
+# --- 클라이언트 전송 계층 ---
+
+class _StandInAdapter(PooledAdapter):
+    """https://<가상 호스트> 요청을 대역 서버로 보내고, 응답에는 원래 URL/요청을 남기는 어댑터"""
+
+    def __init__(self, server: StandInServer, stats: TransportStats, idle_timeout: Optional[float], **kwargs):
+        self._server = server
+        super().__init__(stats, idle_timeout, **kwargs)
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        host, port = self._server.address
+        routed = request.copy()
+        routed.url = urlunsplit(('http', f"{host}:{port}", parts.path, parts.query, ''))
+        routed.headers['Host'] = parts.netloc
+        # 통계는 대역 서버 주소가 아니라 가상 호스트 기준으로 기록
+        self.stats.record_request(parts.hostname)
+
+        response = HTTPAdapter.send(self, routed, **kwargs)
+        # 리다이렉트 해석, 쿠키 도메인, 'sso.mju.ac.kr' in response.url 판정이 원래 주소 기준으로 동작하도록
+        response.url = request.url
+        response.request = request
+        return response
+
+
+class StandInTransport(SharedTransport):
+    """
+    *.mju.ac.kr 요청을 StandInServer로 보내는 전송 계층
+
+    - pool_maxsize: 대역 서버로의 최대 유휴 연결 수 (동시 사용자 수에 맞춰 조정)
+
+    stats()는 SharedTransport.stats()와 같은 형식입니다. (per_host는 가상 호스트 기준, 연결 수는 대역 서버 기준)
+    """
+
+    def __init__(self, server: StandInServer, pool_maxsize: int = 32):
+        self.server = server
+        super().__init__(pool_connections=1, pool_maxsize=pool_maxsize, idle_timeout=None)
+
+    def create_adapter(self, stats: TransportStats, idle_timeout: Optional[float], **kwargs) -> PooledAdapter:
+        return _StandInAdapter(self.server, stats, idle_timeout, **kwargs)
+
+    def mount(self, session: requests.Session) -> None:
+        for host in VIRTUAL_HOSTS:
+            session.mount(f'https://{host}/', self.adapter)
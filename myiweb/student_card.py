@@ -11,9 +11,12 @@ from dataclasses import dataclass, field, asdict
 from typing import Optional, Dict, Any
 
 import requests
-from bs4 import BeautifulSoup, SoupStrainer
 
 from .abc import BaseFetcher
+from .csrf import CSRFTokenCache
+from .parsing import find_data_image, parse_table_items, response_charset
+from .retry import RetryPolicy
+from .session_store import SessionStore
 from .utils import (
     Colors, log_section, log_step, log_info, log_success, log_error,
     log_warning, log_request, log_response
@@ -65,7 +68,8 @@ class StudentCard:
     raw_data: Dict[str, Any] = field(default_factory=dict)
 
     @classmethod
-    def fetch(cls, user_id: str, user_pw: str, verbose: bool = False) -> StudentCard:
+    def fetch(cls, user_id: str, user_pw: str, verbose: bool = False,
+              session_store: Optional[SessionStore] = None) -> StudentCard:
         """
         SSO 로그인부터 학생카드 정보 조회까지 모든 과정을 수행합니다.
 
@@ -73,21 +77,15 @@ class StudentCard:
             user_id: 학번
             user_pw: 비밀번호
             verbose: 상세 로그 출력 여부
+            session_store: 로그인 세션 저장소 (주어지면 저장된 세션을 먼저 재사용)
 
         Returns:
             조회된 학생카드 정보 객체
         """
-        # 순환 참조 방지를 위해 메서드 내에서 임포트
-        from .sso import MJUSSOLogin
-
         if verbose:
             log_section("myiweb 통합 실행: 학생카드")
 
-        sso = MJUSSOLogin(user_id, user_pw, verbose=verbose)
-        session = sso.login(service='msi')
-
-        fetcher = _StudentCardFetcher(session, user_pw, verbose=verbose)
-        return fetcher.fetch()
+        return _StudentCardFetcher.run(user_id, user_pw, verbose=verbose, session_store=session_store)
 
     def to_dict(self) -> Dict[str, Any]:
         """데이터 클래스를 명시적인 딕셔너리로 변환합니다."""
@@ -145,49 +143,70 @@ class StudentCard:
 class _StudentCardFetcher(BaseFetcher):
     """학생카드 정보 조회 서비스 (내부용)"""
     
+    TRACE_NAME = 'student_card'
     STUDENT_CARD_URL = "https://msi.mju.ac.kr/servlet/su/sum/Sum00Svl01getStdCard"
     PASSWORD_VERIFY_URL = "https://msi.mju.ac.kr/servlet/sys/sys15/Sys15Svl01verifyPW"
     
-    def __init__(self, session: requests.Session, user_pw: str, verbose: bool = True):
-        super().__init__(session, user_pw, verbose)
+    def __init__(self, session: requests.Session, user_pw: str, verbose: bool = True,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 csrf_cache: Optional[CSRFTokenCache] = None):
+        super().__init__(session, user_pw, verbose, retry_policy, csrf_cache)
 
     def fetch(self) -> StudentCard:
         """학생카드 정보를 조회합니다."""
         if self.verbose:
             log_step("A", "학생카드 정보 조회 시작")
         
-        # 1. CSRF 토큰 추출 (from BaseFetcher)
-        self._get_csrf_token()
+        with self._start_trace():
+            # 1. CSRF 토큰 추출 (from BaseFetcher)
+            self._get_csrf_token()
         
-        # 2. 학생카드 페이지 접근 (sideform 방식)
-        html = self._access_student_card_page()
+            # 2. 학생카드 페이지 접근 (sideform 방식)
+            body = self._access_student_card_page()
         
-        # 3. 비밀번호 인증 필요 여부 확인 및 처리
-        if self._is_password_required(html):
-            if self.verbose:
-                log_warning("2차 비밀번호 인증이 필요합니다.")
+            # 3. 비밀번호 인증 필요 여부 확인 및 처리
+            if self._is_password_required(body):
+                if self.verbose:
+                    log_warning("2차 비밀번호 인증이 필요합니다.")
             
-            # 비밀번호 제출
-            html = self._submit_password(html)
+                # 비밀번호 제출
+                body = self._submit_password(body)
             
-            # 리다이렉트 폼 처리
-            html = self._handle_redirect_form(html)
+                # 리다이렉트 폼 처리
+                body = self._handle_redirect_form(body)
             
-            # 여전히 비밀번호 인증이 필요하면 실패
-            if self._is_password_required(html):
-                raise InvalidCredentialsError("2차 비밀번호 인증에 실패했습니다.")
+                # 여전히 비밀번호 인증이 필요하면 실패
+                if self._is_password_required(body):
+                    raise InvalidCredentialsError("2차 비밀번호 인증에 실패했습니다.")
         
-        # 4. 최종 학생 정보 파싱
-        info = self._parse_info(html)
+            # 4. 최종 학생 정보 파싱
+            with self.trace.stage('parse'):
+                info = self._parse_info(body)
         
         if self.verbose:
             log_success("학생카드 정보 조회 완료")
+            log_info("Trace", self.trace.breakdown())
             info.print_summary()
             
         return info
 
-    def _access_student_card_page(self) -> str:
-        """sideform 방식으로 학생카드 페이지 접근"""
+    def verify_password(self) -> None:
+        """
+        2차 비밀번호 인증(verifyPW)만 먼저 수행합니다.
+
+        인증된 세션에서는 학생카드 페이지 POST가 바로 정보 페이지를 반환하므로,
+        이후 fetch()는 다른 조회와 동시에 보내도 세션의 인증 상태를 바꾸지 않습니다.
+
+        Raises:
+            InvalidCredentialsError: 2차 비밀번호 인증 실패
+        """
+        self._get_csrf_token()
+        body = self._submit_password(b'')
+        if self._is_password_required(body):
+            raise InvalidCredentialsError("2차 비밀번호 인증에 실패했습니다.")
+
+    def _access_student_card_page(self) -> bytes:
+        """sideform 방식으로 학생카드 페이지 접근 (본문 바이트 반환)"""
         if self.verbose:
             log_step("A-2", "학생카드 페이지 접근")
         
@@ -211,30 +230,27 @@ class _StudentCardFetcher(BaseFetcher):
             log_request('POST', self.STUDENT_CARD_URL, headers, form_data)
         
         try:
-            response = self.session.post(
-                self.STUDENT_CARD_URL,
-                data=form_data,
-                headers=headers,
-                timeout=15
-            )
+            response = self._post('page', self.STUDENT_CARD_URL, form_data, headers)
             if self.verbose:
                 log_response(response, show_body=False)
             self._last_url = response.url
-            return response.text
+            self._last_charset = response_charset(response)
+            return response.content
         except requests.RequestException as e:
             raise NetworkError(f"학생카드 페이지 접근 실패: {e}") from e
     
-    def _is_password_required(self, html: str) -> bool:
+    def _is_password_required(self, body: bytes) -> bool:
         """비밀번호 입력이 필요한지 확인"""
-        return 'tfpassword' in html or 'verifyPW' in html
+        return b'tfpassword' in body or b'verifyPW' in body
     
-    def _submit_password(self, html: str) -> str:
+    def _submit_password(self, body: bytes) -> bytes:
         """비밀번호를 제출하여 2차 인증을 수행합니다."""
         if self.verbose:
             log_step("A-3", "2차 비밀번호 인증")
         
-        original_match = re.search(r'name="originalurl"\s+value="([^"]+)"', html)
-        original_url = original_match.group(1) if original_match else self.STUDENT_CARD_URL
+        original_match = re.search(rb'name="originalurl"\s+value="([^"]+)"', body)
+        original_url = (original_match.group(1).decode(self._last_charset, 'replace') if original_match
+                        else self.STUDENT_CARD_URL)
         
         form_data = {
             'originalurl': original_url,
@@ -254,80 +270,66 @@ class _StudentCardFetcher(BaseFetcher):
             log_request('POST', self.PASSWORD_VERIFY_URL, headers, safe_data)
         
         try:
-            response = self.session.post(
-                self.PASSWORD_VERIFY_URL,
-                data=form_data,
-                headers=headers,
-                timeout=15
-            )
+            response = self._post('second_auth', self.PASSWORD_VERIFY_URL, form_data, headers)
             if self.verbose:
                 log_response(response, show_body=True)
             self._last_url = response.url
-            return response.text
+            self._last_charset = response_charset(response)
+            return response.content
         except requests.RequestException as e:
             raise NetworkError(f"비밀번호 인증 실패: {e}") from e
     
-    def _handle_redirect_form(self, html: str) -> str:
+    def _handle_redirect_form(self, body: bytes) -> bytes:
         """2차 인증 후 나타나는 JS 리다이렉트 폼을 처리합니다."""
         if self.verbose:
             log_step("A-4", "리다이렉트 폼 처리")
 
         # 더 간단하고 정확한 정규표현식으로 수정
-        action_match = re.search(r'action\s*=\s*["\"](https[^"\"]+)["\"]', html)
-        csrf_match = re.search(r'name=["\"]_csrf["\"][^>]*value=["\"]([^"]+)["\"]', html)
+        action_match = re.search(rb'action\s*=\s*["\"](https[^"\"]+)["\"]', body)
+        csrf_match = re.search(rb'name=["\"]_csrf["\"][^>]*value=["\"]([^"]+)["\"]', body)
 
-        action = action_match.group(1) if action_match else ''
+        action = action_match.group(1).decode(self._last_charset, 'replace') if action_match else ''
         if not action or 'Sum00Svl01getStdCard' not in action:
             if self.verbose:
                 log_warning("리다이렉트 폼을 찾지 못했습니다. 현재 HTML을 그대로 반환합니다.")
-            return html
+            return body
         
-        csrf = csrf_match.group(1) if csrf_match else self.csrf_token
+        # 페이지에 실린 토큰이 있으면 그 값을 사용 (캐시에도 반영)
+        if csrf_match:
+            self._use_csrf_token(csrf_match.group(1).decode(self._last_charset, 'replace'))
         
         if self.verbose:
             log_info("Redirect URL", action)
-            log_info("CSRF Token", csrf)
+            log_info("CSRF Token", self.csrf_token)
         
-        form_data = {'_csrf': csrf}
+        form_data = {'_csrf': self.csrf_token}
         headers = {
             'Content-Type': 'application/x-www-form-urlencoded',
             'Origin': 'https://msi.mju.ac.kr',
             'Referer': self._last_url,
-            'X-CSRF-TOKEN': csrf,
+            'X-CSRF-TOKEN': self.csrf_token,
         }
         
         try:
-            response = self.session.post(action, data=form_data, headers=headers, timeout=15)
+            response = self._post('redirect_form', action, form_data, headers)
             if self.verbose:
                 log_response(response, show_body=False)
-            return response.text
+            self._last_charset = response_charset(response)
+            return response.content
         except requests.RequestException as e:
             raise NetworkError(f"리다이렉트 폼 처리 실패: {e}") from e
     
-    def _parse_info(self, html: str) -> StudentCard:
-        """학생 정보 HTML을 파싱합니다."""
+    def _parse_info(self, body: bytes) -> StudentCard:
+        """학생 정보 HTML(디코딩하지 않은 바이트)을 파싱합니다."""
         if self.verbose:
             log_step("A-5", "학생 정보 파싱")
         
-        parse_only = SoupStrainer(['img', 'div', 'input'])
-        soup = BeautifulSoup(html, 'lxml', parse_only=parse_only)
         info = StudentCard()
+        info.photo_base64 = find_data_image(body) or ''
         
-        img_tag = soup.find('img', src=re.compile(r'^data:image'))
-        if img_tag:
-            src = img_tag.get('src', '')
-            if 'base64,' in src:
-                info.photo_base64 = src.split('base64,')[1]
-        
-        for item in soup.find_all('div', class_='flex-table-item'):
-            title_div = item.find('div', class_='item-title')
-            data_div = item.find('div', class_='item-data')
-            if not title_div or not data_div:
-                continue
-            
-            title = title_div.get_text(strip=True)
-            input_field = data_div.find('input')
-            value = input_field.get('value', '') if input_field else data_div.get_text(strip=True)
+        for item in parse_table_items(body, self._last_charset):
+            title = item.title
+            value = item.value
             
             info.raw_data[title] = value
             
@@ -350,26 +352,26 @@ class _StudentCardFetcher(BaseFetcher):
             elif title == '학생설계전공지도교수':
                 info.design_advisor = value
             elif '전화번호' in title:
-                info.phone = data_div.find('input', {'name': 'std_tel'}).get('value', '')
+                info.phone = item.input_value('std_tel')
             elif title == '휴대폰':
-                info.mobile = data_div.find('input', {'name': 'htel'}).get('value', '')
+                info.mobile = item.input_value('htel')
             elif title == 'E-Mail':
-                info.email = data_div.find('input', {'name': 'email'}).get('value', '')
+                info.email = item.input_value('email')
             elif '현거주지' in title:
-                zip1 = data_div.find('input', {'name': 'zip1'})
-                zip2 = data_div.find('input', {'name': 'zip2'})
+                zip1 = item.input('zip1')
+                zip2 = item.input('zip2')
                 info.current_zip = f"{zip1.get('value', '')}-{zip2.get('value', '')}" if zip1 and zip2 else ''
-                info.current_address1 = data_div.find('input', {'name': 'addr1'}).get('value', '')
-                info.current_address2 = data_div.find('input', {'name': 'addr2'}).get('value', '')
+                info.current_address1 = item.input_value('addr1')
+                info.current_address2 = item.input_value('addr2')
             elif '주민등록' in title:
-                zip1_2 = data_div.find('input', {'name': 'zip1_2'})
-                zip2_2 = data_div.find('input', {'name': 'zip2_2'})
+                zip1_2 = item.input('zip1_2')
+                zip2_2 = item.input('zip2_2')
                 info.registered_zip = f"{zip1_2.get('value', '')}-{zip2_2.get('value', '')}" if zip1_2 and zip2_2 else ''
-                info.registered_address1 = data_div.find('input', {'name': 'addr1_2'}).get('value', '')
-                info.registered_address2 = data_div.find('input', {'name': 'addr2_2'}).get('value', '')
+                info.registered_address1 = item.input_value('addr1_2')
+                info.registered_address2 = item.input_value('addr2_2')
             elif '명지포커스' in title:
-                checkbox = data_div.find('input', {'name': 'focus_yn'})
-                info.focus_newsletter = checkbox and checkbox.get('checked') is not None
+                checkbox = item.input('focus_yn')
+                info.focus_newsletter = checkbox is not None and 'checked' in checkbox
         
         if not info.student_id:
             raise PageParsingError("학생 정보를 찾을 수 없습니다 (학번 필드 누락).")
@@ -6,12 +6,13 @@ MSI 서비스에서 학적변동내역을 조회하고 파싱합니다.
 """
 from __future__ import annotations
 from dataclasses import dataclass, asdict
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 import requests
-from bs4 import BeautifulSoup, SoupStrainer
 
 from .abc import BaseFetcher
+from .parsing import parse_table_items, response_charset
+from .session_store import SessionStore
 from .utils import Colors, log_info, log_section, log_step, log_request, log_response, log_success
 from .exceptions import NetworkError, PageParsingError
 
@@ -27,7 +28,8 @@ class StudentChangeLog:
     department: str = ""       # 학부(과)
 
     @classmethod
-    def fetch(cls, user_id: str, user_pw: str, verbose: bool = False) -> StudentChangeLog:
+    def fetch(cls, user_id: str, user_pw: str, verbose: bool = False,
+              session_store: Optional[SessionStore] = None) -> StudentChangeLog:
         """
         SSO 로그인부터 학적변동내역 조회까지 모든 과정을 수행합니다.
 
@@ -35,21 +37,15 @@ class StudentChangeLog:
             user_id: 학번
             user_pw: 비밀번호
             verbose: 상세 로그 출력 여부
+            session_store: 로그인 세션 저장소 (주어지면 저장된 세션을 먼저 재사용)
 
         Returns:
             조회된 학적변동내역 정보 객체
         """
-        # 순환 참조 방지를 위해 메서드 내에서 임포트
-        from .sso import MJUSSOLogin
-
         if verbose:
             log_section("myiweb 통합 실행: 학적변동내역")
 
-        sso = MJUSSOLogin(user_id, user_pw, verbose=verbose)
-        session = sso.login(service='msi')
-
-        fetcher = _StudentChangeLogFetcher(session, user_pw, verbose=verbose)
-        return fetcher.fetch()
+        return _StudentChangeLogFetcher.run(user_id, user_pw, verbose=verbose, session_store=session_store)
 
     def to_dict(self) -> Dict[str, Any]:
         """데이터 클래스를 명시적인 딕셔너리로 변환합니다."""
@@ -80,6 +76,7 @@ class _StudentChangeLogFetcher(BaseFetcher):
     """학적변동내역 조회 서비스 (내부용)"""
 
     CHANGE_LOG_URL = "/servlet/su/sud/Sud00Svl03viewChangeLog"
+    TRACE_NAME = 'student_changelog'
 
     def fetch(self) -> StudentChangeLog:
         """
@@ -91,23 +88,26 @@ class _StudentChangeLogFetcher(BaseFetcher):
         if self.verbose:
             log_step("B", "학적변동내역 정보 조회 시작")
 
-        # 1. CSRF 토큰 획득 (공통 로직)
-        self._get_csrf_token()
+        with self._start_trace():
+            # 1. CSRF 토큰 획득 (공통 로직)
+            self._get_csrf_token()
 
-        # 2. 학적변동내역 페이지 접근
-        html = self._access_change_log_page()
+            # 2. 학적변동내역 페이지 접근
+            body = self._access_change_log_page()
 
-        # 3. HTML 파싱
-        info = self._parse_info(html)
+            # 3. HTML 파싱
+            with self.trace.stage('parse'):
+                info = self._parse_info(body)
         
         if self.verbose:
             log_success("학적변동내역 정보 조회 완료")
+            log_info("Trace", self.trace.breakdown())
             info.print_summary()
 
         return info
 
-    def _access_change_log_page(self) -> str:
-        """학적변동내역 페이지에 접근하여 HTML을 반환합니다."""
+    def _access_change_log_page(self) -> bytes:
+        """학적변동내역 페이지에 접근하여 HTML 본문(바이트)을 반환합니다."""
         if self.verbose:
             log_step("B-2", "학적변동내역 페이지 접근")
 
@@ -132,33 +132,25 @@ class _StudentChangeLogFetcher(BaseFetcher):
             log_request('POST', full_url, headers, form_data)
 
         try:
-            response = self.session.post(full_url, data=form_data, headers=headers, timeout=15)
+            response = self._post('page', full_url, form_data, headers)
             if self.verbose:
                 log_response(response, show_body=False)
             self._last_url = response.url
-            return response.text
+            self._last_charset = response_charset(response)
+            return response.content
         except requests.RequestException as e:
             raise NetworkError(f"학적변동내역 페이지 접근 실패: {e}") from e
 
-    def _parse_info(self, html: str) -> StudentChangeLog:
-        """학적변동내역 HTML을 파싱합니다."""
+    def _parse_info(self, body: bytes) -> StudentChangeLog:
+        """학적변동내역 HTML(디코딩하지 않은 바이트)을 파싱합니다."""
         if self.verbose:
             log_step("B-3", "학적변동내역 정보 파싱")
 
-        parse_only = SoupStrainer('div', class_='flex-table-item')
-        soup = BeautifulSoup(html, 'lxml', parse_only=parse_only)
-        
         info = StudentChangeLog()
 
-        for item in soup.find_all('div', class_='flex-table-item'):
-            title_div = item.find('div', class_='item-title')
-            data_div = item.find('div', class_='item-data')
-            
-            if not title_div or not data_div:
-                continue
-            
-            title = title_div.get_text(strip=True)
-            value = data_div.get_text(strip=True)
+        for item in parse_table_items(body, self._last_charset):
+            title = item.title
+            value = item.text
             
             if title == "학번":
                 info.student_id = value
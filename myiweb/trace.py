@@ -0,0 +1,287 @@
+"""
+단계별 지연 시간 추적
+====================
+로그인과 조회(fetch) 한 번을 단계(stage)로 나누어 소요 시간, 수신 바이트, HTTP 상태,
+리다이렉트 횟수를 기록합니다. 끝난 Trace는 프로세스 전역 히스토그램에 합산되어
+단계별 p50/p90/p99를 조회할 수 있습니다.
+
+    sso = MJUSSOLogin(user_id, user_pw, verbose=False)
+    sso.login('msi')
+    print(sso.trace.summary())
+    # login.msi 412.3ms | login_page 88.1ms 200 | parse 0.1ms | session_key 1.9ms | ...
+
+    from myiweb.trace import latency_snapshot
+    latency_snapshot()['login.msi.signin_post']   # {'count': ..., 'p50_ms': ..., ...}
+
+기록 비용은 단계마다 perf_counter() 두 번과 리스트 추가, 히스토그램 버킷 증가 한 번입니다.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+class Stage:
+    """단계 하나의 기록"""
+
+    __slots__ = ('name', 'seconds', 'bytes', 'status', 'redirects')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.bytes = 0
+        self.status: Optional[int] = None
+        self.redirects = 0
+
+    def record(self, response, bytes_read: Optional[int] = None) -> None:
+        """
+        응답의 상태, 수신 바이트, 리다이렉트 횟수를 기록합니다.
+
+        Args:
+            response: requests.Response 또는 httpx.Response
+            bytes_read: 수신 바이트 (스트리밍 응답처럼 본문 전체를 읽지 않은 경우 직접 지정)
+        """
+        self.status = response.status_code
+        self.redirects = len(response.history)
+        self.bytes = bytes_read if bytes_read is not None else len(response.content)
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'ms': round(self.seconds * 1000, 3),
+            'bytes': self.bytes,
+            'status': self.status,
+            'redirects': self.redirects,
+        }
+
+
+class Trace:
+    """
+    로그인/조회 1회의 단계별 기록
+
+    with 문으로 감싸면 종료 시(예외 포함) 전체 시간을 확정하고 히스토그램에 합산합니다.
+    """
+
+    def __init__(self, name: str, aggregate: bool = True):
+        """
+        Args:
+            name: 추적 이름 (예: 'login.msi', 'fetch.student_card') - 히스토그램 키의 앞부분
+            aggregate: 종료 시 전역 히스토그램에 합산할지 여부
+        """
+        self.name = name
+        self.aggregate = aggregate
+        self.stages: List[Stage] = []
+        self.seconds: Optional[float] = None
+        self.error: Optional[str] = None
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Stage]:
+        """단계 하나의 시간을 잽니다. (yield된 Stage에 응답 정보를 기록)"""
+        record = Stage(name)
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - started
+            self.stages.append(record)
+
+    def __enter__(self) -> "Trace":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.finish(exc_type.__name__ if exc_type else None)
+
+    def finish(self, error: Optional[str] = None) -> None:
+        """전체 시간을 확정하고 히스토그램에 합산합니다."""
+        if self.seconds is not None:
+            return
+        self.seconds = time.perf_counter() - self._started
+        self.error = error
+        if self.aggregate and _registry.enabled:
+            _registry.observe_trace(self)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(stage.bytes for stage in self.stages)
+
+    @property
+    def redirects(self) -> int:
+        return sum(stage.redirects for stage in self.stages)
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'ms': round(self.seconds * 1000, 3) if self.seconds is not None else None,
+            'bytes': self.total_bytes,
+            'redirects': self.redirects,
+            'error': self.error,
+            'stages': [stage.to_dict() for stage in self.stages],
+        }
+
+    def breakdown(self) -> Dict[str, str]:
+        """{'login.msi': '412.3ms', 'login_page': '88.1ms 200', ...} - verbose 로그(log_info) 출력용"""
+        total = f"{self.seconds * 1000:.1f}ms" if self.seconds is not None else "-"
+        rows = {self.name: total + (f" ({self.error})" if self.error else "")}
+        for stage in self.stages:
+            row = f"{stage.seconds * 1000:.1f}ms"
+            if stage.status is not None:
+                row += f" {stage.status}"
+            if stage.redirects:
+                row += f" +{stage.redirects}r"
+            # 같은 이름의 단계가 여러 번 기록된 경우 뒤에 붙임
+            rows[stage.name] = f"{rows[stage.name]}, {row}" if stage.name in rows else row
+        return rows
+
+    def summary(self) -> str:
+        """'login.msi 412.3ms | login_page 88.1ms 200 | ...' 형태의 한 줄 요약"""
+        return ' | '.join(f"{name} {row}" for name, row in self.breakdown().items())
+
+
+# 히스토그램 버킷 경계(초): 10us ~ 약 120s, 버킷마다 15%씩 증가 (백분위 오차 15% 이내)
+_BUCKET_BOUNDS: List[float] = []
+_bound = 10e-6
+while _bound < 120.0:
+    _BUCKET_BOUNDS.append(_bound)
+    _bound *= 1.15
+del _bound
+
+
+class LatencyHistogram:
+    """로그 스케일 버킷 히스토그램 (값을 보관하지 않으므로 메모리 고정)"""
+
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(_BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, p: float) -> float:
+        """p 백분위 추정값(초) - 해당 버킷의 상한 (최댓값을 넘지 않음)"""
+        if not self.count:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                upper = _BUCKET_BOUNDS[index] if index < len(_BUCKET_BOUNDS) else self.max
+                return min(upper, self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            'count': self.count,
+            'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'min_ms': self.min * 1000 if self.count else 0.0,
+            'p50_ms': self.percentile(50) * 1000,
+            'p90_ms': self.percentile(90) * 1000,
+            'p99_ms': self.percentile(99) * 1000,
+            'max_ms': self.max * 1000,
+        }
+
+
+class _LatencyRegistry:
+    """'<추적 이름>.<단계>' -> 히스토그램 (스레드 안전)"""
+
+    def __init__(self):
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def _histogram(self, key: str) -> LatencyHistogram:
+        # 호출하는 쪽에서 self._lock을 잡고 있어야 함
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = LatencyHistogram()
+        return histogram
+
+    def observe(self, key: str, seconds: float) -> None:
+        with self._lock:
+            self._histogram(key).observe(seconds)
+
+    def observe_trace(self, trace: Trace) -> None:
+        with self._lock:
+            self._histogram(trace.name).observe(trace.seconds)
+            for stage in trace.stages:
+                self._histogram(f"{trace.name}.{stage.name}").observe(stage.seconds)
+
+    def percentile(self, key: str, p: float, min_count: int = 1) -> Optional[float]:
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None or histogram.count < min_count:
+                return None
+            return histogram.percentile(p)
+
+    def snapshot(self, prefix: str = '') -> Dict[str, dict]:
+        with self._lock:
+            return {key: histogram.snapshot() for key, histogram in sorted(self._histograms.items())
+                    if key.startswith(prefix)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+_registry = _LatencyRegistry()
+
+
+def latency_snapshot(prefix: str = '') -> Dict[str, dict]:
+    """
+    단계별 지연 시간 통계
+
+    Args:
+        prefix: 이 문자열로 시작하는 키만 반환 (예: 'login.msi')
+
+    Returns:
+        dict: {'login.msi.signin_post': {'count', 'mean_ms', 'min_ms', 'p50_ms', 'p90_ms', 'p99_ms', 'max_ms'}, ...}
+    """
+    return _registry.snapshot(prefix)
+
+
+def observe_latency(key: str, seconds: float) -> None:
+    """단계 밖에서 잰 지연 시간 하나를 히스토그램에 합산합니다. (예: 재시도 계층의 요청 1회)"""
+    if _registry.enabled:
+        _registry.observe(key, seconds)
+
+
+def latency_percentile(key: str, p: float, min_count: int = 1) -> Optional[float]:
+    """
+    키 하나의 p 백분위 추정값(초)
+
+    Returns:
+        float, 또는 None (기록이 min_count개보다 적음)
+    """
+    return _registry.percentile(key, p, min_count)
+
+
+def reset_latency() -> None:
+    """누적된 히스토그램을 모두 비웁니다."""
+    _registry.reset()
+
+
+def set_tracing(enabled: bool) -> None:
+    """히스토그램 합산을 켜거나 끕니다. (Trace 객체 기록은 계속됨)"""
+    _registry.enabled = enabled
+
+
+def format_latency_table(prefix: str = '') -> str:
+    """latency_snapshot()을 표 형태의 문자열로 만듭니다."""
+    lines = [f"  {'stage':<40} {'count':>7} {'p50(ms)':>9} {'p90(ms)':>9} {'p99(ms)':>9} {'max(ms)':>9}"]
+    for key, stats in latency_snapshot(prefix).items():
+        lines.append(f"  {key:<40} {stats['count']:>7} {stats['p50_ms']:>9.1f} {stats['p90_ms']:>9.1f} "
+                     f"{stats['p99_ms']:>9.1f} {stats['max_ms']:>9.1f}")
+    return '\n'.join(lines)
@@ -0,0 +1,240 @@
+"""
+HTTP 전송 계층
+=============
+requests.Session에 장착(mount)되는 전송 계층입니다.
+
+기본적으로 MJUSSOLogin은 프로세스 전역 SharedTransport를 사용하므로,
+사용자마다 새 Session을 만들더라도 sso.mju.ac.kr / msi.mju.ac.kr로의
+keep-alive 연결(TCP+TLS)은 호스트별 풀에서 재사용됩니다.
+쿠키는 Session 단위로 관리되므로 사용자 간에 공유되지 않습니다.
+"""
+
+import queue
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class Transport:
+    """
+    전송 계층 기본 클래스
+
+    아무것도 장착하지 않으므로 requests.Session의 기본 동작(세션별 연결 풀)을 그대로 사용합니다.
+    """
+
+    def mount(self, session: requests.Session) -> None:
+        """session에 어댑터를 장착합니다."""
+
+    def record_login(self) -> None:
+        """로그인 1회를 기록합니다. (통계용)"""
+
+    def stats(self) -> dict:
+        """연결 재사용 통계를 반환합니다."""
+        return {}
+
+    def close(self) -> None:
+        """보유한 연결을 모두 닫습니다."""
+
+
+class TransportStats:
+    """
+    호스트별 요청 수/새 연결 수 집계 (스레드 안전)
+
+    SharedTransport 이외의 전송 계층도 같은 형식의 stats()를 제공할 때 사용합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self.connections: Dict[str, int] = {}
+        self.logins = 0
+
+    def record_request(self, host: str) -> None:
+        with self._lock:
+            self.requests[host] = self.requests.get(host, 0) + 1
+
+    def record_connection(self, host: str) -> None:
+        with self._lock:
+            self.connections[host] = self.connections.get(host, 0) + 1
+
+    def record_login(self) -> None:
+        with self._lock:
+            self.logins += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            total_requests = sum(self.requests.values())
+            total_connections = sum(self.connections.values())
+            avoided = max(total_requests - total_connections, 0)
+            return {
+                'requests': total_requests,
+                'connections': total_connections,
+                'handshakes_avoided': avoided,
+                'reuse_rate': avoided / total_requests if total_requests else 0.0,
+                'logins': self.logins,
+                'handshakes_avoided_per_1000_logins': avoided * 1000 / self.logins if self.logins else 0.0,
+                'per_host': {
+                    host: {'requests': count, 'connections': self.connections.get(host, 0)}
+                    for host, count in self.requests.items()
+                },
+            }
+
+
+def _counting_pool_class(base, stats: TransportStats):
+    """새 연결 생성(_new_conn) 횟수를 세는 연결 풀 클래스를 만듭니다."""
+
+    class CountingConnectionPool(base):
+        def _new_conn(self):
+            stats.record_connection(self.host)
+            return super()._new_conn()
+
+    return CountingConnectionPool
+
+
+class PooledAdapter(HTTPAdapter):
+    """
+    여러 Session이 공유하는 HTTPAdapter (유휴 연결 만료 + 통계)
+
+    요청 주소를 바꾸는 등 동작을 더하려면 이 클래스를 상속하고 SharedTransport.create_adapter()에서 반환합니다.
+    """
+
+    def __init__(self, stats: TransportStats, idle_timeout: Optional[float], **kwargs):
+        self.stats = stats
+        self._idle_timeout = idle_timeout
+        self._last_used: Dict[str, float] = {}
+        self._idle_lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: _counting_pool_class(pool_cls, self.stats)
+            for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+    def _expire_idle(self, host: str) -> None:
+        """idle_timeout보다 오래 쉬고 있던 호스트의 유휴 연결을 닫습니다."""
+        now = time.monotonic()
+        with self._idle_lock:
+            last_used = self._last_used.get(host)
+            self._last_used[host] = now
+            if last_used is None or now - last_used <= self._idle_timeout:
+                return
+
+        # TLS 설정 등에 따라 같은 호스트라도 풀이 여러 개일 수 있으므로 모두 확인
+        pools = self.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None or pool.host != host:
+                continue
+            drained = 0
+            while True:
+                try:
+                    conn = pool.pool.get(block=False)
+                except (queue.Empty, AttributeError):
+                    break
+                if conn is not None:
+                    conn.close()
+                drained += 1
+            # 꺼낸 자리만큼 빈 슬롯(None)을 돌려놓아 풀 크기를 유지
+            for _ in range(drained):
+                pool.pool.put(None, block=False)
+
+    def send(self, request, **kwargs):
+        host = urlparse(request.url).hostname
+        self.stats.record_request(host)
+        if self._idle_timeout is not None:
+            self._expire_idle(host)
+        return super().send(request, **kwargs)
+
+
+class SharedTransport(Transport):
+    """
+    프로세스 전역에서 공유하는 keep-alive 연결 풀
+
+    - pool_connections: 연결 풀을 유지할 호스트 수
+    - pool_maxsize: 호스트당 최대 유휴 연결 수 (동시 로그인 수에 맞춰 조정)
+    - idle_timeout: 이 시간(초) 이상 사용되지 않은 호스트의 연결은 재사용하지 않고 닫음
+    """
+
+    def __init__(self, pool_connections: int = 8, pool_maxsize: int = 32,
+                 idle_timeout: Optional[float] = 60.0):
+        self._stats = TransportStats()
+        self.adapter = self.create_adapter(
+            self._stats,
+            idle_timeout,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
+
+    def create_adapter(self, stats: TransportStats, idle_timeout: Optional[float], **kwargs) -> PooledAdapter:
+        """장착할 어댑터를 만듭니다. (하위 클래스에서 PooledAdapter를 상속한 어댑터로 교체 가능)"""
+        return PooledAdapter(stats, idle_timeout, **kwargs)
+
+    def mount(self, session: requests.Session) -> None:
+        session.mount('https://', self.adapter)
+        session.mount('http://', self.adapter)
+
+    def record_login(self) -> None:
+        self._stats.record_login()
+
+    def stats(self) -> dict:
+        """
+        연결 재사용 통계
+
+        Returns:
+            dict: requests(요청 수), connections(새 연결 수), handshakes_avoided,
+                  reuse_rate, logins, handshakes_avoided_per_1000_logins, per_host
+        """
+        return self._stats.snapshot()
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+def release_response(response: requests.Response, drain_limit: int) -> None:
+    """
+    stream=True로 받은 응답의 연결을 정리합니다.
+
+    아직 읽지 않은 본문이 drain_limit 바이트 이하이면 마저 읽어 연결을 풀에 돌려주고,
+    크거나 길이를 알 수 없으면 연결을 닫습니다.
+    """
+    raw = response.raw
+    content_length = response.headers.get('Content-Length', '')
+    remaining = int(content_length) - raw.tell() if content_length.isdigit() else None
+
+    if remaining is not None and remaining <= drain_limit:
+        raw.drain_conn()
+        raw.release_conn()
+    else:
+        response.close()
+
+
+_default_transport: Optional[Transport] = None
+_default_lock = threading.Lock()
+
+
+def default_transport() -> Transport:
+    """프로세스 전역 기본 전송 계층(SharedTransport)을 반환합니다."""
+    global _default_transport
+    if _default_transport is None:
+        with _default_lock:
+            if _default_transport is None:
+                _default_transport = SharedTransport()
+    return _default_transport
+
+
+def set_default_transport(transport: Optional[Transport]) -> None:
+    """
+    기본 전송 계층을 교체합니다.
+
+    Args:
+        transport: 새 전송 계층. None이면 다음 사용 시 SharedTransport를 새로 만듭니다.
+    """
+    global _default_transport
+    with _default_lock:
+        _default_transport = transport
@@ -7,16 +7,16 @@ JavaScript 원본 (bandiJS):
 - genKey(length): 세션키 생성 + PBKDF2로 AES 키 파생
 - encryptJavaPKI(data): RSA로 암호화
 - encryptBase64AES(data, keyInfo): AES로 암호화
+
+실제 연산은 myiweb.crypto_backends가 선택한 백엔드(가장 빠른 구현)와
+myiweb.crypto의 공개키 캐시를 공유합니다.
 """
 
 import base64
-import random
+import os
 
-from Crypto.PublicKey import RSA
-from Crypto.Cipher import PKCS1_v1_5, AES
-from Crypto.Util.Padding import pad
-from Crypto.Protocol.KDF import PBKDF2
-from Crypto.Hash import SHA1
+from myiweb.crypto import load_public_key
+from myiweb.crypto_backends import get_backend
 
 from .utils import get_logger
 
@@ -44,20 +44,15 @@ def generate_session_key(length: int = 32) -> dict:
         dict: { 'keyStr': str, 'key': bytes, 'iv': bytes }
     """
     # 64바이트 랜덤 데이터를 Base64로 인코딩 (JS: forge.util.encode64(forge.random.getBytesSync(64)))
-    random_bytes = bytes(random.getrandbits(8) for _ in range(64))
+    random_bytes = os.urandom(64)
     key_str = base64.b64encode(random_bytes).decode('utf-8')
     
     # salt = keyStr의 마지막 16자
     salt = key_str[-16:]
     
     # PBKDF2로 키 파생 (iterations=1024, dkLen=length)
-    key_bytes = PBKDF2(
-        password=key_str.encode('utf-8'),
-        salt=salt.encode('utf-8'),
-        dkLen=length,
-        count=1024,
-        hmac_hash_module=SHA1  # forge.pkcs5.pbkdf2 기본값은 SHA1
-    )
+    # forge.pkcs5.pbkdf2 기본값은 SHA1
+    key_bytes = get_backend().pbkdf2_sha1(key_str.encode('utf-8'), salt.encode('utf-8'), 1024, length)
     
     # IV = 키의 마지막 16바이트
     iv_bytes = key_bytes[-16:]
@@ -83,17 +78,13 @@ def encrypt_with_rsa(data: str, public_key_str: str) -> str:
     logger.debug("[RSA 암호화 과정]")
     logger.debug(f"Input Data: {data[:30]}..." if len(data) > 30 else f"Input Data: {data}")
     
-    # PEM 형식으로 변환
-    pem_key = f"-----BEGIN PUBLIC KEY-----\n{public_key_str}\n-----END PUBLIC KEY-----"
-    
-    # RSA 키 로드
-    rsa_key = RSA.import_key(pem_key)
+    # RSA 키 로드 (캐시된 키 객체 재사용)
+    rsa_key = load_public_key(public_key_str)
     
-    logger.debug(f"RSA Key Size: {rsa_key.size_in_bits()} bits")
+    logger.debug(f"RSA Key Size: {get_backend().rsa_key_size(rsa_key)} bits")
     
     # PKCS1_v1_5 암호화 (Java 호환)
-    cipher = PKCS1_v1_5.new(rsa_key)
-    encrypted = cipher.encrypt(data.encode('utf-8'))
+    encrypted = get_backend().rsa_pkcs1v15_encrypt(rsa_key, data.encode('utf-8'))
     result = base64.b64encode(encrypted).decode('utf-8')
     
     logger.debug(f"Encrypted (RSA): {result[:30]}...({len(result)} chars)")
@@ -139,10 +130,10 @@ def encrypt_with_aes(plain_text: str, key_info: dict) -> str:
     
     logger.debug(f"Pre-encoded (Base64): {input_data[:20]}...")
     
-    # AES-CBC 암호화
-    cipher = AES.new(key_bytes, AES.MODE_CBC, iv_bytes)
-    padded = pad(input_data, AES.block_size)
-    encrypted = cipher.encrypt(padded)
+    # PKCS7 패딩 후 AES-CBC 암호화
+    padding_len = 16 - (len(input_data) % 16)
+    padded = input_data + bytes([padding_len] * padding_len)
+    encrypted = get_backend().aes_cbc_encrypt(key_bytes, iv_bytes, padded)
     
     result = base64.b64encode(encrypted).decode('utf-8')
     
@@ -0,0 +1,59 @@
+"""
+테스트 공용 fixture
+==================
+실제 sso.mju.ac.kr / msi.mju.ac.kr 대신 myiweb.standin의 대역 서버에 로그인합니다.
+"""
+
+import pytest
+
+from myiweb.hops import hop_model
+from myiweb.sso import MJUSSOLogin
+from myiweb.standin import StandInProfile, StandInServer, StandInTransport
+
+USERS = {'60201234': 'password1!', '60205678': 'password2@'}
+
+PROFILES = {
+    '60201234': StandInProfile(name_korean='홍길동'),
+    '60205678': StandInProfile(name_korean='김명지', grade='1', department='경영학과'),
+}
+
+
+@pytest.fixture
+def users():
+    """{아이디: 비밀번호}"""
+    return dict(USERS)
+
+
+@pytest.fixture
+def user(users):
+    """(아이디, 비밀번호) - 첫 번째 사용자"""
+    return next(iter(users.items()))
+
+
+@pytest.fixture
+def profiles():
+    return dict(PROFILES)
+
+
+@pytest.fixture
+def server():
+    # 1024비트 키: 서버 시작 시간 단축 (로그인 프로토콜은 2048비트와 동일)
+    with StandInServer(users=USERS, profiles=PROFILES, key_bits=1024, seed=0) as server:
+        yield server
+
+
+@pytest.fixture
+def transport(server):
+    transport = StandInTransport(server)
+    yield transport
+    transport.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_hop_models():
+    """이동 경로 모델은 프로세스 전역이므로 테스트마다 학습 상태를 비움"""
+    for service in MJUSSOLogin.SERVICES:
+        hop_model(service).reset()
+    yield
+    for service in MJUSSOLogin.SERVICES:
+        hop_model(service).reset()
@@ -0,0 +1,95 @@
+"""AsyncMJUSSOLogin - 대역 서버(myiweb.standin)에 대한 비동기 로그인"""
+
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip('httpx')
+
+from myiweb.aio_sso import AsyncMJUSSOLogin
+from myiweb.csrf import CSRFTokenCache
+from myiweb.exceptions import InvalidCredentialsError
+from myiweb.sso import MJUSSOLogin
+from myiweb.student_card import _StudentCardFetcher
+from myiweb.student_changelog import _StudentChangeLogFetcher
+
+
+def _login(server, user_id: str, user_pw: str) -> AsyncMJUSSOLogin:
+    client = httpx.AsyncClient(transport=server.async_transport(), headers=AsyncMJUSSOLogin.DEFAULT_HEADERS,
+                               follow_redirects=True, timeout=15)
+    return AsyncMJUSSOLogin(user_id, user_pw, verbose=False, client=client)
+
+
+async def _login_and_close(server, user_id: str, user_pw: str, service: str = 'msi') -> AsyncMJUSSOLogin:
+    sso = _login(server, user_id, user_pw)
+    try:
+        await sso.login(service)
+    finally:
+        await sso.client.aclose()
+    return sso
+
+
+def test_concurrent_logins(server, users):
+    async def main():
+        logins = list(users.items()) * 4
+        return await asyncio.gather(*(_login_and_close(server, user_id, user_pw) for user_id, user_pw in logins))
+
+    results = asyncio.run(main())
+
+    stats = server.stats()
+    assert stats['logins'] == len(results)
+    assert stats['login_failures'] == 0
+    # 모든 로그인이 onLoad 폼 → location.href를 거쳐 MSI 홈에 도착
+    assert stats['routes']['home'] == len(results)
+    for sso in results:
+        assert sso.hop_trace.records[-1].url == MJUSSOLogin.SERVICES['msi']['test_url']
+        assert sso.hop_trace.records[-1].status == 200
+
+
+def test_concurrent_logins_to_several_services(server, user):
+    async def main():
+        user_id, user_pw = user
+        services = ['msi', 'lms', 'portal', 'library', 'myicap']
+        return await asyncio.gather(*(_login_and_close(server, user_id, user_pw, s) for s in services))
+
+    results = asyncio.run(main())
+
+    assert server.stats()['logins'] == len(results)
+
+
+def test_invalid_password(server, user):
+    user_id, _ = user
+
+    with pytest.raises(InvalidCredentialsError):
+        asyncio.run(_login_and_close(server, user_id, 'wrong-password'))
+
+    assert server.stats()['login_failures'] == 1
+
+
+def test_to_requests_session_fetch(server, transport, user, profiles):
+    async def main():
+        async with _login(server, user_id, user_pw) as sso:
+            await sso.login('msi')
+            return sso.to_requests_session(transport)
+
+    user_id, user_pw = user
+    session = asyncio.run(main())
+    cache = CSRFTokenCache()
+
+    card = _StudentCardFetcher(session, user_pw, verbose=False, csrf_cache=cache).fetch()
+    change_log = _StudentChangeLogFetcher(session, user_pw, verbose=False, csrf_cache=cache).fetch()
+
+    assert card.student_id == user_id
+    assert card.name_korean == profiles[user_id].name_korean
+    assert change_log.student_id == user_id
+    assert server.stats()['second_auth'] == 1
+
+
+def test_sync_session_api_is_not_exposed(server, user):
+    sso = _login(server, *user)
+    try:
+        assert not isinstance(sso, MJUSSOLogin)
+        for name in ('check_alive', 'save_session', 'restore_session', 'login_many', 'session'):
+            assert not hasattr(sso, name)
+    finally:
+        asyncio.run(sso.aclose())
@@ -0,0 +1,39 @@
+"""myiweb.bench.run_load - 대역 서버 대상 부하 테스트"""
+
+import pytest
+
+from myiweb.bench import format_report, run_load
+
+
+def _run(**kwargs) -> dict:
+    return run_load(users=4, duration=3.0, ramp=0.5, think_time=0.0, seed=7, **kwargs)
+
+
+def test_run_load_without_errors():
+    report = _run()
+
+    assert report['iterations'] > 0
+    assert report['failures'] == 0
+    assert report['error_rate'] == 0.0
+    assert report['errors'] == {}
+    assert report['server']['logins'] == report['iterations']
+    assert 'load.iteration' in report['stages']
+    assert 'error rate' in format_report(report)
+
+
+def test_run_load_error_rate_tracks_injected_rate():
+    report = _run(error_rate=0.05)
+
+    assert report['server']['injected_errors'] > 0
+    # 주입된 오류 하나는 많아야 반복 하나를 실패시킴 (재시도로 복구되면 실패 없음)
+    assert report['failures'] <= report['server']['injected_errors']
+    assert report['error_rate'] == pytest.approx(report['expected_error_rate'], abs=0.15)
+    # 오류가 이후 로그인의 세션까지 망가뜨리면 조회에서 SessionExpiredError가 쏟아짐
+    assert not any(error.endswith('SessionExpiredError') for error in report['errors'])
+
+
+def test_run_load_rejects_bad_config():
+    with pytest.raises(ValueError):
+        run_load(users=0)
+    with pytest.raises(ValueError):
+        run_load(duration=1.0, ramp=2.0)
@@ -0,0 +1,60 @@
+"""MSIClient - 로그인 1회로 학생카드·학적변동내역 조회"""
+
+import threading
+
+from myiweb.client import MSIClient
+from myiweb.csrf import CSRFTokenCache
+from myiweb.student_card import StudentCard
+from myiweb.student_changelog import StudentChangeLog
+
+
+def test_fetch_all(server, transport, user, profiles):
+    with MSIClient(*user, csrf_cache=CSRFTokenCache(), transport=transport) as client:
+        results = client.fetch_all()
+
+    assert list(results) == ['student_card', 'change_log']
+    assert isinstance(results['student_card'], StudentCard)
+    assert isinstance(results['change_log'], StudentChangeLog)
+    assert results['student_card'].student_id == user[0]
+    assert results['student_card'].name_korean == profiles[user[0]].name_korean
+
+    stats = server.stats()
+    assert stats['logins'] == 1
+    assert stats['second_auth'] == 1
+    assert stats['csrf_rejected'] == 0
+
+
+def test_fetch_all_matches_single_fetches(server, transport, user):
+    with MSIClient(*user, csrf_cache=CSRFTokenCache(), transport=transport) as client:
+        card = client.student_card()
+        change_log = client.change_log()
+        results = client.fetch_all()
+
+    assert results['student_card'].to_dict() == card.to_dict()
+    assert results['change_log'].to_dict() == change_log.to_dict()
+    assert server.stats()['logins'] == 1
+
+
+def test_fetch_all_sends_lookups_concurrently(server, transport, user, monkeypatch):
+    # 두 조회 POST가 모두 서버에 도착해야 응답 (순서대로 보내면 시간 초과로 실패)
+    barrier = threading.Barrier(2, timeout=5)
+    enter_route = server._enter_route
+
+    def enter_route_together(route):
+        if route in ('student_card', 'change_log'):
+            barrier.wait()
+        return enter_route(route)
+
+    monkeypatch.setattr(server, '_enter_route', enter_route_together)
+    with MSIClient(*user, csrf_cache=CSRFTokenCache(), transport=transport) as client:
+        results = client.fetch_all()
+
+    assert results['student_card'].student_id == user[0]
+    assert isinstance(results['change_log'], StudentChangeLog)
+
+    stats = server.stats()
+    assert stats['logins'] == 1
+    assert stats['second_auth'] == 1
+    assert stats['routes']['verify_pw'] == 1
+    assert stats['routes']['student_card'] == 1
+    assert stats['routes']['change_log'] == 1
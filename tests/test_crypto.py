@@ -0,0 +1,133 @@
+"""myiweb.crypto - 공개키 캐시와 세션키 풀"""
+
+import time
+
+import pytest
+
+from myiweb import crypto, crypto_backends
+from myiweb.crypto import PublicKeyCache, SessionKeyPool, load_public_key, public_key_cache
+from myiweb.crypto_backends import _CALIBRATION_PUBLIC_KEY as PUBLIC_KEY
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+@pytest.fixture
+def restore_backend():
+    """테스트가 바꾼 전역 백엔드와 공개키 캐시를 되돌림"""
+    selected = crypto_backends._selected
+    public_key_cache.invalidate()
+    yield
+    crypto_backends._selected = selected
+    public_key_cache.invalidate()
+
+
+def test_backend_switch_counts_as_miss(restore_backend):
+    crypto_backends.set_backend('cryptography')
+    first = load_public_key(PUBLIC_KEY)
+    assert load_public_key(PUBLIC_KEY) is first
+    before = public_key_cache.stats()
+
+    # 다른 백엔드의 키 객체는 쓸 수 없으므로 적중으로 세지 않고 다시 로드
+    crypto_backends.set_backend('pycryptodome')
+    reloaded = load_public_key(PUBLIC_KEY)
+    after = public_key_cache.stats()
+
+    assert reloaded is not first
+    assert after['hits'] == before['hits']
+    assert after['misses'] == before['misses'] + 1
+    assert load_public_key(PUBLIC_KEY) is reloaded
+    assert public_key_cache.stats()['hits'] == before['hits'] + 1
+
+
+def test_public_key_cache_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('myiweb.crypto.time.monotonic', lambda: now[0])
+    cache = PublicKeyCache(maxsize=4, ttl=10.0)
+    cache.put('key', 'obj')
+
+    now[0] += 5.0
+    assert cache.get('key') == 'obj'
+    now[0] += 6.0
+    assert cache.get('key') is None
+    assert cache.stats() == {'size': 0, 'maxsize': 4, 'hits': 1, 'misses': 1, 'evictions': 1}
+
+
+def test_public_key_cache_evicts_least_recently_used():
+    cache = PublicKeyCache(maxsize=2, ttl=None)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1   # a가 최근 사용으로 이동
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats()['evictions'] == 1
+
+
+def test_public_key_cache_invalidate():
+    cache = PublicKeyCache(ttl=None)
+    cache.put('a', 1)
+    cache.put('b', 2)
+
+    cache.invalidate('a')
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+
+    cache.invalidate()
+    assert cache.stats()['size'] == 0
+
+
+def test_session_key_pool_refills_below_low_watermark():
+    with SessionKeyPool(low_watermark=2, high_watermark=4) as pool:
+        assert _wait_until(lambda: len(pool) == 4)
+
+        keys = [pool.get() for _ in range(3)]
+        # 꺼낸 키는 풀에서 제거되므로 중복 없음
+        assert len({key['keyStr'] for key in keys}) == 3
+        assert all(len(key['key']) == 32 and key['iv'] == key['key'][-16:] for key in keys)
+
+        assert _wait_until(lambda: len(pool) == 4)
+        stats = pool.stats()
+        assert stats['hits'] == 3
+        assert stats['misses'] == 0
+
+
+def test_session_key_pool_get_without_thread_generates_synchronously():
+    pool = SessionKeyPool(start=False)
+    key = pool.get()
+
+    assert len(key['key']) == 32
+    assert pool.stats()['misses'] == 1
+    pool.close()
+
+
+def test_session_key_pool_survives_fill_error(monkeypatch):
+    generate = crypto.generate_session_key
+    calls = []
+
+    def failing_once(length: int = 32) -> dict:
+        calls.append(length)
+        if len(calls) == 1:
+            raise RuntimeError("backend error")
+        return generate(length)
+
+    monkeypatch.setattr(crypto, 'generate_session_key', failing_once)
+    with SessionKeyPool(low_watermark=1, high_watermark=3) as pool:
+        assert _wait_until(lambda: pool.stats()['fill_errors'] == 1)
+        assert len(pool) == 0
+
+        # 풀이 비었으므로 동기 생성, 깨어난 보충 스레드가 다시 채움
+        assert pool.get()['key']
+        assert _wait_until(lambda: len(pool) == 3)
+        stats = pool.stats()
+
+    assert stats['misses'] == 1
+    assert stats['last_fill_error'] == "RuntimeError('backend error')"
@@ -0,0 +1,74 @@
+"""myiweb.crypto_backends - 연산별 측정, 자동 선택, 환경변수로 강제"""
+
+import pytest
+
+from myiweb import crypto_backends
+from myiweb.crypto_backends import AES, KDF, RSA, calibrate, get_backend, select_backend
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    """테스트가 바꾼 전역 백엔드를 되돌림"""
+    selected = crypto_backends._selected
+    yield
+    crypto_backends._selected = selected
+
+
+def _backends():
+    return [crypto_backends.BACKENDS[name]() for name in ('cryptography', 'pycryptodome', 'hashlib')]
+
+
+def test_calibrate_times_each_supported_op():
+    timings = calibrate(_backends())
+
+    assert set(timings[KDF]) == {'cryptography', 'pycryptodome', 'hashlib'}
+    # hashlib은 KDF 전용
+    assert set(timings[RSA]) == {'cryptography', 'pycryptodome'}
+    assert set(timings[AES]) == {'cryptography', 'pycryptodome'}
+    assert all(t > 0 for op in timings.values() for t in op.values())
+
+
+def test_select_backend_picks_fastest_per_op(monkeypatch):
+    timings = {
+        KDF: {'cryptography': 3.0, 'pycryptodome': 2.0, 'hashlib': 1.0},
+        RSA: {'cryptography': 1.0, 'pycryptodome': 2.0},
+        AES: {'cryptography': 2.0, 'pycryptodome': 1.0},
+    }
+    monkeypatch.setattr(crypto_backends, 'calibrate', lambda backends: timings)
+    selected = select_backend(_backends())
+
+    assert (selected.kdf.name, selected.rsa.name, selected.aes.name) == ('hashlib', 'cryptography', 'pycryptodome')
+
+
+def test_select_backend_requires_every_op():
+    with pytest.raises(ImportError):
+        select_backend([crypto_backends.HashlibBackend()])
+
+
+def test_env_override(monkeypatch):
+    monkeypatch.setenv('MYIWEB_CRYPTO_BACKEND', 'pycryptodome')
+    monkeypatch.setattr(crypto_backends, 'select_backend', pytest.fail)
+    crypto_backends._selected = None
+    backend = get_backend()
+
+    assert (backend.kdf.name, backend.rsa.name, backend.aes.name) == ('pycryptodome',) * 3
+    assert get_backend() is backend
+
+
+def test_env_override_partial_backend_fills_other_ops(monkeypatch):
+    monkeypatch.setenv('MYIWEB_CRYPTO_BACKEND', 'hashlib')
+    crypto_backends._selected = None
+    backend = get_backend()
+
+    assert backend.kdf.name == 'hashlib'
+    assert backend.rsa.name in ('cryptography', 'pycryptodome')
+    assert backend.aes.name in ('cryptography', 'pycryptodome')
+    # 선택된 조합으로 세 연산 모두 동작
+    assert len(backend.pbkdf2_sha1(b'pw', b'salt', 1000, 32)) == 32
+
+
+def test_env_override_rejects_unknown_backend(monkeypatch):
+    monkeypatch.setenv('MYIWEB_CRYPTO_BACKEND', 'openssl-cli')
+    crypto_backends._selected = None
+    with pytest.raises(ValueError):
+        get_backend()
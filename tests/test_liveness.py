@@ -0,0 +1,70 @@
+"""myiweb.liveness - 헤더만 받는 세션 생존 확인과 유효 판정 캐시"""
+
+import threading
+
+from myiweb.liveness import LivenessCache, check_stored_sessions
+from myiweb.session_store import MemorySessionStore
+from myiweb.sso import MJUSSOLogin
+
+
+def test_check_stored_sessions_restores_in_workers(server, transport, users, monkeypatch):
+    store = MemorySessionStore()
+    for user_id, user_pw in users.items():
+        sso = MJUSSOLogin(user_id, user_pw, verbose=False, transport=transport)
+        sso.login('msi')
+        sso.save_session(store, 'msi')
+
+    restore = MJUSSOLogin.restore_session
+    threads = []
+
+    def recording_restore(sso, *args, **kwargs):
+        threads.append(threading.current_thread().name)
+        return restore(sso, *args, **kwargs)
+
+    monkeypatch.setattr(MJUSSOLogin, 'restore_session', recording_restore)
+    credentials = list(users.items()) + [('60209999', 'unknown')]
+    result = check_stored_sessions(store, credentials, cache=LivenessCache(), transport=transport)
+
+    assert result == {**{user_id: True for user_id in users}, '60209999': False}
+    # 복원(키 파생 + 복호화)도 헤더 확인과 같은 작업 스레드에서 수행
+    assert len(threads) == len(credentials)
+    assert all(name.startswith('liveness') for name in threads)
+
+
+def test_liveness_cache_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('myiweb.liveness.time.monotonic', lambda: now[0])
+    cache = LivenessCache(ttl=60.0)
+    cache.put('key')
+
+    now[0] += 59.0
+    assert cache.get('key')
+    now[0] += 2.0
+    assert not cache.get('key')
+    assert cache.stats() == {'size': 0, 'hits': 1, 'misses': 1}
+
+
+def test_liveness_cache_evicts_least_recently_used():
+    cache = LivenessCache(maxsize=2)
+    cache.put('a')
+    cache.put('b')
+    assert cache.get('a')
+    cache.put('c')
+
+    assert not cache.get('b')
+    assert cache.get('a') and cache.get('c')
+
+
+def test_check_alive_uses_cache(server, transport, user):
+    sso = MJUSSOLogin(*user, verbose=False, transport=transport)
+    sso.login('msi')
+    cache = LivenessCache()
+
+    before = server.stats()['requests']
+    assert sso.check_alive('msi', cache=cache)
+    probed = server.stats()['requests']
+    assert probed > before
+    # 같은 쿠키로 다시 확인하면 요청을 보내지 않음
+    assert sso.check_alive('msi', cache=cache)
+    assert server.stats()['requests'] == probed
+    assert cache.stats()['hits'] == 1
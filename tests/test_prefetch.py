@@ -0,0 +1,74 @@
+"""LoginPagePool - 대역 서버에서 로그인 페이지 사전 요청, 실패 후 재시도 간격"""
+
+import threading
+import time
+
+from myiweb.prefetch import LoginPagePool
+from myiweb.sso import MJUSSOLogin
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_prefetched_page_used_for_login(server, transport, user):
+    with LoginPagePool(services=('msi',), size=2, transport=transport) as pool:
+        assert _wait_until(lambda: len(pool) == 2)
+
+        sso = MJUSSOLogin(*user, verbose=False, transport=transport, page_pool=pool)
+        sso.login('msi')
+
+        assert sso.test_session('msi')
+        assert pool.stats()['hits'] == 1
+        assert pool.stats()['misses'] == 0
+
+
+def test_retry_interval_respected_while_get_is_called(server, transport):
+    server.error_routes = frozenset({'login_page'})
+    server.error_rate = 1.0
+    retry_interval = 0.5
+
+    with LoginPagePool(services=('msi',), size=2, retry_interval=retry_interval, transport=transport) as pool:
+        stop = threading.Event()
+
+        def hammer():
+            while not stop.is_set():
+                assert pool.get('msi') is None
+
+        threads = [threading.Thread(target=hammer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        time.sleep(retry_interval * 2.5)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        stats = pool.stats()
+
+    # get()이 계속 보충을 요청해도 실패 후에는 retry_interval마다 한 번만 다시 요청 (0s, 0.5s, 1.0s)
+    assert server.stats()['routes']['login_page'] <= 3
+    assert stats['errors'] == server.stats()['routes']['login_page']
+    assert stats['hits'] == 0
+    assert stats['misses'] > 100
+
+
+def test_unexpected_error_does_not_stop_refill(server, transport, monkeypatch):
+    fetch = LoginPagePool._fetch
+    calls = []
+
+    def failing_once(pool, service):
+        calls.append(service)
+        if len(calls) == 1:
+            raise RuntimeError("unexpected")
+        return fetch(pool, service)
+
+    monkeypatch.setattr(LoginPagePool, '_fetch', failing_once)
+    with LoginPagePool(services=('msi',), size=2, retry_interval=0.2, transport=transport) as pool:
+        # 예외 후 retry_interval만큼 쉬고 다시 보충
+        assert _wait_until(lambda: len(pool) == 2)
+        assert pool.stats()['errors'] == 1
@@ -0,0 +1,99 @@
+"""myiweb.retry - 멱등 GET 재시도와 헤지 요청"""
+
+import threading
+import time
+
+import pytest
+import requests
+
+from myiweb.retry import RetryPolicy
+from myiweb.sso import MJUSSOLogin
+
+LOGIN_PAGE_URL = MJUSSOLogin.SERVICES['msi']['url']
+
+
+def _session(transport) -> requests.Session:
+    session = requests.Session()
+    transport.mount(session)
+    return session
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def _patch_route(server, monkeypatch, route: str, before):
+    """route 요청마다 before(호출 순번)를 실행하고, True를 반환하면 오류를 주입"""
+    enter_route = server._enter_route
+    calls = []
+    lock = threading.Lock()
+
+    def patched(name):
+        if name != route:
+            return enter_route(name)
+        with lock:
+            calls.append(name)
+            index = len(calls)
+        inject = before(index)
+        return enter_route(name) or inject
+
+    monkeypatch.setattr(server, '_enter_route', patched)
+    return calls
+
+
+@pytest.mark.parametrize('status', [502, 503, 504])
+def test_retries_gateway_errors(server, transport, monkeypatch, status):
+    server.error_status = status
+    calls = _patch_route(server, monkeypatch, 'login_page', lambda index: index == 1)
+    policy = RetryPolicy(attempts=3, backoff=0.01)
+
+    response = policy.get(_session(transport), LOGIN_PAGE_URL, 'login_page', timeout=5)
+
+    assert response.status_code == 200
+    assert len(calls) == 2
+    assert policy.stats()['retries'] == 1
+
+
+def test_returns_last_error_response_and_skips_other_statuses(server, transport, monkeypatch):
+    server.error_status = 503
+    calls = _patch_route(server, monkeypatch, 'login_page', lambda index: True)
+    policy = RetryPolicy(attempts=3, backoff=0.01)
+
+    response = policy.get(_session(transport), LOGIN_PAGE_URL, 'login_page', timeout=5)
+    assert response.status_code == 503
+    assert len(calls) == 3
+
+    # 재시도 대상이 아닌 상태 코드는 그대로 반환
+    server.error_status = 500
+    response = policy.get(_session(transport), LOGIN_PAGE_URL, 'login_page', timeout=5)
+    assert response.status_code == 500
+    assert len(calls) == 4
+
+
+def test_hedge_winner_cookies_are_merged(server, transport, monkeypatch):
+    def slow_first(index: int) -> bool:
+        # 첫 요청만 느리게 응답 - 헤지 요청이 먼저 도착
+        if index == 1:
+            time.sleep(0.5)
+        return False
+
+    calls = _patch_route(server, monkeypatch, 'login_page', slow_first)
+    policy = RetryPolicy(attempts=1, hedge=True, hedge_delay=0.05)
+    session = _session(transport)
+
+    response = policy.get(session, LOGIN_PAGE_URL, 'login_page', timeout=5)
+
+    assert response.status_code == 200
+    assert policy.stats()['hedges'] == 1
+    assert policy.stats()['hedge_wins'] == 1
+    # 채택된 응답이 발급한 SSO 세션 쿠키만 세션에 반영 (로그인 페이지의 c_r_t와 짝)
+    session_id = session.cookies.get('JSESSIONID')
+    assert session_id == response.cookies.get('JSESSIONID')
+    assert session_id.encode() in response.content
+    assert len([c for c in session.cookies if c.name == 'JSESSIONID']) == 1
+    assert _wait_until(lambda: len(calls) == 2)
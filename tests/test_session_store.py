@@ -0,0 +1,69 @@
+"""myiweb.session_store - 암호화된 로그인 세션 저장/복원"""
+
+import os
+import stat
+
+import pytest
+
+from myiweb.session_store import FileSessionStore, MemorySessionStore, SQLiteSessionStore
+from myiweb.sso import MJUSSOLogin
+
+
+@pytest.fixture(params=['memory', 'sqlite', 'file'])
+def store(request, tmp_path):
+    if request.param == 'memory':
+        yield MemorySessionStore()
+    elif request.param == 'sqlite':
+        store = SQLiteSessionStore(str(tmp_path / 'sessions.db'))
+        yield store
+        store.close()
+    else:
+        yield FileSessionStore(str(tmp_path / 'sessions'))
+
+
+def _login(transport, user) -> MJUSSOLogin:
+    sso = MJUSSOLogin(*user, verbose=False, transport=transport)
+    sso.login('msi')
+    return sso
+
+
+def test_round_trip_restores_logged_in_session(server, transport, user, store):
+    _login(transport, user).save_session(store, 'msi')
+
+    restored = MJUSSOLogin(*user, verbose=False, transport=transport)
+    assert restored.restore_session(store, 'msi')
+    assert restored.test_session('msi')
+    assert server.stats()['logins'] == 1
+
+    cookie = next(c for c in restored.session.cookies if c.name == 'JSESSIONID')
+    assert cookie.has_nonstandard_attr('HttpOnly')
+
+
+def test_wrong_password_is_rejected_and_entry_removed(server, transport, user, store):
+    _login(transport, user).save_session(store, 'msi')
+
+    assert store.load(user[0], 'wrong-password', 'msi') is None
+    # 쓸 수 없는 항목은 삭제되므로 올바른 비밀번호로도 다시 로그인해야 함
+    assert store.load(user[0], user[1], 'msi') is None
+
+
+def test_entries_are_per_service(server, transport, user, store):
+    _login(transport, user).save_session(store, 'msi')
+
+    assert store.load(user[0], user[1], 'lms') is None
+    assert store.load(user[0], user[1], 'msi') is not None
+
+
+def test_file_store_writes_owner_only_files(server, transport, user, tmp_path):
+    directory = tmp_path / 'sessions'
+    store = FileSessionStore(str(directory))
+    _login(transport, user).save_session(store, 'msi')
+
+    files = [name for name in os.listdir(directory) if name.endswith('.session')]
+    assert len(files) == 1
+    # 파일 이름과 내용에 평문 학번이 남지 않음
+    assert user[0] not in files[0]
+    path = directory / files[0]
+    assert user[0].encode() not in path.read_bytes()
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
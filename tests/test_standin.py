@@ -0,0 +1,177 @@
+"""StandInServer / StandInTransport - 대역 서버에 대한 로그인, 조회, 오류 주입"""
+
+import pytest
+
+from myiweb.abc import BaseFetcher
+from myiweb.csrf import CSRFTokenCache
+from myiweb.exceptions import InvalidCredentialsError, MyIWebError, NetworkError
+from myiweb.hops import Hop, HopModel, hop_model
+from myiweb.sso import MJUSSOLogin
+from myiweb.standin import StandInServer
+from myiweb.student_card import _StudentCardFetcher
+from myiweb.student_changelog import _StudentChangeLogFetcher
+
+
+def _login(transport, user, service: str = 'msi') -> MJUSSOLogin:
+    sso = MJUSSOLogin(*user, verbose=False, transport=transport, csrf_cache=CSRFTokenCache())
+    sso.login(service)
+    return sso
+
+
+def test_login_success(server, transport, user):
+    sso = _login(transport, user)
+
+    stats = server.stats()
+    assert stats['logins'] == 1
+    assert stats['routes']['login_security'] == 1
+    assert stats['routes']['home'] == 1
+    assert sso.test_session('msi')
+
+
+@pytest.mark.parametrize('service', ['lms', 'portal', 'library', 'myicap'])
+def test_login_other_services(server, transport, user, service):
+    sso = _login(transport, user, service)
+
+    assert server.stats()['logins'] == 1
+    assert sso.test_session(service)
+
+
+def test_wrong_password(server, transport, user):
+    sso = MJUSSOLogin(user[0], 'wrong-password', verbose=False, transport=transport)
+
+    with pytest.raises(InvalidCredentialsError):
+        sso.login('msi')
+
+    assert server.stats()['logins'] == 0
+    assert server.stats()['login_failures'] == 1
+    assert not sso.test_session('msi')
+
+
+def test_student_card_fetch(server, transport, user, profiles):
+    sso = _login(transport, user)
+
+    card = _StudentCardFetcher(sso.session, user[1], verbose=False, csrf_cache=sso.csrf_cache).fetch()
+
+    profile = profiles[user[0]]
+    assert card.student_id == user[0]
+    assert card.name_korean == profile.name_korean
+    assert card.department == profile.department
+    assert card.email == profile.email
+    assert card.photo_base64
+    assert server.stats()['second_auth'] == 1
+
+
+def test_change_log_fetch(server, transport, users, profiles):
+    user_id, user_pw = list(users.items())[1]
+    sso = _login(transport, (user_id, user_pw))
+
+    change_log = _StudentChangeLogFetcher(sso.session, user_pw, verbose=False, csrf_cache=sso.csrf_cache).fetch()
+
+    profile = profiles[user_id]
+    assert change_log.student_id == user_id
+    assert change_log.name == profile.name_korean
+    assert change_log.grade == profile.grade
+    assert change_log.department == profile.department
+
+
+def test_csrf_token_is_checked(server, transport, user):
+    sso = _login(transport, user)
+    cache = sso.csrf_cache
+    cache.put(sso.session, 'stale-token')
+
+    # 거부된 토큰은 버리고 MySecurityStart에서 새로 받아 한 번 더 요청
+    change_log = _StudentChangeLogFetcher(sso.session, user[1], verbose=False, csrf_cache=cache).fetch()
+
+    assert change_log.student_id == user[0]
+    assert server.stats()['csrf_rejected'] == 1
+    assert cache.get(sso.session) != 'stale-token'
+
+
+def test_error_rate_must_be_a_fraction():
+    with pytest.raises(ValueError):
+        StandInServer(error_rate=1.5, key_bits=1024)
+
+
+def test_error_routes_limit_injection(server, transport, user):
+    sso = _login(transport, user)
+    server.error_rate = 1.0
+    server.error_routes = frozenset(['security_start'])
+
+    response = sso.session.get(BaseFetcher.MSI_HOME_URL, timeout=5)
+    home = sso.session.get(MJUSSOLogin.SERVICES['msi']['test_url'], timeout=5)
+
+    assert response.status_code == server.error_status == 503
+    assert home.status_code == 200
+    assert server.stats()['injected_errors'] == 1
+
+
+def test_error_rate_is_applied_per_request(server, transport, user):
+    sso = _login(transport, user)
+    server.error_rate = 0.5
+    server.error_routes = frozenset(['home'])
+    url = MJUSSOLogin.SERVICES['msi']['test_url']
+
+    statuses = [sso.session.get(url, timeout=5).status_code for _ in range(200)]
+
+    injected = server.stats()['injected_errors']
+    assert statuses.count(503) == injected
+    assert 60 <= injected <= 140
+
+
+def test_dropped_connection_is_a_network_error(server, transport, user):
+    server.error_rate = 1.0
+    server.error_status = 0
+    server.error_routes = frozenset(['signin'])
+
+    with pytest.raises(NetworkError):
+        _login(transport, user)
+
+
+@pytest.mark.parametrize('route', ['code', 'login_security'])
+def test_errors_do_not_poison_hop_model(server, transport, user, route):
+    server.error_rate = 1.0
+    server.error_routes = frozenset([route])
+    for _ in range(3):
+        # 서비스 도메인의 오류 페이지에서 끝난 로그인은 실패이며 이동 경로 학습에 쓰이지 않음
+        with pytest.raises(NetworkError):
+            _login(transport, user)
+    assert hop_model('msi').plan is None
+
+    server.error_rate = 0.0
+    sso = _login(transport, user)
+    card = _StudentCardFetcher(sso.session, user[1], verbose=False, csrf_cache=sso.csrf_cache).fetch()
+
+    assert card.student_id == user[0]
+
+
+def test_learned_plan_survives_errors(server, transport, user):
+    for _ in range(2):
+        _login(transport, user)
+    plan = hop_model('msi').plan
+    assert plan is not None and len(plan) == 2
+
+    server.error_rate = 1.0
+    server.error_routes = frozenset(['login_security'])
+    with pytest.raises(MyIWebError):
+        _login(transport, user)
+    assert hop_model('msi').plan == plan
+
+    server.error_rate = 0.0
+    sso = _login(transport, user)
+    assert sso.hop_trace.learned
+    assert sso.test_session('msi')
+
+
+def test_hop_model_relearns_shorter_chain():
+    model = HopModel('msi')
+    form = Hop('form', 'https://msi.mju.ac.kr/servlet/login_security', {'code': 'a'})
+    redirect = Hop('redirect', 'https://msi.mju.ac.kr/index_Myiweb.jsp')
+    for _ in range(2):
+        model.observe([form, redirect])
+    assert model.plan == (form.signature, redirect.signature)
+
+    # 서버가 JS 이동 하나를 없앰 - 짧아진 경로로 도착한 로그인에서 다시 학습
+    model.observe([form])
+    assert model.plan is None
+    model.observe([form])
+    assert model.plan == (form.signature,)